@@ -0,0 +1,160 @@
+"""Synthetic configurations for benchmarks."""
+
+from typing import Any, Dict, Optional, Tuple
+
+from dictator.validators.dependency import DeferValidation, KeyDependency
+from dictator.validators.integer import ValidateIntRange
+from dictator.validators.lists import HomogeneousValidator, SubListValidator
+from dictator.validators.maps import SubDictValidator
+from dictator.validators.replace import AutoFragmentReplace
+from dictator.validators.util import ValidateUnion
+
+Workload = Tuple[Dict[str, Any], Dict[str, Any], Optional[Dict[str, Any]]]
+
+# cycle of value types used for flat configurations
+_TYPES = (int, str, float, bool)
+_VALUES = {int: 42, str: "value", float: 4.2, bool: True}
+
+
+def make_flat(width: int) -> Workload:
+    """Generate a flat configuration.
+
+    Parameters
+    ----------
+    width
+        Number of keys
+    """
+    required = {}
+    config = {}
+    for index in range(width):
+        _type = _TYPES[index % len(_TYPES)]
+        required[f"key{index}"] = _type
+        config[f"key{index}"] = _VALUES[_type]
+    return config, required, None
+
+
+def make_nested(width: int, depth: int) -> Workload:
+    """Generate nested configurations using SubDictValidator.
+
+    Parameters
+    ----------
+    width
+        Number of keys at each level
+    depth
+        Nesting levels below the top-level configuration
+    """
+    config, required, _ = make_flat(width)
+    for _ in range(depth):
+        sub_config, sub_required, _ = make_flat(width)
+        sub_config["sub"] = config
+        sub_required["sub"] = SubDictValidator(required)
+        config, required = sub_config, sub_required
+    return config, required, None
+
+
+def make_list(width: int, length: int) -> Workload:
+    """Generate a list of configurations using SubListValidator.
+
+    Parameters
+    ----------
+    width
+        Number of keys in each element
+    length
+        Number of elements
+    """
+    element, element_required, _ = make_flat(width)
+    config = {"entries": [dict(element) for _ in range(length)]}
+    required = {"entries": SubListValidator(element_required, None, {})}
+    return config, required, None
+
+
+def make_homogeneous(length: int) -> Workload:
+    """Generate a list of integers using HomogeneousValidator.
+
+    Parameters
+    ----------
+    length
+        Number of elements
+    """
+    config = {"values": list(range(length))}
+    required = {"values": HomogeneousValidator(ValidateIntRange(0, length))}
+    return config, required, None
+
+
+def make_union(width: int) -> Workload:
+    """Generate a configuration of ValidateUnion keys.
+
+    Parameters
+    ----------
+    width
+        Number of keys
+    """
+    validator = ValidateUnion(None, str, int, float)
+    values = (None, "value", 42, 4.2)
+    required = {f"key{index}": validator for index in range(width)}
+    config = {
+        f"key{index}": values[index % len(values)] for index in range(width)
+    }
+    return config, required, None
+
+
+def make_fragments(width: int) -> Workload:
+    """Generate a configuration of AutoFragmentReplace keys.
+
+    Parameters
+    ----------
+    width
+        Number of keys with templates
+    """
+    validator = AutoFragmentReplace()
+    required = {"base": str, "port": int}
+    config = {"base": "value", "port": 42}
+    for index in range(width):
+        required[f"key{index}"] = validator
+        config[f"key{index}"] = f"${{base}}_{index}:${{port}}"
+    return config, required, None
+
+
+def make_dependencies(width: int) -> Workload:
+    """Generate a chain of KeyDependency keys.
+
+    Keys appear in reverse dependency order, so every key must be scheduled
+    after the ones following it.
+
+    Parameters
+    ----------
+    width
+        Length of the dependency chain
+    """
+    required = {"key0": int}
+    for index in range(1, width):
+        required[f"key{index}"] = KeyDependency(f"key{index - 1}")
+    config = {f"key{index}": index for index in reversed(range(width))}
+    return config, required, None
+
+
+def make_deferral(width: int) -> Workload:
+    """Generate a chain of keys that defer validation.
+
+    Unlike make_dependencies, dependencies are not declared, so ordering is
+    found by retrying deferred keys.
+
+    Parameters
+    ----------
+    width
+        Length of the dependency chain
+    """
+
+    def _make_validator(dependency):
+        def _validate(_value, **kwargs):
+            if dependency not in kwargs:
+                raise DeferValidation(dependency)
+            return _value
+
+        return _validate
+
+    required = {"key0": int}
+    for index in range(1, width):
+        required[f"key{index}"] = _make_validator(f"key{index - 1}")
+    config = {f"key{index}": index for index in reversed(range(width))}
+    return config, required, None
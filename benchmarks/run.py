@@ -0,0 +1,227 @@
+"""Run benchmarks.
+
+Usage: python -m benchmarks.run [--json results.json] [--compare base.json]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, Optional
+
+from dictator.cache import ValidationCache
+from dictator.codegen import generate_validator
+from dictator.config import validate_config
+from dictator.schema import compile_schema
+from benchmarks.generate import (
+    Workload,
+    make_deferral,
+    make_dependencies,
+    make_flat,
+    make_fragments,
+    make_homogeneous,
+    make_list,
+    make_nested,
+    make_union,
+)
+
+
+def _validate_config_fn(workload: Workload) -> Callable[[], Any]:
+    """Get function validating a workload with validate_config."""
+    config, required, optional = workload
+    return lambda: validate_config(config, required, optional)
+
+
+def _compiled_fn(workload: Workload) -> Callable[[], Any]:
+    """Get function validating a workload with a compiled schema."""
+    config, required, optional = workload
+    validate_fn = compile_schema(required, optional).validate
+    return lambda: validate_fn(config)
+
+
+def _cached_fn(workload: Workload) -> Callable[[], Any]:
+    """Get function validating a workload with a warm cache."""
+    config, required, optional = workload
+    cache = ValidationCache()
+    validate_config(config, required, optional, cache=cache)
+    return lambda: validate_config(config, required, optional, cache=cache)
+
+
+def _generated_fn(workload: Workload) -> Callable[[], Any]:
+    """Get function validating a workload with generated code."""
+    config, required, optional = workload
+    validate_fn = generate_validator(compile_schema(required, optional))
+    return lambda: validate_fn(config)
+
+
+# benchmark name -> function building the callable to time from parameters
+BENCHMARKS = {
+    "validate_config": lambda args: _validate_config_fn(
+        make_flat(args.width)
+    ),
+    "compiled_schema": lambda args: _compiled_fn(make_flat(args.width)),
+    "generated": lambda args: _generated_fn(make_flat(args.width)),
+    "sub_dict": lambda args: _validate_config_fn(
+        make_nested(args.width, args.depth)
+    ),
+    "sub_dict_cached": lambda args: _cached_fn(
+        make_nested(args.width, args.depth)
+    ),
+    "sub_list": lambda args: _validate_config_fn(
+        make_list(args.width, args.length)
+    ),
+    "homogeneous": lambda args: _validate_config_fn(
+        make_homogeneous(args.length)
+    ),
+    "union": lambda args: _validate_config_fn(make_union(args.width)),
+    "fragments": lambda args: _validate_config_fn(
+        make_fragments(args.width)
+    ),
+    "dependencies": lambda args: _validate_config_fn(
+        make_dependencies(args.width)
+    ),
+    "deferral": lambda args: _validate_config_fn(make_deferral(args.width)),
+}
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """Measure throughput and peak memory of a function.
+
+    Parameters
+    ----------
+    fn
+        Function to measure
+    repeat
+        Number of timing rounds; the best round is reported
+    """
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    times = [total / number for total in timer.repeat(repeat, number)]
+    best = min(times)
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "ops_per_sec": 1.0 / best,
+        "best_sec": best,
+        "mean_sec": sum(times) / len(times),
+        "peak_memory_bytes": peak,
+    }
+
+
+def compare(
+    results: Dict[str, Any], baseline: Dict[str, Any], threshold: float
+) -> bool:
+    """Compare results with a baseline, printing a report.
+
+    Parameters
+    ----------
+    results
+        Current results
+    baseline
+        Results loaded from a previous run
+    threshold
+        Relative throughput loss considered a regression
+
+    Returns whether no regressions were found.
+    """
+    success = True
+    print(f"\n{'benchmark':<20}{'baseline':>14}{'current':>14}{'ratio':>8}")
+    for name, result in results["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        ratio = result["ops_per_sec"] / base["ops_per_sec"]
+        flag = ""
+        if ratio < 1.0 - threshold:
+            flag = "  REGRESSION"
+            success = False
+        print(
+            f"{name:<20}{base['ops_per_sec']:>14.1f}"
+            f"{result['ops_per_sec']:>14.1f}{ratio:>8.2f}{flag}"
+        )
+
+    return success
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Run benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description="dictator benchmarks")
+    parser.add_argument(
+        "benchmarks",
+        nargs="*",
+        help="benchmarks to run, all if omitted: " + ", ".join(BENCHMARKS),
+    )
+    parser.add_argument(
+        "--width", type=int, default=20, help="keys per level"
+    )
+    parser.add_argument(
+        "--depth", type=int, default=5, help="nesting levels"
+    )
+    parser.add_argument(
+        "--length", type=int, default=1000, help="list elements"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="timing rounds"
+    )
+    parser.add_argument("--json", help="write results to a JSON file")
+    parser.add_argument("--compare", help="compare with a JSON results file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative throughput loss considered a regression",
+    )
+    args = parser.parse_args(argv)
+    for name in args.benchmarks:
+        if name not in BENCHMARKS:
+            parser.error(f"unknown benchmark: '{name}'")
+
+    results = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "parameters": {
+            "width": args.width,
+            "depth": args.depth,
+            "length": args.length,
+            "repeat": args.repeat,
+        },
+        "results": {},
+    }
+    print(
+        f"{'benchmark':<20}{'ops/sec':>14}{'best (us)':>14}"
+        f"{'peak (KiB)':>12}"
+    )
+    for name in args.benchmarks or BENCHMARKS:
+        result = measure(BENCHMARKS[name](args), args.repeat)
+        results["results"][name] = result
+        print(
+            f"{name:<20}{result['ops_per_sec']:>14.1f}"
+            f"{result['best_sec'] * 1e6:>14.1f}"
+            f"{result['peak_memory_bytes'] / 1024:>12.1f}"
+        )
+
+    if args.json is not None:
+        with open(args.json, "w") as results_file:
+            json.dump(results, results_file, indent=2)
+
+    if args.compare is not None:
+        with open(args.compare, "r") as baseline_file:
+            baseline = json.load(baseline_file)
+        if baseline.get("parameters") != results["parameters"]:
+            print("warning: baseline was generated with other parameters")
+        if not compare(results, baseline, args.threshold):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+"""Asynchronous validation."""
+
+import asyncio
+import inspect
+from collections import deque
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from dictator.config import (
+    ConfigurationType,
+    LogFunction,
+    ValidatorConfiguration,
+    _check_config,
+    _collect_entries,
+    _log_unknown,
+    _resolve_validator,
+    _schedule_keys,
+    _track_unknown,
+)
+from dictator.context import UnknownKeys, ValidationContext
+from dictator.errors import MissingDependencyError, ValidationError
+from dictator.validators.dependency import DeferValidation
+
+Entry = Tuple[str, Any, Callable, bool]
+
+
+async def async_validate_config(
+    config: ConfigurationType,
+    required_keys: Optional[ValidatorConfiguration] = None,
+    optional_keys: Optional[ValidatorConfiguration] = None,
+    verbosity: str = "error",
+    log_fn: Optional[LogFunction] = None,
+    allow_unknown: bool = True,
+    gobble_unknown: bool = True,
+    inherit_options: bool = False,
+    pop_extra_kwargs: bool = False,
+    parent_keys: Optional[Dict[str, Any]] = None,
+    summarize_unknown: bool = False,
+    max_concurrency: Optional[int] = None,
+    **extra_kwargs: Dict[str, Any],
+):
+    """Validate configuration, awaiting coroutine validators concurrently.
+
+    Validators may be coroutine functions, or validators whose validate
+    method is a coroutine function; synchronous validators are called
+    directly. Keys are validated concurrently, except that keys wait for
+    their declared dependencies, and keys deferring validation are retried
+    once the keys they depend on are validated. Validated keys appear in the
+    result in scheduling order, regardless of the order in which coroutines
+    complete. Only validators of top-level keys may be coroutines:
+    sub-validators, such as SubDictValidator, validate synchronously, and
+    raise ValidationError if a nested validator returns an awaitable.
+
+    Parameters
+    ----------
+    max_concurrency
+        Maximum number of coroutine validators awaited at once, no limit if
+        None
+
+    Other parameters are the same as those of validate_config.
+    """
+    keys = _check_config(config, required_keys, optional_keys)
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError("max_concurrency must be positive")
+    if required_keys is None:
+        required_keys = {}
+
+    if inherit_options:
+        allow_unknown = parent_keys.get("allow_unknown", allow_unknown)
+        gobble_unknown = parent_keys.get("gobble_unknown", gobble_unknown)
+
+    # pass validation config args down
+    vargs = {
+        "verbosity": verbosity,
+        "allow_unknown": allow_unknown,
+        "gobble_unknown": gobble_unknown,
+    }
+    if log_fn is not None:
+        vargs["log_fn"] = log_fn
+    unknown = None
+    if summarize_unknown:
+        unknown = vargs["summarize_unknown"] = UnknownKeys()
+
+    transformed_config = extra_kwargs.copy()
+    context = ValidationContext(transformed_config, parent_keys, vargs)
+    pending, depends = _collect_entries(
+        config,
+        keys,
+        _resolve_validator,
+        transformed_config,
+        verbosity,
+        log_fn,
+        allow_unknown,
+        gobble_unknown,
+        unknown,
+    )
+    if depends:
+        pending = _schedule_keys(pending, depends)
+    order = list(transformed_config) + [entry[0] for entry in pending]
+
+    def _start(key: str, value: Any, fn: Callable, with_context: bool) -> Any:
+        """Call validation function, returning its result."""
+        if with_context:
+            return fn(value, _context=context)
+        return fn(
+            value,
+            _validator_args=vargs,
+            _parent=parent_keys,
+            **transformed_config,
+        )
+
+    if unknown is not None:
+        # only unknown keys found synchronously are attributed to keys
+        _start = _track_unknown(_start, unknown)
+
+    def _finish(key: str, value: Any, new_value: Any) -> None:
+        transformed_config[key] = value if new_value is None else new_value
+
+    # keys not validated yet, and their declared dependencies
+    remaining = {entry[0] for entry in pending}
+    waiting = {
+        entry[0]: set(depends.get(entry[0], ())) & remaining
+        for entry in pending
+    }
+    queue = deque(pending)
+    # deferred keys: [entry, dependencies, keys waited for, progress made]
+    deferred: Dict[str, list] = {}
+    running: Dict[asyncio.Future, Entry] = {}
+
+    def _defer(entry: Entry, err: DeferValidation) -> None:
+        deferred[entry[0]] = [
+            entry,
+            err.depends,
+            set(err.depends) & remaining,
+            False,
+        ]
+
+    def _complete(key: str) -> None:
+        remaining.discard(key)
+        for dependencies in waiting.values():
+            dependencies.discard(key)
+        for state in deferred.values():
+            state[2].discard(key)
+            state[3] = True
+
+    def _can_retry(state: list) -> bool:
+        return state[3] and not state[2]
+
+    try:
+        while queue or running or deferred:
+            # retry deferred keys that may now succeed
+            for key, state in list(deferred.items()):
+                if _can_retry(state):
+                    del deferred[key]
+                    queue.append(state[0])
+
+            # start keys in order, until the concurrency limit is reached
+            blocked = []
+            while queue and (
+                max_concurrency is None or len(running) < max_concurrency
+            ):
+                entry = queue.popleft()
+                key = entry[0]
+                if waiting[key]:
+                    blocked.append(entry)
+                    continue
+                try:
+                    try:
+                        new_value = _start(*entry)
+                    except ValidationError as err:
+                        raise err.with_parent(key) from err.__cause__
+                except DeferValidation as err:
+                    _defer(entry, err)
+                    continue
+                if inspect.isawaitable(new_value):
+                    running[asyncio.ensure_future(new_value)] = entry
+                else:
+                    _finish(key, entry[1], new_value)
+                    _complete(key)
+            queue.extendleft(reversed(blocked))
+
+            if not running:
+                if not queue and not deferred:
+                    break
+                if any(not waiting[entry[0]] for entry in queue) or any(
+                    _can_retry(state) for state in deferred.values()
+                ):
+                    # progress was made synchronously
+                    continue
+                # deferred validation still not done, failure
+                key, state = next(iter(deferred.items()))
+                readable_depends = ", ".join(state[1])
+                raise MissingDependencyError(
+                    f"unresolved dependencies found for key '{key}':"
+                    f"'{readable_depends}'"
+                )
+
+            done, _ = await asyncio.wait(
+                running, return_when=asyncio.FIRST_COMPLETED
+            )
+            for future in done:
+                entry = running.pop(future)
+                key = entry[0]
+                try:
+                    try:
+                        new_value = future.result()
+                    except ValidationError as err:
+                        raise err.with_parent(key) from err.__cause__
+                except DeferValidation as err:
+                    _defer(entry, err)
+                    continue
+                _finish(key, entry[1], new_value)
+                _complete(key)
+    finally:
+        for future in running:
+            future.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+        if unknown is not None:
+            _log_unknown(unknown, log_fn, verbosity)
+
+    result = {
+        key: transformed_config[key]
+        for key in order
+        if key in transformed_config
+    }
+    # pop extra kwargs
+    if pop_extra_kwargs:
+        for kwarg in extra_kwargs:
+            result.pop(kwarg, None)
+
+    return result
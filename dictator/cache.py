@@ -0,0 +1,227 @@
+"""Validation result caching."""
+
+from array import array
+from collections import OrderedDict
+from copy import copy
+from threading import Lock
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Optional, Tuple
+
+from dictator.validators.replace import _find_parent_references
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# marks keys missing from parent configurations
+_MISSING = object()
+
+
+class CacheInfo(NamedTuple):
+    """Cache statistics."""
+
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+def impure(fn: Callable) -> Callable:
+    """Mark validation function as impure.
+
+    Results of configurations validated by impure functions are never
+    cached, e.g. because validation has side effects or depends on parent
+    keys other than those referenced by fragments.
+    """
+    fn.impure = True
+    return fn
+
+
+def _freeze(value: Any) -> Any:
+    """Get hashable representation of a value.
+
+    Types are kept, so that equal values of different types (1, 1.0, True)
+    don't share cache entries. Raises TypeError for unhashable values.
+    """
+    if isinstance(value, dict):
+        return (
+            dict,
+            tuple((key, _freeze(item)) for key, item in value.items()),
+        )
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return (type(value), frozenset(_freeze(item) for item in value))
+    hash(value)
+    return (type(value), value)
+
+
+def _copy(value: Any) -> Any:
+    """Copy containers of a validated value, so that it can be modified."""
+    if isinstance(value, dict):
+        return {key: _copy(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy(item) for item in value]
+    if isinstance(value, (set, bytearray, array)):
+        return copy(value)
+    if numpy is not None and isinstance(value, numpy.ndarray):
+        return value.copy()
+    return value
+
+
+class ValidationCache:
+    """Least recently used cache of validated configurations.
+
+    Pass an instance as the cache option of validate_config or compiled
+    schemas; it is passed down to sub-validators, so repeated
+    sub-configurations are cached as well. Entries are keyed by the key
+    declarations, the configuration content, validation options and the
+    parent keys referenced by fragments. Validators are assumed to be pure
+    unless marked otherwise, and key declarations must not be modified
+    while in use with a cache. Configurations with unknown keys, at any
+    level, are not cached, so that unknown keys are reported on every
+    validation. Returned configurations are copies.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 1024):
+        """Initialize.
+
+        Parameters
+        ----------
+        maxsize
+            Maximum number of cached configurations, None for no limit
+        """
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._marks = 0
+
+    @property
+    def hits(self) -> int:
+        """Get number of cache hits."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Get number of cache misses."""
+        return self._misses
+
+    @property
+    def marks(self) -> int:
+        """Get number of times validations were marked as uncacheable."""
+        return self._marks
+
+    def mark_uncacheable(self) -> None:
+        """Prevent caching of the validations in progress.
+
+        Validations compare the number of marks before and after validating
+        their keys, and only cache results if it didn't change, e.g. because
+        no unknown keys were reported while validating them.
+        """
+        with self._lock:
+            self._marks += 1
+
+    def info(self) -> CacheInfo:
+        """Get cache statistics."""
+        return CacheInfo(
+            self._hits, self._misses, self._maxsize, len(self._entries)
+        )
+
+    def clear(self) -> None:
+        """Discard cached configurations and statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def make_key(
+        self,
+        declarations: Tuple[Any, Any],
+        config: Dict[str, Any],
+        context: Mapping,
+        extra_kwargs: Dict[str, Any],
+        options: Tuple[Any, ...],
+    ) -> Optional[tuple]:
+        """Get cache key of a validation.
+
+        Parameters
+        ----------
+        declarations
+            Required and optional key declarations
+        config
+            The configuration
+        context
+            Validation context of the configuration
+        extra_kwargs
+            Extra keys made available to validators
+        options
+            Validation options affecting results
+
+        Returns None if the validation can't be cached.
+        """
+        references = set()
+        _find_parent_references(config, references)
+        try:
+            parent_values = ()
+            if references and context.parent is not None:
+                parent = context.parent
+                root = context.root
+                parent_values = tuple(
+                    (
+                        key,
+                        _freeze(parent.get(key, _MISSING)),
+                        _freeze(root.get(key, _MISSING)),
+                    )
+                    for key in sorted(references)
+                )
+            return (
+                # empty declarations are all alike, and often built per call
+                tuple(id(keys) if keys else None for keys in declarations),
+                _freeze(config),
+                _freeze(extra_kwargs),
+                options,
+                parent_values,
+            )
+        except TypeError:
+            return None
+
+    def get(self, key: tuple) -> Optional[Dict[str, Any]]:
+        """Get a copy of a cached configuration, None if not cached."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return _copy(entry[1])
+
+    def put(
+        self,
+        key: tuple,
+        declarations: Tuple[Any, Any],
+        result: Dict[str, Any],
+    ) -> None:
+        """Cache a validated configuration.
+
+        Parameters
+        ----------
+        key
+            Key from make_key
+        declarations
+            Key declarations, kept alive while cached so that their identity
+            remains valid
+        result
+            Validated configuration
+        """
+        entry = (declarations, _copy(result))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            maxsize = self._maxsize
+            if maxsize is not None and len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
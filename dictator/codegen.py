@@ -0,0 +1,327 @@
+"""Generate specialized validation functions from compiled schemas."""
+
+import logging
+from typing import Any, Callable, Dict, List, Tuple
+
+from dictator.config import (
+    VERBOSITY,
+    ResolvedValidator,
+    _log,
+    _log_enabled,
+    _missing_keys_error,
+    _reject_awaitable,
+)
+from dictator.context import ValidationContext
+from dictator.errors import (
+    ConfigurationTypeError,
+    UnknownKeyError,
+    ValidationError,
+)
+from dictator.validators.base import (
+    ValidateType,
+    ValidatorFactory,
+    _validate_integer,
+)
+from dictator.validators.dependency import DeferValidation
+from dictator.validators.integer import ValidateIntRange
+from dictator.validators.lists import ValidateChoice
+import dictator.schema
+
+
+def _unwrap(fn: Callable) -> Callable:
+    """Get function wrapped by validator factories."""
+    owner = getattr(fn, "__self__", None)
+    while isinstance(owner, ValidatorFactory):
+        fn = owner._validatefn
+        owner = getattr(fn, "__self__", None)
+    return fn
+
+
+def _is_method(fn: Callable, cls: type) -> bool:
+    """Get if fn is the validate method of an instance of cls (exactly)."""
+    owner = getattr(fn, "__self__", None)
+    return type(owner) is cls and fn.__func__ is cls.validate
+
+
+class _Generator:
+    """Python source generator."""
+
+    def __init__(self):
+        """Initialize."""
+        self.lines: List[str] = []
+        self.namespace: Dict[str, Any] = {
+            "ValidationContext": ValidationContext,
+            "ValidationError": ValidationError,
+            "ConfigurationTypeError": ConfigurationTypeError,
+            "_missing": _missing_keys_error,
+            "UnknownKeyError": UnknownKeyError,
+            "DeferValidation": DeferValidation,
+            "_log": _log,
+            "_log_enabled": _log_enabled,
+            "_reject_awaitable": _reject_awaitable,
+        }
+
+    def constant(self, value: Any) -> str:
+        """Make a value available to generated code, returning its name."""
+        name = f"_c{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def emit(self, line: str, indent: int) -> None:
+        """Add a line of code."""
+        self.lines.append("    " * indent + line)
+
+    def emit_key(self, name: str, entry: ResolvedValidator) -> None:
+        """Generate validation function of a key."""
+        self.emit(
+            f"def {name}(value, context, result, vargs, parent_keys):", 0
+        )
+        fn, with_context, _ = entry
+        inner = _unwrap(fn)
+        if _is_method(inner, ValidateType):
+            types = self.constant(inner.__self__.target_types)
+            self.emit(f"if not isinstance(value, {types}):", 1)
+            self.emit("raise ValidationError(", 2)
+            self.emit(
+                'f"value has unexpected type: {type(value).__name__}"', 3
+            )
+            self.emit(")", 2)
+            self.emit("return value", 1)
+            return
+
+        if _is_method(inner, ValidateChoice) and inner.__self__.exact:
+            choices = inner.__self__.choices
+            try:
+                members = self.constant(frozenset(choices))
+            except TypeError:
+                members = self.constant(choices)
+            readable = ", ".join(str(choice) for choice in choices)
+            self.emit("try:", 1)
+            self.emit(f"valid = value in {members}", 2)
+            self.emit("except TypeError:", 1)
+            self.emit("valid = False", 2)
+            self.emit("if not valid:", 1)
+            self.emit("raise ValidationError(", 2)
+            self.emit(
+                "f\"value '{value}' is not a valid choice, choose from \" + "
+                f"{self.constant('[' + readable + ']')}",
+                3,
+            )
+            self.emit(")", 2)
+            self.emit("return value", 1)
+            return
+
+        # other validators are called, optionally behind a fast path
+        if _is_method(inner, ValidateIntRange):
+            owner = inner.__self__
+            conditions = []
+            if owner._start is not None:
+                conditions.append(f"value < {self.constant(owner._start)}")
+            if owner._end is not None:
+                conditions.append(f"value > {self.constant(owner._end)}")
+            self.emit("if type(value) is int:", 1)
+            if conditions:
+                self.emit(f"if {' or '.join(conditions)}:", 2)
+                message = f"value out of [{owner._start}, {owner._end}] range"
+                self.emit(
+                    f"raise ValidationError({self.constant(message)})", 3
+                )
+            self.emit("return value", 2)
+        elif inner is _validate_integer:
+            self.emit("if type(value) is int:", 1)
+            self.emit("return value", 2)
+
+        call = self.constant(fn)
+        if with_context:
+            self.emit(f"new_value = {call}(value, _context=context)", 1)
+        else:
+            self.emit(
+                f"new_value = {call}(value, _validator_args=vargs, "
+                "_parent=parent_keys, **result)",
+                1,
+            )
+        self.emit("_reject_awaitable(new_value)", 1)
+        self.emit("return value if new_value is None else new_value", 1)
+
+
+def _can_generate(schema: "dictator.schema.CompiledSchema") -> bool:
+    """Get if specialized code can be generated for a schema."""
+    options = schema.options
+    if (
+        options["inherit_options"]
+        or options["profiler"] is not None
+        or options["cache"] is not None
+        or options["errors"] is not None
+        or options["summarize_unknown"]
+    ):
+        return False
+    entries = list(schema.required_keys.values())
+    if schema.optional_keys is not None:
+        entries.extend(schema.optional_keys.values())
+    # declared dependencies need scheduling
+    return all(entry is None or entry[2] is None for entry in entries)
+
+
+def generate_source(
+    schema: "dictator.schema.CompiledSchema",
+) -> Tuple[str, Dict[str, Any]]:
+    """Generate source code of a specialized validation function.
+
+    Parameters
+    ----------
+    schema
+        A compiled schema
+
+    Returns the source code, defining a validate function, and the
+    namespace it must be executed in.
+    """
+    options = schema.options
+    gen = _Generator()
+    keys = dict(schema.required_keys)
+    if schema.optional_keys is not None:
+        for key, entry in schema.optional_keys.items():
+            keys.setdefault(key, entry)
+
+    dispatch = {}
+    unvalidated = set()
+    for key, entry in keys.items():
+        if entry is None:
+            unvalidated.add(key)
+            continue
+        name = f"_key{len(dispatch)}"
+        gen.emit_key(name, entry)
+        gen.emit("", 0)
+        dispatch[key] = name
+    gen.emit(
+        "_KEYS = {"
+        + ", ".join(f"{key!r}: {name}" for key, name in dispatch.items())
+        + "}",
+        0,
+    )
+    gen.namespace["_UNVALIDATED"] = frozenset(unvalidated)
+    vargs = {
+        "verbosity": options["verbosity"],
+        "allow_unknown": options["allow_unknown"],
+        "gobble_unknown": options["gobble_unknown"],
+    }
+    if options["log_fn"] is not None:
+        vargs["log_fn"] = options["log_fn"]
+    gen.namespace["_VARGS"] = vargs
+    gen.namespace["_LOG_FN"] = options["log_fn"]
+    gen.namespace["_fallback"] = schema.validate
+    gen.emit("", 0)
+
+    gen.emit("def validate(config, parent_keys=None):", 0)
+    gen.emit("if not isinstance(config, dict):", 1)
+    gen.emit("raise ConfigurationTypeError(", 2)
+    gen.emit(
+        'f"configuration must be a dictionary, got: {type(config)}"', 3
+    )
+    gen.emit(")", 2)
+    if schema.required_keys:
+        gen.namespace["_REQUIRED"] = frozenset(schema.required_keys)
+        gen.namespace["_REQUIRED_ORDER"] = tuple(schema.required_keys)
+        gen.emit("if not config.keys() >= _REQUIRED:", 1)
+        gen.emit("raise _missing(_REQUIRED_ORDER, config)", 2)
+    gen.emit("result = {}", 1)
+
+    # verbosity is fixed, logger levels are checked for each message
+    custom_log = options["log_fn"] is not None and not isinstance(
+        options["log_fn"], logging.Logger
+    )
+    log_unknown = (
+        custom_log or VERBOSITY["warning"] >= VERBOSITY[options["verbosity"]]
+    )
+    # like the generic path, keys that are not validated are handled first
+    first_pass = (
+        log_unknown
+        or unvalidated
+        or not options["allow_unknown"]
+        or not options["gobble_unknown"]
+    )
+    if first_pass:
+        gen.emit("for key, value in config.items():", 1)
+        gen.emit("if key in _KEYS:", 2)
+        gen.emit("continue", 3)
+        if unvalidated:
+            gen.emit("if key in _UNVALIDATED:", 2)
+            gen.emit("result[key] = value", 3)
+            gen.emit("continue", 3)
+        gen.emit("if not isinstance(key, str):", 2)
+        gen.emit(
+            'raise ConfigurationTypeError("keys must be string values")', 3
+        )
+        if log_unknown:
+            verbosity = gen.constant(options["verbosity"])
+            gen.emit(f'if _log_enabled(_LOG_FN, "warning", {verbosity}):', 2)
+            gen.emit(
+                f"_log(_LOG_FN, f\"unknown key: '{{key}}'\", \"warning\", "
+                f"{verbosity})",
+                3,
+            )
+        if not options["allow_unknown"]:
+            gen.emit('raise UnknownKeyError(f"unknown key: {key}")', 2)
+        if not options["gobble_unknown"]:
+            gen.emit("result[key] = value", 2)
+
+    gen.emit("vargs = dict(_VARGS)", 1)
+    gen.emit("context = ValidationContext(result, parent_keys, vargs)", 1)
+    gen.emit("try:", 1)
+    gen.emit("for key, value in config.items():", 2)
+    gen.emit("validate_key = _KEYS.get(key)", 3)
+    gen.emit("if validate_key is None:", 3)
+    if not first_pass:
+        gen.emit("if not isinstance(key, str):", 4)
+        gen.emit(
+            'raise ConfigurationTypeError("keys must be string values")', 5
+        )
+    gen.emit("continue", 4)
+    gen.emit("try:", 3)
+    gen.emit(
+        "result[key] = validate_key(value, context, result, vargs, "
+        "parent_keys)",
+        4,
+    )
+    gen.emit("except ValidationError as err:", 3)
+    gen.emit("raise err.with_parent(key) from err.__cause__", 4)
+    gen.emit("except DeferValidation:", 1)
+    gen.emit("# keys must be validated in another order", 2)
+    gen.emit("return _fallback(config, parent_keys)", 2)
+    gen.emit("return result", 1)
+
+    return "\n".join(gen.lines) + "\n", gen.namespace
+
+
+def generate_validator(
+    schema: "dictator.schema.CompiledSchema",
+) -> Callable[..., Dict[str, Any]]:
+    """Generate a specialized validation function from a compiled schema.
+
+    The function is called as validate(config, parent_keys=None), with the
+    default options of the schema. Type, integer range and choice checks are
+    inlined, and other validators are called directly. Generated functions
+    are cached on the schema; schemas whose keys declare dependencies, or that
+    use profiling, caching, error collection, unknown key summaries or
+    inherited options, get their validate method instead.
+
+    Parameters
+    ----------
+    schema
+        A compiled schema
+    """
+    validate_fn = schema._generated
+    if validate_fn is not None:
+        return validate_fn
+
+    if not _can_generate(schema):
+        validate_fn = schema.validate
+    else:
+        source, namespace = generate_source(schema)
+        code = compile(source, f"<dictator schema {id(schema):#x}>", "exec")
+        exec(code, namespace)
+        validate_fn = namespace["validate"]
+        validate_fn.source = source
+
+    # kept on the schema, so that it is freed along with it
+    schema._set_generated(validate_fn)
+    return validate_fn
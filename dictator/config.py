@@ -1,78 +1,231 @@
 """Validate test configuration."""
 
+import inspect
+import logging
 from typing import Type, Union, Callable, Dict, List, Tuple, Optional, Any
+from typing import Iterable
 
 from dictator.errors import (
+    ConfigurationError,
+    ConfigurationTypeError,
+    ErrorCollector,
+    KeyPath,
     MissingRequiredKeyError,
     MissingDependencyError,
+    CircularDependencyError,
     KeyDeclarationError,
     UnknownKeyError,
     DefaultValidatorError,
     ValidationError,
+    ValidationErrors,
+    format_path,
 )
 from dictator.validators.dependency import DeferValidation
 from dictator.validators.util import ValidateUnion
-from dictator.validators import Validator
+from dictator.validators import (
+    Validator,
+    _uses_context,
+    _get_dependency_fn,
+    _is_impure,
+)
 from dictator.validators.base import DEFAULT_VALIDATOR_BY_TYPE
+from dictator.context import UnknownKeys, ValidationContext
+from dictator.profiler import ValidationProfiler, _describe
+from dictator.cache import ValidationCache
+import dictator.lazy
 
 VERBOSITY = {"error": 3, "warning": 2, "info": 1, "debug": 0}
-VERBOSITY_HEADERS = {
-    "error": "ERROR",
-    "warning": "WARNING",
-    "info": "",
-    "debug": "DEBUG",
+LOG_LEVELS = {
+    "error": logging.ERROR,
+    "warning": logging.WARNING,
+    "info": logging.INFO,
+    "debug": logging.DEBUG,
 }
+# maximum number of keys listed in unknown key summaries
+UNKNOWN_SUMMARY_KEYS = 10
+# maximum number of key tables kept for uncompiled declarations
+KEY_TABLE_CACHE_SIZE = 256
 
+LOGGER = logging.getLogger("dictator")
 
-def _default_logger(msg: str, severity: str, verbosity: str):
-    """Default logger."""
-    if VERBOSITY[severity] >= VERBOSITY[verbosity]:
-        print(
-            "{}{}".format(
-                "{}{}".format(
-                    VERBOSITY_HEADERS[severity],
-                    ": " if VERBOSITY_HEADERS[severity] else "",
-                ),
-                msg,
-            )
-        )
+# marks keys that are not declared
+_UNKNOWN = object()
 
+# merged key tables by declaration identity, see _get_keys
+_KEY_TABLES: Dict[Tuple[int, int], Tuple[Any, Any, Dict[str, Any]]] = {}
 
-def _config_pre_checklist(fn: Callable) -> Callable:
-    """Check configuration types."""
+LogFunction = Union[Callable[[str, str, str], None], logging.Logger]
 
-    def _check(config, required_keys, optional_keys=None, *args, **kwargs):
-        if not isinstance(config, dict):
-            raise TypeError(
-                f"configuration must be a dictionary, got: {type(config)}"
-            )
+# types of validation results that are never awaitable, checked cheaply
+_PLAIN_TYPES = frozenset(
+    (type(None), str, int, float, bool, list, tuple, dict)
+)
 
-        if required_keys is not None:
-            if not isinstance(required_keys, dict):
-                raise TypeError("required_keys must be a dictionary")
 
-            for key in required_keys:
-                if not isinstance(key, str):
-                    raise KeyDeclarationError("keys must be string values")
-                if key not in config:
-                    raise MissingRequiredKeyError(
-                        f"invalid configuration, missing required key '{key}'"
-                    )
+def _log_enabled(
+    log_fn: Optional[LogFunction], severity: str, verbosity: str
+) -> bool:
+    """Get whether a message would be logged, before formatting it."""
+    if log_fn is not None and not isinstance(log_fn, logging.Logger):
+        # custom logging functions do their own filtering
+        return True
+    if VERBOSITY[severity] < VERBOSITY[verbosity]:
+        return False
+    logger = LOGGER if log_fn is None else log_fn
+    return logger.isEnabledFor(LOG_LEVELS[severity])
+
 
-        if optional_keys is not None:
-            if not isinstance(optional_keys, dict):
-                raise TypeError("optional_keys must be a dictionary")
+def _log(
+    log_fn: Optional[LogFunction], msg: str, severity: str, verbosity: str
+) -> None:
+    """Log a message, after checking it with _log_enabled."""
+    if log_fn is None:
+        LOGGER.log(LOG_LEVELS[severity], msg)
+    elif isinstance(log_fn, logging.Logger):
+        log_fn.log(LOG_LEVELS[severity], msg)
+    else:
+        log_fn(msg, severity, verbosity)
+
+
+def _summarize_unknown(paths: List[KeyPath]) -> str:
+    """Get summary message of unknown keys."""
+    listed = ", ".join(
+        f"'{format_path(path)}'" for path in paths[:UNKNOWN_SUMMARY_KEYS]
+    )
+    if len(paths) > UNKNOWN_SUMMARY_KEYS:
+        listed += f" and {len(paths) - UNKNOWN_SUMMARY_KEYS} more"
+    return f"unknown keys ({len(paths)}): {listed}"
 
-            for key in optional_keys:
-                if not isinstance(key, str):
-                    raise KeyDeclarationError("keys must be string values")
-                if required_keys is not None and key in required_keys:
-                    # warning, required AND optional
-                    pass
 
-        return fn(config, required_keys, optional_keys, *args, **kwargs)
+def _log_unknown(
+    unknown: UnknownKeys, log_fn: Optional[LogFunction], verbosity: str
+) -> None:
+    """Log summary of unknown keys, if any."""
+    if unknown.paths and _log_enabled(log_fn, "warning", verbosity):
+        _log(log_fn, _summarize_unknown(unknown.paths), "warning", verbosity)
+
+
+def _track_unknown(validate_key: Callable, unknown: UnknownKeys) -> Callable:
+    """Wrap key validation, adding the key to unknown keys found below it."""
+
+    def _validate_key(key, *args):
+        start = len(unknown.paths)
+        try:
+            return validate_key(key, *args)
+        except DeferValidation:
+            # validated again later
+            unknown.discard(start)
+            raise
+        finally:
+            unknown.add_parent(start, key)
 
-    return _check
+    return _validate_key
+
+
+def _reject_awaitable(value: Any) -> None:
+    """Fail on awaitable validation results, which are never awaited here."""
+    if type(value) in _PLAIN_TYPES or not inspect.isawaitable(value):
+        return
+    if inspect.iscoroutine(value):
+        # don't warn about it not being awaited
+        value.close()
+    raise ValidationError(
+        "validator returned an awaitable, coroutine validators are only "
+        "supported on top-level keys of async_validate_config"
+    )
+
+
+def _check_declaration(keys: Any, name: str) -> None:
+    """Check a key declaration mapping."""
+    if not isinstance(keys, dict):
+        raise TypeError(f"{name} must be a dictionary")
+
+    for key in keys:
+        if not isinstance(key, str):
+            raise KeyDeclarationError("keys must be string values")
+
+
+def _merge_keys(
+    required_keys: Dict[str, Any], optional_keys: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Merge key declarations into a single table, required keys winning."""
+    if not optional_keys:
+        return required_keys
+    return {**optional_keys, **required_keys}
+
+
+def _get_keys(
+    required_keys: Optional[Dict[str, Any]],
+    optional_keys: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Check key declarations and merge them into a single table.
+
+    Tables are cached by declaration identity, along with copies of the
+    declarations, so that declarations are only checked and merged again
+    when they are modified or new.
+    """
+    ident = (id(required_keys), id(optional_keys))
+    cached = _KEY_TABLES.get(ident)
+    if (
+        cached is not None
+        and cached[0] == required_keys
+        and cached[1] == optional_keys
+    ):
+        return cached[2]
+
+    if required_keys is not None:
+        _check_declaration(required_keys, "required_keys")
+    if optional_keys is not None:
+        _check_declaration(optional_keys, "optional_keys")
+    keys = _merge_keys(
+        {} if required_keys is None else required_keys, optional_keys
+    )
+    if len(_KEY_TABLES) >= KEY_TABLE_CACHE_SIZE:
+        _KEY_TABLES.clear()
+    _KEY_TABLES[ident] = (
+        None if required_keys is None else dict(required_keys),
+        None if optional_keys is None else dict(optional_keys),
+        keys,
+    )
+    return keys
+
+
+def _missing_keys_error(
+    required_keys: Iterable[str], config: Dict[str, Any]
+) -> MissingRequiredKeyError:
+    """Get error reporting all required keys missing from a configuration."""
+    missing = [key for key in required_keys if key not in config]
+    if len(missing) == 1:
+        message = f"invalid configuration, missing required key '{missing[0]}'"
+    else:
+        readable = ", ".join(f"'{key}'" for key in missing)
+        message = f"invalid configuration, missing required keys {readable}"
+    return MissingRequiredKeyError(message, missing)
+
+
+def _check_config(
+    config: Any,
+    required_keys: Any,
+    optional_keys: Any,
+    check_required: bool = True,
+) -> Dict[str, Any]:
+    """Check configuration and key declaration types, and required keys.
+
+    Returns the table merging required and optional keys.
+    """
+    if not isinstance(config, dict):
+        raise ConfigurationTypeError(
+            f"configuration must be a dictionary, got: {type(config)}"
+        )
+
+    keys = _get_keys(required_keys, optional_keys)
+    if (
+        check_required
+        and required_keys
+        and not config.keys() >= required_keys.keys()
+    ):
+        raise _missing_keys_error(required_keys, config)
+    return keys
 
 
 def _get_validate_fn(entry: Union[Type, Validator, Callable]) -> Callable:
@@ -96,28 +249,260 @@ def _get_validate_fn(entry: Union[Type, Validator, Callable]) -> Callable:
     return fn
 
 
+ResolvedValidator = Optional[Tuple[Callable, bool, Optional[Callable]]]
+
+
+def _resolve_validator(
+    entry: Union[Type, Validator, Callable, None]
+) -> ResolvedValidator:
+    """Resolve key declaration.
+
+    Resolves into validation function, calling convention and dependency
+    declaration function.
+    """
+    if entry is None:
+        return None
+    fn = _get_validate_fn(entry)
+    return fn, _uses_context(fn), _get_dependency_fn(fn)
+
+
+def _schedule_keys(
+    pending: List[Tuple[str, Any, Callable, bool]],
+    depends: Dict[str, Tuple[str, ...]],
+) -> List[Tuple[str, Any, Callable, bool]]:
+    """Order keys so that declared dependencies are validated first.
+
+    Keys keep their original order unless a dependency forces otherwise.
+    """
+    entries = {entry[0]: entry for entry in pending}
+    ordered = []
+    done = set()
+    for root in entries:
+        if root in done:
+            continue
+        path = [root]
+        on_path = {root}
+        stack = [iter(depends.get(root, ()))]
+        while stack:
+            for dep in stack[-1]:
+                if dep in done or dep not in entries:
+                    continue
+                if dep in on_path:
+                    cycle = " -> ".join(path[path.index(dep) :] + [dep])
+                    raise CircularDependencyError(
+                        f"circular dependency between keys: {cycle}"
+                    )
+                path.append(dep)
+                on_path.add(dep)
+                stack.append(iter(depends.get(dep, ())))
+                break
+            else:
+                stack.pop()
+                key = path.pop()
+                on_path.discard(key)
+                done.add(key)
+                ordered.append(entries[key])
+
+    return ordered
+
+
 ValidatorConfiguration = Union[Dict[str, Union[Callable, type, None]]]
 JSONBaseTypes = Union[str, int, bool, float, None]
 ConfigurationType = Dict[str, Union[Dict, List, Tuple, JSONBaseTypes]]
 
 
-@_config_pre_checklist
 def validate_config(
     config: ConfigurationType,
     required_keys: Optional[ValidatorConfiguration] = None,
     optional_keys: Optional[ValidatorConfiguration] = None,
     verbosity: str = "error",
-    log_fn: Optional[Callable] = None,
+    log_fn: Optional[LogFunction] = None,
     allow_unknown: bool = True,
     gobble_unknown: bool = True,
     inherit_options: bool = False,
     pop_extra_kwargs: bool = False,
     parent_keys: Optional[Dict[str, Any]] = None,
+    profiler: Optional[ValidationProfiler] = None,
+    summarize_unknown: bool = False,
+    cache: Optional[ValidationCache] = None,
+    errors: Optional[ErrorCollector] = None,
+    lazy: bool = False,
     **extra_kwargs: Dict[str, Any],
 ):
-    """Validate configuration."""
+    """Validate configuration.
+
+    If lazy is True, a LazyConfig mapping is returned instead, validating
+    each key on first access; caching and error collection are not
+    supported then.
+    """
+    # missing keys are reported along with other errors when collecting
+    keys = _check_config(config, required_keys, optional_keys, errors is None)
+    if lazy:
+        if cache is not None or errors is not None:
+            raise ValueError(
+                "lazy validation does not support caching or collecting errors"
+            )
+        return dictator.lazy.LazyConfig(
+            config,
+            {} if required_keys is None else required_keys,
+            optional_keys,
+            verbosity,
+            log_fn,
+            allow_unknown,
+            gobble_unknown,
+            inherit_options,
+            pop_extra_kwargs,
+            parent_keys,
+            extra_kwargs,
+            profiler,
+            summarize_unknown,
+            keys,
+        )
+    return _validate_entries(
+        config,
+        {} if required_keys is None else required_keys,
+        optional_keys,
+        _resolve_validator,
+        verbosity,
+        log_fn,
+        allow_unknown,
+        gobble_unknown,
+        inherit_options,
+        pop_extra_kwargs,
+        parent_keys,
+        extra_kwargs,
+        profiler,
+        summarize_unknown,
+        cache,
+        errors,
+        keys,
+    )
+
+
+def _collect_entries(
+    config: ConfigurationType,
+    keys: Dict[str, Any],
+    resolve: Optional[Callable],
+    transformed_config: Dict[str, Any],
+    verbosity: str,
+    log_fn: Optional[LogFunction],
+    allow_unknown: bool,
+    gobble_unknown: bool,
+    unknown: Optional[UnknownKeys],
+    errors: Optional[ErrorCollector] = None,
+) -> Tuple[List[Tuple[str, Any, Callable, bool]], Dict[str, Tuple[str, ...]]]:
+    """Collect keys to validate.
+
+    Key declarations are looked up in keys, the table merging required and
+    optional keys. Keys that are not validated are added to the transformed
+    configuration directly. Returns entries of keys to validate, as (key,
+    value, validation function, calling convention), and declared
+    dependencies by key. Unknown keys are recorded in unknown, if
+    summarizing them, and in errors, if collecting errors.
+    """
+    pending = []
+    depends = {}
+    for key, value in config.items():
+        entry = keys.get(key, _UNKNOWN)
+        if entry is _UNKNOWN:
+            if not isinstance(key, str):
+                raise ConfigurationTypeError("keys must be string values")
+            # warning, unknown key
+            if unknown is not None:
+                unknown.add(key)
+            elif _log_enabled(log_fn, "warning", verbosity):
+                _log(log_fn, f"unknown key: '{key}'", "warning", verbosity)
+            if allow_unknown is False:
+                if errors is None:
+                    raise UnknownKeyError(f"unknown key: {key}")
+                errors.add(UnknownKeyError(f"unknown key: {key}"), key=key)
+            if not gobble_unknown:
+                # passes through without validation
+                transformed_config[key] = value
+            continue
+
+        if entry is None:
+            # no validation
+            transformed_config[key] = value
+            continue
+
+        fn, with_context, get_dependencies = (
+            entry if resolve is None else resolve(entry)
+        )
+        if get_dependencies is not None:
+            key_depends = get_dependencies(value)
+            if key_depends:
+                depends[key] = key_depends
+        pending.append((key, value, fn, with_context))
+
+    return pending, depends
+
+
+def _validate_entries(
+    config: ConfigurationType,
+    required_keys: Dict[str, Any],
+    optional_keys: Optional[Dict[str, Any]],
+    resolve: Optional[Callable],
+    verbosity: str,
+    log_fn: Optional[LogFunction],
+    allow_unknown: bool,
+    gobble_unknown: bool,
+    inherit_options: bool,
+    pop_extra_kwargs: bool,
+    parent_keys: Optional[Dict[str, Any]],
+    extra_kwargs: Dict[str, Any],
+    profiler: Optional[ValidationProfiler] = None,
+    summarize_unknown: Union[bool, UnknownKeys] = False,
+    cache: Optional[ValidationCache] = None,
+    errors: Optional[ErrorCollector] = None,
+    keys: Optional[Dict[str, Any]] = None,
+):
+    """Validate configuration entries.
 
-    _log = log_fn if log_fn is not None else _default_logger
+    Parameters
+    ----------
+    resolve
+        Function that turns a key declaration into a validation function and
+        calling convention, or None if the key maps are already resolved
+    profiler
+        Profiler recording validation of each key, if any
+    summarize_unknown
+        Log unknown keys of all levels in a single summary message; nested
+        levels receive the unknown keys of the top-level validation instead
+    cache
+        Cache of validated configurations, if any
+    errors
+        Collector of errors, if validation continues past failures
+    keys
+        Required and optional keys merged into a single table, if already
+        computed
+    """
+    if summarize_unknown is True:
+        # top-level validation, logging unknown keys once
+        unknown = UnknownKeys()
+        try:
+            return _validate_entries(
+                config,
+                required_keys,
+                optional_keys,
+                resolve,
+                verbosity,
+                log_fn,
+                allow_unknown,
+                gobble_unknown,
+                inherit_options,
+                pop_extra_kwargs,
+                parent_keys,
+                extra_kwargs,
+                profiler,
+                unknown,
+                cache,
+                errors,
+                keys,
+            )
+        finally:
+            _log_unknown(unknown, log_fn, verbosity)
+    unknown = summarize_unknown or None
 
     allow_unknown = (
         parent_keys.get("allow_unknown", allow_unknown)
@@ -130,85 +515,186 @@ def validate_config(
         else gobble_unknown
     )
 
-    required_keys = {} if required_keys is None else required_keys
-
     # pass validation config args down
     vargs = {
         "verbosity": verbosity,
         "allow_unknown": allow_unknown,
         "gobble_unknown": gobble_unknown,
     }
+    if log_fn is not None:
+        vargs["log_fn"] = log_fn
+    if unknown is not None:
+        vargs["summarize_unknown"] = unknown
+    if profiler is not None:
+        vargs["profiler"] = profiler
+
+    # keys that failed, or that depend on keys that failed
+    failed = set()
+    # errors raised while collecting is suspended are not collected
+    root = False
+    if errors is not None and errors.active:
+        vargs["errors"] = errors
+        # the top-level validation raises collected errors
+        root = not errors.path
+        if root:
+            errors.clear()
+        collected = len(errors)
+        # extra keys are present too, such as unchanged keys when revalidating
+        present = config.keys() | extra_kwargs.keys()
+        if not present >= required_keys.keys():
+            # each missing key is reported with its path
+            for key in required_keys:
+                if key not in present:
+                    failed.add(key)
+                    errors.add(_missing_keys_error((key,), config), key=key)
+    else:
+        errors = None
 
     transformed_config = extra_kwargs.copy()
-    deferred_keys = {}
-    for key, value in config.items():
-        if not isinstance(key, str):
-            raise TypeError("keys must be string values")
-        if key not in required_keys and (
-            (optional_keys is not None and key not in optional_keys)
-            or optional_keys is None
-        ):
-            # warning, unknown key
-            _log(f"unknown key: '{key}'", "warning", verbosity)
-            if allow_unknown is False:
-                raise UnknownKeyError(f"unknown key: {key}")
-            if not gobble_unknown:
-                # passes through without validation
-                transformed_config[key] = value
-            continue
+    context = ValidationContext(transformed_config, parent_keys, vargs)
 
-        key_loc = required_keys if key in required_keys else optional_keys
-        # call validate
-        if key_loc[key] is None:
-            # no validation
-            transformed_config[key] = value
-        else:
-            # try default validator
-            try:
-                new_value = _get_validate_fn(key_loc[key])(
+    if cache is not None:
+        vargs["cache"] = cache
+
+    def _validate_key(key, value, fn, with_context):
+        try:
+            if with_context:
+                new_value = fn(value, _context=context)
+            else:
+                new_value = fn(
                     value,
                     _validator_args=vargs,
                     _parent=parent_keys,
                     **transformed_config,
                 )
-                transformed_config[key] = (
-                    value if new_value is None else new_value
-                )
-            except DeferValidation as defer:
-                deferred_keys[key] = defer.depends
-            except ValidationError as err:
-                _err = str(err)
-                raise ValidationError(
-                    f"while validating key {key}: " + _err
-                ) from err
-
-    # resolve dependencies
-    for key, depends in deferred_keys.items():
-        # FIXME: mypy complains
-        key_loc = required_keys if key in required_keys else optional_keys
+            _reject_awaitable(new_value)
+        except ValidationError as err:
+            raise err.with_parent(key) from err.__cause__
+        transformed_config[key] = value if new_value is None else new_value
+
+    def _collect_key(key, value, fn, with_context):
+        if not failed.isdisjoint(depends.get(key, ())):
+            failed.add(key)
+            return
+        count = len(errors)
+        errors.enter(key)
         try:
-            transform = _get_validate_fn(key_loc[key])(
-                config[key],
-                _validator_args=vargs,
-                _parent=parent_keys,
-                **transformed_config,
-            )
+            if with_context:
+                new_value = fn(value, _context=context)
+            else:
+                new_value = fn(
+                    value,
+                    _validator_args=vargs,
+                    _parent=parent_keys,
+                    **transformed_config,
+                )
+            _reject_awaitable(new_value)
         except DeferValidation as ex:
+            if failed.isdisjoint(ex.depends):
+                raise
+            failed.add(key)
+            return
+        except ValidationErrors:
+            raise
+        except ConfigurationError as err:
+            failed.add(key)
+            errors.add(err, _describe(fn), value)
+            return
+        finally:
+            errors.leave()
+        if len(errors) > count:
+            # errors found in a sub-configuration
+            failed.add(key)
+            return
+        transformed_config[key] = value if new_value is None else new_value
+
+    validate_key = _validate_key if errors is None else _collect_key
+    if unknown is not None:
+        validate_key = _track_unknown(validate_key, unknown)
+
+    if keys is None:
+        keys = _merge_keys(required_keys, optional_keys)
+    pending, depends = _collect_entries(
+        config,
+        keys,
+        resolve,
+        transformed_config,
+        verbosity,
+        log_fn,
+        allow_unknown,
+        gobble_unknown,
+        unknown,
+        errors,
+    )
+
+    # looked up once unknown keys are reported and impurity is known
+    cache_key = None
+    if cache is not None:
+        if not keys.keys() >= config.keys():
+            # unknown keys must be reported on every validation
+            cache.mark_uncacheable()
+        elif not any(_is_impure(entry[2]) for entry in pending):
+            declarations = (required_keys, optional_keys)
+            cache_key = cache.make_key(
+                declarations,
+                config,
+                context,
+                extra_kwargs,
+                (allow_unknown, gobble_unknown, pop_extra_kwargs),
+            )
+            if cache_key is not None:
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    return cached
+                # unknown keys may be found at lower levels
+                marks = cache.marks
+    if profiler is not None:
+        pending = [
+            (key, value, profiler.wrap(key, fn), with_context)
+            for key, value, fn, with_context in pending
+        ]
+
+    if depends:
+        pending = _schedule_keys(pending, depends)
+
+    deferred_keys = []
+    for entry in pending:
+        try:
+            validate_key(*entry)
+        except DeferValidation:
+            deferred_keys.append(entry)
+
+    # resolve dynamic dependencies, retrying while progress is made
+    while deferred_keys:
+        unresolved = []
+        unresolved_depends = {}
+        for entry in deferred_keys:
+            try:
+                validate_key(*entry)
+            except DeferValidation as ex:
+                unresolved.append(entry)
+                unresolved_depends[entry[0]] = ex.depends
+
+        if len(unresolved) == len(deferred_keys):
             # deferred validation still not done, failure
-            readable_depends = ", ".join(ex.depends)
+            if errors is not None:
+                for key, key_depends in unresolved_depends.items():
+                    readable_depends = ", ".join(key_depends)
+                    errors.add(
+                        MissingDependencyError(
+                            f"unresolved dependencies found for key "
+                            f"'{key}':'{readable_depends}'"
+                        ),
+                        key=key,
+                    )
+                break
+            key, key_depends = next(iter(unresolved_depends.items()))
+            readable_depends = ", ".join(key_depends)
             raise MissingDependencyError(
                 f"unresolved dependencies found for key '{key}':"
                 f"'{readable_depends}'"
             )
-        except ValidationError as err:
-            _err = str(err)
-            raise ValidationError(
-                f"while validating key {key}: " + _err
-            ) from err
-
-        transformed_config[key] = (
-            transform if transform is not None else config[key]
-        )
+        deferred_keys = unresolved
 
     # pop extra kwargs
     if pop_extra_kwargs:
@@ -216,4 +702,13 @@ def validate_config(
             if kwarg in transformed_config:
                 transformed_config.pop(kwarg)
 
+    if errors is not None and len(errors) > collected:
+        if root:
+            raise errors.exception()
+        # partial results are not cached
+        cache_key = None
+
+    if cache_key is not None and cache.marks == marks:
+        cache.put(cache_key, declarations, transformed_config)
+
     return transformed_config
@@ -0,0 +1,149 @@
+"""Validation context."""
+
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+
+class ValidationContext(Mapping):
+    """Read-only view of a configuration being validated.
+
+    Passed to validators that use the context calling convention instead of
+    expanding every previously validated key as keyword arguments. The view
+    is live: keys become visible as they are validated.
+    """
+
+    __slots__ = ("_config", "_parent", "_validator_args", "_root")
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        parent: Optional[Mapping] = None,
+        validator_args: Optional[Dict[str, Any]] = None,
+    ):
+        """Initialize.
+
+        Parameters
+        ----------
+        config
+            Validated keys
+        parent
+            Parent configuration, if any
+        validator_args
+            Validation options passed down to sub-validators
+        """
+        self._config = config
+        self._parent = parent
+        self._validator_args = (
+            validator_args if validator_args is not None else {}
+        )
+        self._root = None
+
+    @property
+    def parent(self) -> Optional[Mapping]:
+        """Get parent configuration."""
+        return self._parent
+
+    @property
+    def root(self) -> Mapping:
+        """Get top-level configuration."""
+        parent = self._parent
+        if parent is None:
+            return self
+        if self._root is None:
+            if isinstance(parent, ValidationContext):
+                self._root = parent.root
+            else:
+                # chain of keyword arguments
+                while parent is not None:
+                    root = parent
+                    parent = root.get("_parent")
+                self._root = root
+        return self._root
+
+    @property
+    def validator_args(self) -> Dict[str, Any]:
+        """Get validation options."""
+        return self._validator_args
+
+    def __getitem__(self, key: str) -> Any:
+        """Get validated value."""
+        try:
+            return self._config[key]
+        except KeyError:
+            # compatibility with parent chains of keyword arguments
+            if key == "_parent":
+                return self._parent
+            raise
+
+    def __contains__(self, key: object) -> bool:
+        """Get whether key was validated."""
+        return key in self._config
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over validated keys."""
+        return iter(self._config)
+
+    def __len__(self) -> int:
+        """Get number of validated keys."""
+        return len(self._config)
+
+    def __repr__(self) -> str:
+        """Get representation."""
+        return f"ValidationContext({self._config!r})"
+
+
+def get_context(kwargs: Dict[str, Any]) -> ValidationContext:
+    """Get validation context from validator keyword arguments.
+
+    Works with both calling conventions, so validators can support both.
+
+    Parameters
+    ----------
+    kwargs
+        Keyword arguments received by a validator
+    """
+    context = kwargs.get("_context")
+    if context is not None:
+        return context
+
+    return ValidationContext(
+        kwargs, kwargs.get("_parent"), kwargs.get("_validator_args")
+    )
+
+
+def uses_context(fn: Callable) -> Callable:
+    """Mark validation function as using the context calling convention.
+
+    Marked functions are called as ``fn(value, _context=context)``.
+    """
+    fn.uses_context = True
+    return fn
+
+
+class UnknownKeys:
+    """Unknown keys found while validating a configuration.
+
+    Shared by all levels of a validation when summarizing unknown keys, so
+    that they are reported once. Keys are recorded relative to the level
+    where they are found, and each parent level prepends its key or index.
+    """
+
+    __slots__ = ("paths",)
+
+    def __init__(self):
+        """Initialize."""
+        self.paths: List[Tuple[Union[str, int], ...]] = []
+
+    def add(self, key: str) -> None:
+        """Record an unknown key of the current level."""
+        self.paths.append((key,))
+
+    def add_parent(self, start: int, key: Union[str, int]) -> None:
+        """Prepend a key or index to the paths recorded since start."""
+        paths = self.paths
+        for index in range(start, len(paths)):
+            paths[index] = (key,) + paths[index]
+
+    def discard(self, start: int) -> None:
+        """Forget the paths recorded since start."""
+        del self.paths[start:]
@@ -1,5 +1,42 @@
 """Validation errors."""
 
+import reprlib
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+KeyPath = Tuple[Union[str, int], ...]
+
+# marks errors not related to a value
+_NO_VALUE = object()
+
+
+def format_path(path: KeyPath) -> str:
+    """Format key path, such as a.b[3].c.
+
+    Parameters
+    ----------
+    path
+        Key names and list indices
+    """
+    text = ""
+    for part in path:
+        if isinstance(part, int):
+            text += f"[{part}]"
+        elif text:
+            text += f".{part}"
+        else:
+            text = part
+    return text
+
 
 class ConfigurationError(Exception):
     """Generic configuration error."""
@@ -8,16 +45,93 @@ class ConfigurationError(Exception):
 class MissingRequiredKeyError(ConfigurationError):
     """Missing required key error.
 
-    Raised when a key that is described as required is not found.
+    Raised when keys that are described as required are not found; all
+    missing keys are reported at once.
     """
 
+    def __init__(self, message: str, keys: Iterable[str] = ()):
+        """Initialize.
+
+        Parameters
+        ----------
+        message
+            Error message
+        keys
+            Missing keys, in declaration order
+        """
+        super().__init__(message)
+        self.keys = tuple(keys)
+
 
 class MissingDependencyError(ConfigurationError):
     """Missing dependency error."""
 
 
+class CircularDependencyError(MissingDependencyError):
+    """Circular dependency error.
+
+    Raised when keys declare dependencies on each other.
+    """
+
+
 class ValidationError(ConfigurationError):
-    """Validation error."""
+    """Validation error.
+
+    Errors carry the path of the key that failed validation, which grows
+    as the error propagates out of sub-configurations, each level raising
+    a copy with its key prepended to the path; the path is only
+    formatted into the message when the error is converted to a string, and
+    format_path formats it as a.b[3].c.
+    """
+
+    _path: KeyPath = ()
+
+    @property
+    def path(self) -> KeyPath:
+        """Get path of the key that failed, e.g. ("a", "b", 3, "c")."""
+        return self._path
+
+    @property
+    def message(self) -> str:
+        """Get error message, without the key path."""
+        return super().__str__()
+
+    def with_parent(self, key: Union[str, int]) -> "ValidationError":
+        """Get a copy of the error, with a parent key prepended to the path.
+
+        The error itself is left untouched, so that instances raised more
+        than once don't accumulate paths. The copy keeps the traceback and
+        cause of the error, and is meant to be raised as
+        raise err.with_parent(key) from err.__cause__.
+
+        Parameters
+        ----------
+        key
+            Key name or list index
+        """
+        error = BaseException.__new__(type(self), *self.args)
+        error.__dict__.update(self.__dict__)
+        error._path = (key,) + self._path
+        error.__cause__ = self.__cause__
+        return error.with_traceback(self.__traceback__)
+
+    def __str__(self) -> str:
+        """Get error message, prefixed by each key in the path."""
+        prefix = "".join(
+            f"while validating element {key}: "
+            if isinstance(key, int)
+            else f"while validating key {key}: "
+            for key in self._path
+        )
+        return prefix + super().__str__()
+
+
+class ConfigurationTypeError(ConfigurationError, TypeError):
+    """Configuration type error.
+
+    Raised when a configuration is not a dictionary, or has keys that are
+    not strings; also a TypeError, as raised before.
+    """
 
 
 class KeyDeclarationError(ConfigurationError):
@@ -30,3 +144,159 @@ class UnknownKeyError(ConfigurationError):
 
 class DefaultValidatorError(ConfigurationError):
     """Default validator error."""
+
+
+class ErrorDetail(NamedTuple):
+    """Structured validation error."""
+
+    path: KeyPath
+    validator: str
+    message: str
+    value: str
+
+    def __str__(self) -> str:
+        """Get readable description."""
+        if not self.path:
+            return self.message
+        return f"{format_path(self.path)}: {self.message}"
+
+
+class ValidationErrors(ValidationError):
+    """Multiple validation errors.
+
+    Raised when collecting errors, after validation of the whole
+    configuration or when the maximum number of errors is reached.
+    """
+
+    def __init__(self, errors: List[ErrorDetail], truncated: bool = False):
+        """Initialize.
+
+        Parameters
+        ----------
+        errors
+            Errors found
+        truncated
+            Whether validation stopped at the maximum number of errors
+        """
+        self.errors = errors
+        self.truncated = truncated
+        header = f"{len(errors)} validation error(s)"
+        if truncated:
+            header += ", stopped at maximum number of errors"
+        super().__init__(
+            "\n  ".join([header + ":"] + [str(error) for error in errors])
+        )
+
+
+class ErrorCollector:
+    """Collect validation errors instead of raising the first one.
+
+    Pass an instance as the errors option of validate_config; it is passed
+    down to sub-validators. Validation continues past failing keys, keys
+    depending on failed keys are skipped, and ValidationErrors is raised
+    with all errors once the top-level configuration is validated. The
+    collector is reset at the start of each validation. Not thread-safe;
+    elements validated in parallel or lazily fail as a whole.
+    """
+
+    def __init__(self, max_errors: Optional[int] = 100):
+        """Initialize.
+
+        Parameters
+        ----------
+        max_errors
+            Stop validation when more errors than this are found, None for
+            no limit
+        """
+        if max_errors is not None and max_errors < 1:
+            raise ValueError("max_errors must be positive")
+        self._max_errors = max_errors
+        self._errors: List[ErrorDetail] = []
+        self._path: List[Union[str, int]] = []
+        self._suspended = 0
+
+    @property
+    def errors(self) -> List[ErrorDetail]:
+        """Get errors found."""
+        return self._errors
+
+    @property
+    def path(self) -> KeyPath:
+        """Get path of the key being validated."""
+        return tuple(self._path)
+
+    @property
+    def active(self) -> bool:
+        """Get if errors are being collected."""
+        return not self._suspended
+
+    def __len__(self) -> int:
+        """Get number of errors found."""
+        return len(self._errors)
+
+    def clear(self) -> None:
+        """Discard errors found."""
+        self._errors.clear()
+        self._path.clear()
+        self._suspended = 0
+
+    def enter(self, key: Union[str, int]) -> None:
+        """Start validating a key or list element."""
+        self._path.append(key)
+
+    def leave(self) -> None:
+        """Finish validating a key or list element."""
+        self._path.pop()
+
+    @contextmanager
+    def suspend(self) -> Iterator[None]:
+        """Raise errors as they are found, e.g. while trying alternatives."""
+        self._suspended += 1
+        try:
+            yield
+        finally:
+            self._suspended -= 1
+
+    def add(
+        self,
+        error: Exception,
+        validator: str = "",
+        value: Any = _NO_VALUE,
+        key: Optional[Union[str, int]] = None,
+    ) -> None:
+        """Record an error.
+
+        Parameters
+        ----------
+        error
+            The error
+        validator
+            Name of the validator that failed
+        value
+            The invalid value, of which an excerpt is recorded
+        key
+            Key appended to the current path, if the error is not about the
+            key being validated
+
+        Raises ValidationErrors, marked as truncated, when an error is found
+        after the maximum number of errors.
+        """
+        if (
+            self._max_errors is not None
+            and len(self._errors) >= self._max_errors
+        ):
+            # more errors than reported
+            raise self.exception(truncated=True)
+        path = tuple(self._path) if key is None else (*self._path, key)
+        if isinstance(error, ValidationError):
+            # raised from nested validation that doesn't collect errors
+            path += error.path
+            message = error.message
+        else:
+            message = str(error)
+        excerpt = "" if value is _NO_VALUE else reprlib.repr(value)
+        self._errors.append(ErrorDetail(path, validator, message, excerpt))
+
+    def exception(self, truncated: bool = False) -> ValidationErrors:
+        """Get exception reporting the errors found."""
+        return ValidationErrors(list(self._errors), truncated)
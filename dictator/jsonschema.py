@@ -0,0 +1,426 @@
+"""Convert JSON Schema documents into validator declarations."""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from dictator.errors import KeyDeclarationError, ValidationError
+from dictator.schema import CompiledSchema, compile_schema
+from dictator.validators import Validator
+from dictator.validators.base import validate_null
+from dictator.validators.lists import (
+    HomogeneousValidator,
+    SubListValidator,
+)
+from dictator.validators.maps import SubDictValidator
+from dictator.validators.util import ValidateUnion
+
+JSON_TYPES = {
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "array": (list, tuple),
+    "object": (dict,),
+}
+
+# keywords without effect on validation
+ANNOTATION_KEYWORDS = frozenset(
+    (
+        "$schema",
+        "$id",
+        "$comment",
+        "title",
+        "description",
+        "default",
+        "examples",
+    )
+)
+SUPPORTED_KEYWORDS = frozenset(
+    (
+        "type",
+        "enum",
+        "minimum",
+        "maximum",
+        "required",
+        "properties",
+        "items",
+        "additionalProperties",
+    )
+)
+# keywords of array items validated as sub-configurations
+_OBJECT_ITEM_KEYWORDS = ANNOTATION_KEYWORDS | {
+    "type",
+    "properties",
+    "required",
+    "additionalProperties",
+}
+
+
+class ValidateJSONType(Validator):
+    """JSON type validator.
+
+    Validates that a value is of a JSON Schema type; booleans are not
+    accepted as integers or numbers, and floats without a fractional part
+    are accepted as integers.
+    """
+
+    __slots__ = ("_json_type", "_types")
+
+    _DEFAULT_NAME = "json_type"
+    _USES_CONTEXT = True
+
+    def __init__(self, json_type: str, **kwargs: Any):
+        """Initialize.
+
+        Parameters
+        ----------
+        json_type
+            JSON Schema type name
+        kwargs
+            Any other metadata
+        """
+        super().__init__()
+        if json_type not in JSON_TYPES:
+            raise KeyDeclarationError(f"unknown JSON type: '{json_type}'")
+        self._json_type = json_type
+        self._types = JSON_TYPES[json_type]
+
+    def check_type(self, _type: type) -> Optional[bool]:
+        """Check if values of a type can pass validation."""
+        if issubclass(_type, bool) and self._json_type != "boolean":
+            return False
+        if self._json_type == "integer" and issubclass(_type, float):
+            # depends on the value
+            return None
+        return issubclass(_type, self._types)
+
+    def validate(self, _value, **kwargs):
+        """Perform validation."""
+        passes = self.check_type(type(_value))
+        if passes is None:
+            passes = _value.is_integer()
+        if not passes:
+            raise ValidationError(
+                f"value has unexpected type: {type(_value).__name__}, "
+                f"expected {self._json_type}"
+            )
+        return _value
+
+
+class ValidateNumberRange(Validator):
+    """Number range validator.
+
+    Validate that a number is within a range.
+    """
+
+    __slots__ = ("_start", "_end")
+
+    _DEFAULT_NAME = "number_range"
+    _USES_CONTEXT = True
+
+    def __init__(
+        self,
+        start: Union[int, float, None],
+        end: Union[int, float, None],
+        **kwargs: Any,
+    ):
+        """Initialize.
+
+        Parameters
+        ----------
+        start
+            Start of range interval (can be None for open interval)
+        end
+            End of range interval (can be None for open interval)
+        kwargs
+            Any other metadata
+        """
+        super().__init__()
+        self._start = start
+        self._end = end
+
+    def validate(self, _value, **kwargs):
+        """Perform validation; values that are not numbers pass."""
+        if not _is_number(_value):
+            return _value
+        if (self._start is not None and _value < self._start) or (
+            self._end is not None and _value > self._end
+        ):
+            raise ValidationError(
+                "value out of [{}, {}] range".format(self._start, self._end)
+            )
+        return _value
+
+
+def _is_number(value: Any) -> bool:
+    """Get if a value is a JSON number."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _json_key(value: Any) -> Any:
+    """Get hashable key of a value, equal only for equal JSON values."""
+    if isinstance(value, bool):
+        return ("boolean", value)
+    if _is_number(value):
+        return ("number", value)
+    if isinstance(value, (list, tuple)):
+        return ("array", tuple(_json_key(item) for item in value))
+    if isinstance(value, dict):
+        return (
+            "object",
+            frozenset((key, _json_key(item)) for key, item in value.items()),
+        )
+    return (type(value).__name__, value)
+
+
+class ValidateJSONEnum(Validator):
+    """JSON enumeration validator.
+
+    Validates that a value is equal to one of the choices; unlike
+    ValidateChoice, booleans are not equal to numbers.
+    """
+
+    __slots__ = ("_choices", "_keys")
+
+    _DEFAULT_NAME = "json_enum"
+    _USES_CONTEXT = True
+
+    def __init__(self, *choices: Any, **kwargs: Any):
+        """Initialize.
+
+        Parameters
+        ----------
+        choices
+            Allowed values
+        kwargs
+            Any other metadata
+        """
+        super().__init__()
+        self._choices = choices
+        self._keys = frozenset(_json_key(choice) for choice in choices)
+
+    def validate(self, _value, **kwargs):
+        """Perform validation."""
+        try:
+            valid = _json_key(_value) in self._keys
+        except TypeError:
+            valid = False
+        if not valid:
+            choices = ", ".join(str(choice) for choice in self._choices)
+            raise ValidationError(
+                f"value '{_value}' is not a valid choice, "
+                f"choose from [{choices}]"
+            )
+        return _value
+
+
+class _ValidateIfType(Validator):
+    """Apply a validator to values of a JSON type only."""
+
+    __slots__ = ("_type", "_validate")
+
+    _USES_CONTEXT = True
+
+    def __init__(self, json_type: str, validator: Validator):
+        """Initialize."""
+        super().__init__()
+        self._type = ValidateJSONType(json_type)
+        self._validate = validator.validate
+
+    def validate(self, _value, **kwargs):
+        """Perform validation."""
+        if not self._type.check_type(type(_value)):
+            return _value
+        return self._validate(_value, **kwargs)
+
+
+class _ValidateAll(Validator):
+    """Apply validators in sequence."""
+
+    __slots__ = ("_validators",)
+
+    _USES_CONTEXT = True
+
+    def __init__(self, *validators: Validator):
+        """Initialize."""
+        super().__init__()
+        self._validators = [validator.validate for validator in validators]
+
+    def validate(self, _value, **kwargs):
+        """Perform validation."""
+        for validate_fn in self._validators:
+            new_value = validate_fn(_value, **kwargs)
+            if new_value is not None:
+                _value = new_value
+        return _value
+
+
+def _check_keywords(schema: Dict[str, Any]) -> None:
+    """Check that only supported keywords are used."""
+    for keyword in schema:
+        if keyword in SUPPORTED_KEYWORDS or keyword in ANNOTATION_KEYWORDS:
+            continue
+        raise KeyDeclarationError(
+            f"unsupported JSON schema keyword: '{keyword}'"
+        )
+
+
+def _convert_type(json_type: Union[str, List[str]]) -> Validator:
+    """Convert type keyword."""
+    if isinstance(json_type, str):
+        json_type = [json_type]
+    conditions = [
+        validate_null if name == "null" else ValidateJSONType(name)
+        for name in json_type
+    ]
+    if len(conditions) == 1:
+        if conditions[0] is validate_null:
+            return ValidateUnion(None)
+        return conditions[0]
+    return ValidateUnion(*conditions)
+
+
+def _convert_object(
+    schema: Dict[str, Any]
+) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, bool]]:
+    """Convert object keywords into key declarations and options."""
+    properties = schema.get("properties", {})
+    required = schema.get("required", [])
+    for key in required:
+        if key not in properties:
+            properties = {**properties, key: True}
+
+    required_keys = {}
+    optional_keys = {}
+    for key, prop_schema in properties.items():
+        target = required_keys if key in required else optional_keys
+        target[key] = convert_json_schema(prop_schema)
+
+    additional = schema.get("additionalProperties", True)
+    if not isinstance(additional, bool):
+        raise KeyDeclarationError(
+            "only boolean additionalProperties are supported"
+        )
+    options = {"allow_unknown": additional, "gobble_unknown": False}
+    return required_keys, optional_keys, options
+
+
+def convert_json_schema(
+    schema: Union[Dict[str, Any], bool]
+) -> Optional[Callable]:
+    """Convert a JSON Schema into a validator.
+
+    Parameters
+    ----------
+    schema
+        JSON Schema describing a value
+
+    Returns None if the schema accepts any value.
+    """
+    if schema is True or schema == {}:
+        return None
+    if not isinstance(schema, dict):
+        raise KeyDeclarationError("JSON schema must be an object or true")
+    _check_keywords(schema)
+
+    validators = []
+    json_type = schema.get("type")
+    if json_type is not None:
+        validators.append(_convert_type(json_type))
+    if "enum" in schema:
+        validators.append(ValidateJSONEnum(*schema["enum"]))
+    if "minimum" in schema or "maximum" in schema:
+        validators.append(
+            ValidateNumberRange(schema.get("minimum"), schema.get("maximum"))
+        )
+    # items, properties and required only constrain arrays and objects
+    if "items" in schema:
+        items = schema["items"]
+        if (
+            isinstance(items, dict)
+            and items.get("type") == "object"
+            and set(items) <= _OBJECT_ITEM_KEYWORDS
+        ):
+            # elements validated as sub-configurations
+            required_keys, optional_keys, options = _convert_object(items)
+            validators.append(
+                _ValidateIfType(
+                    "array",
+                    _ValidateAll(
+                        HomogeneousValidator(ValidateJSONType("object")),
+                        SubListValidator(
+                            required_keys, optional_keys, options
+                        ),
+                    ),
+                )
+            )
+        else:
+            item_validator = convert_json_schema(items)
+            if item_validator is not None:
+                validators.append(
+                    _ValidateIfType(
+                        "array", HomogeneousValidator(item_validator)
+                    )
+                )
+    if "properties" in schema or "required" in schema:
+        required_keys, optional_keys, options = _convert_object(schema)
+        validators.append(
+            _ValidateIfType(
+                "object",
+                SubDictValidator(required_keys, optional_keys, options),
+            )
+        )
+    elif "additionalProperties" in schema:
+        raise KeyDeclarationError(
+            "additionalProperties requires properties or required"
+        )
+
+    if not validators:
+        return None
+    if len(validators) == 1:
+        return validators[0]
+    return _ValidateAll(*validators)
+
+
+def from_json_schema(
+    schema: Dict[str, Any]
+) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, bool]]:
+    """Convert a JSON Schema describing a configuration.
+
+    Parameters
+    ----------
+    schema
+        JSON Schema describing an object
+
+    Returns required keys, optional keys and validation options for use with
+    validate_config.
+    """
+    if not isinstance(schema, dict):
+        raise KeyDeclarationError("JSON schema must be an object")
+    _check_keywords(schema)
+    if schema.get("type", "object") != "object":
+        raise KeyDeclarationError("configuration schema must be an object")
+    for keyword in ("enum", "minimum", "maximum", "items"):
+        if keyword in schema:
+            raise KeyDeclarationError(
+                f"unsupported keyword for configuration schema: '{keyword}'"
+            )
+
+    return _convert_object(schema)
+
+
+def compile_json_schema(
+    schema: Dict[str, Any], **options: Any
+) -> CompiledSchema:
+    """Compile a JSON Schema describing a configuration.
+
+    Parameters
+    ----------
+    schema
+        JSON Schema describing an object
+    options
+        Other validation options, same as in validate_config
+    """
+    required_keys, optional_keys, schema_options = from_json_schema(schema)
+    return compile_schema(
+        required_keys, optional_keys, **{**schema_options, **options}
+    )
@@ -0,0 +1,233 @@
+"""Lazily validated configurations."""
+
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from dictator.context import UnknownKeys, ValidationContext
+from dictator.errors import (
+    CircularDependencyError,
+    MissingDependencyError,
+    ValidationError,
+)
+from dictator.profiler import ValidationProfiler
+from dictator.validators.dependency import DeferValidation
+import dictator.config
+
+
+class LazyConfig(Mapping):
+    """Configuration whose keys are validated on first access.
+
+    Returned by validate_config when lazy is True. Required and unknown keys
+    are checked when created, but each key is only validated the first time
+    it is accessed, after the keys it declares dependencies on or defers
+    validation to; validated values are kept. Validators see the keys
+    validated so far, so validators reading other keys must declare them as
+    dependencies or defer validation until they are present. Iteration and
+    membership tests do not validate keys.
+    """
+
+    __slots__ = (
+        "_config",
+        "_keys",
+        "_pending",
+        "_depends",
+        "_context",
+        "_validator_args",
+        "_parent",
+        "_active",
+        "_unknown",
+        "_validate_key",
+    )
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        required_keys: Dict[str, Any],
+        optional_keys: Optional[Dict[str, Any]],
+        verbosity: str,
+        log_fn: Optional[Callable],
+        allow_unknown: bool,
+        gobble_unknown: bool,
+        inherit_options: bool,
+        pop_extra_kwargs: bool,
+        parent_keys: Optional[Dict[str, Any]],
+        extra_kwargs: Dict[str, Any],
+        profiler: Optional[ValidationProfiler] = None,
+        summarize_unknown: bool = False,
+        keys: Optional[Dict[str, Any]] = None,
+    ):
+        """Initialize.
+
+        Parameters are the same as those of validate_config, and keys is the
+        table merging required and optional keys, if already computed.
+        """
+        if inherit_options:
+            allow_unknown = parent_keys.get("allow_unknown", allow_unknown)
+            gobble_unknown = parent_keys.get("gobble_unknown", gobble_unknown)
+
+        # pass validation config args down
+        vargs = {
+            "verbosity": verbosity,
+            "allow_unknown": allow_unknown,
+            "gobble_unknown": gobble_unknown,
+        }
+        if log_fn is not None:
+            vargs["log_fn"] = log_fn
+        self._unknown = None
+        if summarize_unknown:
+            self._unknown = vargs["summarize_unknown"] = UnknownKeys()
+        if profiler is not None:
+            vargs["profiler"] = profiler
+
+        self._config = extra_kwargs.copy()
+        self._context = ValidationContext(self._config, parent_keys, vargs)
+        self._validator_args = vargs
+        self._parent = parent_keys
+        pending, self._depends = dictator.config._collect_entries(
+            config,
+            dictator.config._merge_keys(required_keys, optional_keys)
+            if keys is None
+            else keys,
+            dictator.config._resolve_validator,
+            self._config,
+            verbosity,
+            log_fn,
+            allow_unknown,
+            gobble_unknown,
+            self._unknown,
+        )
+        if profiler is not None:
+            pending = [
+                (key, value, profiler.wrap(key, fn), with_context)
+                for key, value, fn, with_context in pending
+            ]
+        self._pending = {entry[0]: entry for entry in pending}
+
+        # keys of the validated configuration
+        self._keys = dict.fromkeys(self._config)
+        self._keys.update(dict.fromkeys(self._pending))
+        if pop_extra_kwargs:
+            for kwarg in extra_kwargs:
+                self._keys.pop(kwarg, None)
+        # keys being validated, outermost first
+        self._active: List[str] = []
+        self._validate_key = self._call
+        if self._unknown is not None:
+            self._validate_key = dictator.config._track_unknown(
+                self._call, self._unknown
+            )
+            self._log_unknown()
+
+    @property
+    def pending(self) -> Tuple[str, ...]:
+        """Get keys not validated yet."""
+        return tuple(self._pending)
+
+    def _log_unknown(self) -> None:
+        """Log unknown keys found since last logged."""
+        dictator.config._log_unknown(
+            self._unknown,
+            self._validator_args.get("log_fn"),
+            self._validator_args["verbosity"],
+        )
+        self._unknown.discard(0)
+
+    def _call(
+        self, key: str, value: Any, fn: Callable, with_context: bool
+    ) -> Any:
+        """Call validation function of a key."""
+        try:
+            if with_context:
+                new_value = fn(value, _context=self._context)
+            else:
+                new_value = fn(
+                    value,
+                    _validator_args=self._validator_args,
+                    _parent=self._parent,
+                    **self._config,
+                )
+            dictator.config._reject_awaitable(new_value)
+            return new_value
+        except ValidationError as err:
+            raise err.with_parent(key) from err.__cause__
+
+    def _validate(self, key: str) -> None:
+        """Validate a key, after the keys it depends on."""
+        if key in self._active:
+            cycle = " -> ".join(
+                self._active[self._active.index(key) :] + [key]
+            )
+            raise CircularDependencyError(
+                f"circular dependency between keys: {cycle}"
+            )
+
+        entry = self._pending[key]
+        self._active.append(key)
+        try:
+            for dep in self._depends.get(key, ()):
+                if dep in self._pending:
+                    self._validate(dep)
+            while True:
+                try:
+                    new_value = self._validate_key(*entry)
+                    break
+                except DeferValidation as ex:
+                    # validate keys waited for, if they can be
+                    depends = [
+                        dep
+                        for dep in ex.depends
+                        if dep in self._pending and dep not in self._active
+                    ]
+                    if not depends:
+                        readable_depends = ", ".join(ex.depends)
+                        raise MissingDependencyError(
+                            f"unresolved dependencies found for key "
+                            f"'{key}':'{readable_depends}'"
+                        ) from None
+                for dep in depends:
+                    self._validate(dep)
+        finally:
+            self._active.pop()
+            if not self._active and self._unknown is not None:
+                self._log_unknown()
+
+        del self._pending[key]
+        self._config[key] = entry[1] if new_value is None else new_value
+
+    def validate_all(self) -> Dict[str, Any]:
+        """Validate all keys not validated yet.
+
+        Returns the validated configuration, as returned by validate_config
+        when not lazy.
+        """
+        for key in list(self._pending):
+            if key in self._pending:
+                self._validate(key)
+        return {key: self._config[key] for key in self._keys}
+
+    def __getitem__(self, key: str) -> Any:
+        """Get validated value, validating it if needed."""
+        if key not in self._keys:
+            raise KeyError(key)
+        if key in self._pending:
+            self._validate(key)
+        return self._config[key]
+
+    def __contains__(self, key: object) -> bool:
+        """Get if key is in the configuration, without validating it."""
+        return key in self._keys
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over keys."""
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        """Get number of keys."""
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        """Get representation."""
+        return (
+            f"<LazyConfig: {len(self._keys)} keys, "
+            f"{len(self._pending)} not validated>"
+        )
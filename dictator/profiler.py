@@ -0,0 +1,181 @@
+"""Validation profiling."""
+
+from time import perf_counter
+from typing import IO, Callable, Dict, List, Optional, Tuple
+
+from dictator.validators.base import ValidatorFactory
+from dictator.validators.dependency import DeferValidation
+
+KeyPath = Tuple[str, ...]
+
+REPORT_COLUMNS = ("calls", "cumulative", "self", "deferrals", "errors")
+
+
+def _describe(fn: Callable) -> str:
+    """Get readable name of a validation function."""
+    owner = getattr(fn, "__self__", None)
+    if isinstance(owner, ValidatorFactory):
+        return _describe(owner._validatefn)
+    if owner is not None:
+        return type(owner).__name__
+    return getattr(fn, "__qualname__", repr(fn))
+
+
+class KeyProfile:
+    """Profiling statistics of a key path."""
+
+    __slots__ = (
+        "validator",
+        "calls",
+        "cumulative",
+        "self_time",
+        "deferrals",
+        "errors",
+    )
+
+    def __init__(self, validator: str):
+        """Initialize.
+
+        Parameters
+        ----------
+        validator
+            Name of the validator used for the key
+        """
+        self.validator = validator
+        self.calls = 0
+        self.cumulative = 0.0
+        self.self_time = 0.0
+        self.deferrals = 0
+        self.errors = 0
+
+    def __repr__(self) -> str:
+        """Get representation."""
+        return (
+            f"KeyProfile(validator={self.validator!r}, calls={self.calls}, "
+            f"cumulative={self.cumulative:.6f}, self={self.self_time:.6f}, "
+            f"deferrals={self.deferrals}, errors={self.errors})"
+        )
+
+
+class ValidationProfiler:
+    """Record time spent validating each key.
+
+    Pass an instance as the profiler option of validate_config; it is passed
+    down to sub-validators, so nested keys are recorded under their dotted
+    key path. Elements of lists validated by SubListValidator are aggregated
+    under the same path. Not thread-safe; elements validated in parallel or
+    lazily are only accounted for in the time of the list key itself.
+    """
+
+    def __init__(self):
+        """Initialize."""
+        self._stats: Dict[KeyPath, KeyProfile] = {}
+        # active keys: [path, start time, time spent in nested keys]
+        self._stack: List[list] = []
+
+    @property
+    def stats(self) -> Dict[KeyPath, KeyProfile]:
+        """Get statistics by key path."""
+        return self._stats
+
+    def reset(self) -> None:
+        """Discard recorded statistics."""
+        self._stats.clear()
+        self._stack.clear()
+
+    def wrap(self, key: str, fn: Callable) -> Callable:
+        """Wrap validation function of a key to record its statistics.
+
+        Parameters
+        ----------
+        key
+            Key name
+        fn
+            Function performing the validation of the key
+        """
+        stack = self._stack
+        path = stack[-1][0] + (key,) if stack else (key,)
+        stats = self._stats.get(path)
+        if stats is None:
+            stats = self._stats[path] = KeyProfile(_describe(fn))
+
+        def _profiled(*args, **kwargs):
+            frame = [path, perf_counter(), 0.0]
+            stack.append(frame)
+            try:
+                return fn(*args, **kwargs)
+            except DeferValidation:
+                stats.deferrals += 1
+                raise
+            except Exception:
+                stats.errors += 1
+                raise
+            finally:
+                elapsed = perf_counter() - frame[1]
+                stack.pop()
+                if stack:
+                    stack[-1][2] += elapsed
+                stats.calls += 1
+                stats.cumulative += elapsed
+                stats.self_time += elapsed - frame[2]
+
+        return _profiled
+
+    def report(
+        self, sort_by: str = "cumulative", limit: Optional[int] = None
+    ) -> str:
+        """Get a report of the recorded statistics.
+
+        Parameters
+        ----------
+        sort_by
+            One of calls, cumulative, self, deferrals or errors
+        limit
+            Maximum number of keys in the report
+        """
+        if sort_by not in REPORT_COLUMNS:
+            raise ValueError(
+                f"cannot sort by '{sort_by}', choose from "
+                + ", ".join(REPORT_COLUMNS)
+            )
+        attr = "self_time" if sort_by == "self" else sort_by
+        entries = sorted(
+            self._stats.items(),
+            key=lambda item: getattr(item[1], attr),
+            reverse=True,
+        )
+        if limit is not None:
+            entries = entries[:limit]
+
+        paths = [".".join(path) for path, _ in entries]
+        width = max([len("key")] + [len(path) for path in paths])
+        lines = [
+            f"{'key':<{width}}  {'validator':<24}{'calls':>8}"
+            f"{'cumul (ms)':>12}{'self (ms)':>12}{'deferrals':>11}"
+            f"{'errors':>8}"
+        ]
+        for path, (_, stats) in zip(paths, entries):
+            lines.append(
+                f"{path:<{width}}  {stats.validator:<24.24}{stats.calls:>8}"
+                f"{stats.cumulative * 1e3:>12.3f}"
+                f"{stats.self_time * 1e3:>12.3f}"
+                f"{stats.deferrals:>11}{stats.errors:>8}"
+            )
+
+        return "\n".join(lines)
+
+    def dump_collapsed(self, fp: IO) -> None:
+        """Write statistics as collapsed stacks.
+
+        The output can be rendered by flamegraph tools; samples are self time
+        in microseconds.
+
+        Parameters
+        ----------
+        fp
+            File-like object opened in text mode
+        """
+        for path, stats in self._stats.items():
+            samples = round(stats.self_time * 1e6)
+            if samples > 0:
+                fp.write(f"{';'.join(path)} {samples}\n")
@@ -0,0 +1,451 @@
+"""Compiled validation schemas."""
+
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+from typing import Union
+
+from dictator.config import (
+    ConfigurationType,
+    LogFunction,
+    ResolvedValidator,
+    ValidatorConfiguration,
+    _check_declaration,
+    _merge_keys,
+    _missing_keys_error,
+    _resolve_validator,
+    _validate_entries,
+)
+from dictator.errors import (
+    ConfigurationError,
+    ConfigurationTypeError,
+    ErrorCollector,
+)
+from dictator.profiler import ValidationProfiler
+from dictator.cache import ValidationCache
+from dictator.validators import _is_impure
+from dictator.validators.replace import _find_parent_references
+
+
+def _same_value(old: Any, new: Any) -> bool:
+    """Get whether a configuration value is unchanged."""
+    return type(old) is type(new) and old == new
+
+
+class CompiledSchema:
+    """Reusable validation plan.
+
+    Holds key declarations with validation functions already resolved, so
+    that validating a configuration skips declaration checks and validator
+    lookups entirely. Instances are immutable; build them with
+    :func:`compile_schema`.
+    """
+
+    __slots__ = (
+        "_required",
+        "_optional",
+        "_required_set",
+        "_keys",
+        "_verbosity",
+        "_log_fn",
+        "_allow_unknown",
+        "_gobble_unknown",
+        "_inherit_options",
+        "_pop_extra_kwargs",
+        "_profiler",
+        "_summarize_unknown",
+        "_cache",
+        "_errors",
+        "_impure",
+        "_generated",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        required_keys: Dict[str, ResolvedValidator],
+        optional_keys: Optional[Dict[str, ResolvedValidator]],
+        verbosity: str = "error",
+        log_fn: Optional[LogFunction] = None,
+        allow_unknown: bool = True,
+        gobble_unknown: bool = True,
+        inherit_options: bool = False,
+        pop_extra_kwargs: bool = False,
+        profiler: Optional[ValidationProfiler] = None,
+        summarize_unknown: bool = False,
+        cache: Optional[ValidationCache] = None,
+        errors: Optional[ErrorCollector] = None,
+    ):
+        """Initialize.
+
+        Parameters
+        ----------
+        required_keys
+            Mapping of required keys to resolved validators
+        optional_keys
+            Mapping of optional keys to resolved validators
+        verbosity, log_fn, allow_unknown, gobble_unknown, inherit_options, \
+        pop_extra_kwargs, profiler, summarize_unknown, cache, errors
+            Default validation options, see validate_config
+        """
+        _set = super().__setattr__
+        _set("_required", MappingProxyType(dict(required_keys)))
+        _set(
+            "_optional",
+            None
+            if optional_keys is None
+            else MappingProxyType(dict(optional_keys)),
+        )
+        _set("_required_set", frozenset(required_keys))
+        # single lookup table of declared keys
+        _set("_keys", _merge_keys(dict(required_keys), optional_keys))
+        _set("_verbosity", verbosity)
+        _set("_log_fn", log_fn)
+        _set("_allow_unknown", allow_unknown)
+        _set("_gobble_unknown", gobble_unknown)
+        _set("_inherit_options", inherit_options)
+        _set("_pop_extra_kwargs", pop_extra_kwargs)
+        _set("_profiler", profiler)
+        _set("_summarize_unknown", summarize_unknown)
+        _set("_cache", cache)
+        _set("_errors", errors)
+        # computed on first use, sub-validators compile lazily
+        _set("_impure", None)
+        # specialized validation function, see dictator.codegen
+        _set("_generated", None)
+
+    def __setattr__(self, name, value):
+        """Disallow modification."""
+        raise AttributeError("compiled schemas are immutable")
+
+    def __delattr__(self, name):
+        """Disallow modification."""
+        raise AttributeError("compiled schemas are immutable")
+
+    @property
+    def required_keys(self) -> Mapping[str, ResolvedValidator]:
+        """Get required keys and their validation functions."""
+        return self._required
+
+    @property
+    def optional_keys(self) -> Optional[Mapping[str, ResolvedValidator]]:
+        """Get optional keys and their validation functions."""
+        return self._optional
+
+    @property
+    def options(self) -> Dict[str, Any]:
+        """Get default validation options."""
+        return {
+            "verbosity": self._verbosity,
+            "log_fn": self._log_fn,
+            "allow_unknown": self._allow_unknown,
+            "gobble_unknown": self._gobble_unknown,
+            "inherit_options": self._inherit_options,
+            "pop_extra_kwargs": self._pop_extra_kwargs,
+            "profiler": self._profiler,
+            "summarize_unknown": self._summarize_unknown,
+            "cache": self._cache,
+            "errors": self._errors,
+        }
+
+    @property
+    def impure(self) -> bool:
+        """Get if any validator is marked as impure."""
+        if self._impure is None:
+            entries = list(self._required.values())
+            if self._optional is not None:
+                entries.extend(self._optional.values())
+            super().__setattr__(
+                "_impure",
+                any(
+                    entry is not None and _is_impure(entry[0])
+                    for entry in entries
+                ),
+            )
+        return self._impure
+
+    def validate(
+        self,
+        config: ConfigurationType,
+        parent_keys: Optional[Dict[str, Any]] = None,
+        verbosity: Optional[str] = None,
+        log_fn: Optional[LogFunction] = None,
+        allow_unknown: Optional[bool] = None,
+        gobble_unknown: Optional[bool] = None,
+        inherit_options: Optional[bool] = None,
+        pop_extra_kwargs: Optional[bool] = None,
+        profiler: Optional[ValidationProfiler] = None,
+        summarize_unknown: Optional[bool] = None,
+        cache: Optional[ValidationCache] = None,
+        errors: Optional[ErrorCollector] = None,
+        **extra_kwargs: Any,
+    ):
+        """Validate configuration.
+
+        Parameters
+        ----------
+        config
+            The configuration
+        parent_keys
+            Parent configuration, if this is a sub-configuration
+        verbosity, log_fn, allow_unknown, gobble_unknown, inherit_options, \
+        pop_extra_kwargs, profiler, summarize_unknown, cache, errors
+            Override schema options for this validation only
+        extra_kwargs
+            Extra keys made available to validators
+        """
+        if errors is None:
+            errors = self._errors
+        self._check_config(config, errors is None)
+        return self._validate(
+            config,
+            parent_keys,
+            extra_kwargs,
+            verbosity,
+            log_fn,
+            allow_unknown,
+            gobble_unknown,
+            inherit_options,
+            pop_extra_kwargs,
+            profiler,
+            summarize_unknown,
+            cache,
+            errors,
+        )
+
+    def revalidate(
+        self,
+        previous: Dict[str, Any],
+        old_config: ConfigurationType,
+        new_config: ConfigurationType,
+        parent_keys: Optional[Dict[str, Any]] = None,
+        **options: Any,
+    ):
+        """Validate a modified configuration, reusing a previous result.
+
+        Only keys that changed, keys that depend on them through declared
+        dependencies or fragment references, and keys with impure validators
+        are validated again; other keys are taken from the previous result.
+
+        Parameters
+        ----------
+        previous
+            Result of validating the old configuration
+        old_config
+            The old configuration
+        new_config
+            The modified configuration
+        parent_keys
+            Parent configuration, if this is a sub-configuration
+        options
+            Override schema options, except pop_extra_kwargs; must be the
+            same options used to validate the old configuration
+        """
+        errors = options.get("errors", self._errors)
+        self._check_config(new_config, errors is None)
+
+        dirty = {
+            key
+            for key, value in new_config.items()
+            if key not in old_config
+            or not _same_value(old_config[key], value)
+        }
+        dirty.update(key for key in old_config if key not in new_config)
+
+        # reverse dependencies: key -> keys depending on it
+        dependents: Dict[str, List[str]] = {}
+        for key, value in new_config.items():
+            entry = self._get_entry(key)
+            if entry is None:
+                continue
+            fn, _, get_dependencies = entry
+            if _is_impure(fn):
+                dirty.add(key)
+            if get_dependencies is not None:
+                for dep in get_dependencies(value):
+                    dependents.setdefault(dep, []).append(key)
+            references = set()
+            _find_parent_references(value, references)
+            for dep in references:
+                # nested values referencing keys of this level
+                dependents.setdefault(dep, []).append(key)
+
+        pending = list(dirty)
+        while pending:
+            for key in dependents.get(pending.pop(), ()):
+                if key not in dirty:
+                    dirty.add(key)
+                    pending.append(key)
+
+        changed = {}
+        unchanged = {}
+        for key, value in new_config.items():
+            if key in dirty:
+                changed[key] = value
+            elif key in previous:
+                unchanged[key] = previous[key]
+
+        options["pop_extra_kwargs"] = False
+        result = self._validate(changed, parent_keys, unchanged, **options)
+        return {key: result[key] for key in new_config if key in result}
+
+    def _set_generated(self, validate_fn: Callable) -> None:
+        """Keep specialized validation function, see dictator.codegen."""
+        super().__setattr__("_generated", validate_fn)
+
+    def _get_entry(self, key: str, default: Any = None) -> ResolvedValidator:
+        """Get resolved validator of a key, None if not validated.
+
+        Keys that are not declared get default.
+        """
+        return self._keys.get(key, default)
+
+    def _check_config(
+        self, config: ConfigurationType, check_required: bool = True
+    ) -> None:
+        """Check configuration type and required keys."""
+        if not isinstance(config, dict):
+            raise ConfigurationTypeError(
+                f"configuration must be a dictionary, got: {type(config)}"
+            )
+        if not check_required:
+            # reported along with other errors
+            return
+        if not config.keys() >= self._required_set:
+            raise _missing_keys_error(self._required, config)
+
+    def _validate(
+        self,
+        config: ConfigurationType,
+        parent_keys: Optional[Dict[str, Any]],
+        extra_kwargs: Dict[str, Any],
+        verbosity: Optional[str] = None,
+        log_fn: Optional[LogFunction] = None,
+        allow_unknown: Optional[bool] = None,
+        gobble_unknown: Optional[bool] = None,
+        inherit_options: Optional[bool] = None,
+        pop_extra_kwargs: Optional[bool] = None,
+        profiler: Optional[ValidationProfiler] = None,
+        summarize_unknown: Optional[bool] = None,
+        cache: Optional[ValidationCache] = None,
+        errors: Optional[ErrorCollector] = None,
+    ):
+        """Validate entries, applying option overrides."""
+        return _validate_entries(
+            config,
+            self._required,
+            self._optional,
+            None,
+            self._verbosity if verbosity is None else verbosity,
+            self._log_fn if log_fn is None else log_fn,
+            self._allow_unknown if allow_unknown is None else allow_unknown,
+            self._gobble_unknown
+            if gobble_unknown is None
+            else gobble_unknown,
+            self._inherit_options
+            if inherit_options is None
+            else inherit_options,
+            self._pop_extra_kwargs
+            if pop_extra_kwargs is None
+            else pop_extra_kwargs,
+            parent_keys,
+            extra_kwargs,
+            self._profiler if profiler is None else profiler,
+            self._summarize_unknown
+            if summarize_unknown is None
+            else summarize_unknown,
+            self._cache if cache is None else cache,
+            self._errors if errors is None else errors,
+            self._keys,
+        )
+
+
+def compile_schema(
+    required_keys: Optional[ValidatorConfiguration] = None,
+    optional_keys: Optional[ValidatorConfiguration] = None,
+    **options: Any,
+) -> CompiledSchema:
+    """Compile key declarations into a reusable validation plan.
+
+    Parameters
+    ----------
+    required_keys
+        Mapping of required keys and validators
+    optional_keys
+        Mapping of optional keys and validators
+    options
+        Default validation options, same as in validate_config
+    """
+    if required_keys is not None:
+        _check_declaration(required_keys, "required_keys")
+    if optional_keys is not None:
+        _check_declaration(optional_keys, "optional_keys")
+
+    required = (
+        {}
+        if required_keys is None
+        else {
+            key: _resolve_validator(entry)
+            for key, entry in required_keys.items()
+        }
+    )
+    optional = (
+        None
+        if optional_keys is None
+        else {
+            key: _resolve_validator(entry)
+            for key, entry in optional_keys.items()
+        }
+    )
+    return CompiledSchema(required, optional, **options)
+
+
+def validate_many(
+    configs: Iterable[ConfigurationType],
+    schema: Union[CompiledSchema, ValidatorConfiguration, None],
+    optional_keys: Optional[ValidatorConfiguration] = None,
+    collect_errors: bool = False,
+    **options: Any,
+) -> List[Any]:
+    """Validate many configurations against the same schema.
+
+    The schema is prepared once for the whole batch.
+
+    Parameters
+    ----------
+    configs
+        Configurations to validate
+    schema
+        A compiled schema, or the required keys declaration
+    optional_keys
+        Optional keys declaration, if schema is not compiled
+    collect_errors
+        Don't abort on invalid configurations; the error raised while
+        validating a configuration is returned in place of its result
+    options
+        Validation options for compiling the schema, or option overrides
+        and extra keys when a compiled schema is passed
+    """
+    if isinstance(schema, CompiledSchema):
+        if optional_keys is not None:
+            raise TypeError(
+                "optional_keys must be compiled into the schema when passing "
+                "a compiled schema"
+            )
+        overrides = options
+    else:
+        schema = compile_schema(schema, optional_keys, **options)
+        overrides = {}
+
+    validate_fn = schema.validate
+    if not collect_errors:
+        return [validate_fn(config, **overrides) for config in configs]
+
+    results = []
+    append = results.append
+    for config in configs:
+        try:
+            append(validate_fn(config, **overrides))
+        except (ConfigurationError, TypeError) as err:
+            append(err)
+
+    return results
@@ -0,0 +1,655 @@
+"""Incremental JSON loading and validation."""
+
+import codecs
+import re
+from json.decoder import JSONDecodeError, scanstring
+from typing import IO, Any, Callable, Dict, Iterator, List, Mapping
+from typing import Optional, Sequence, Tuple
+
+from dictator.config import (
+    _UNKNOWN,
+    ValidatorConfiguration,
+    _log,
+    _log_enabled,
+    _missing_keys_error,
+    _reject_awaitable,
+    validate_config,
+)
+from dictator.context import ValidationContext
+from dictator.errors import UnknownKeyError, ValidationError
+from dictator.schema import CompiledSchema, compile_schema
+from dictator.validators import Validator
+from dictator.validators.dependency import DeferValidation
+from dictator.validators.lists import SubListValidator
+from dictator.validators.maps import SubDictValidator
+
+DEFAULT_CHUNK_SIZE = 65536
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_WORD = re.compile(r'[^ \t\n\r{}\[\]:,"]+')
+_NUMBER = re.compile(r"-?(?:0|[1-9][0-9]*)(\.[0-9]+)?([eE][-+]?[0-9]+)?")
+_LITERALS = {"true": True, "false": False, "null": None}
+# length of the longest escape sequence, a \\uXXXX\\uXXXX surrogate pair
+_MAX_ESCAPE = 12
+
+# parser states
+_VALUE = 0
+_VALUE_OR_END = 1
+_KEY = 2
+_KEY_OR_END = 3
+_COLON = 4
+_COMMA_OR_END = 5
+_DONE = 6
+
+Event = Tuple[str, Any]
+
+# validation options supported while streaming
+_STREAM_OPTIONS = (
+    "verbosity",
+    "log_fn",
+    "allow_unknown",
+    "gobble_unknown",
+    "inherit_options",
+    "pop_extra_kwargs",
+)
+# validation options requiring the whole configuration
+_WHOLE_OPTIONS = ("profiler", "summarize_unknown", "cache", "errors", "lazy")
+# marks values that are not validated while parsed
+_NOT_STREAMED = object()
+
+
+class JSONStreamError(ValueError):
+    """Malformed JSON stream error."""
+
+
+def _iter_chunks(fp: IO, chunk_size: int) -> Iterator[str]:
+    """Read text chunks from text or binary files."""
+    decoder = None
+    while True:
+        chunk = fp.read(chunk_size)
+        if not chunk:
+            if decoder is not None:
+                # raises on truncated multi-byte sequences
+                decoder.decode(b"", final=True)
+            return
+        if isinstance(chunk, bytes):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder("utf-8")()
+            chunk = decoder.decode(chunk)
+            if not chunk:
+                # multi-byte sequence split by chunk boundary
+                continue
+        yield chunk
+
+
+def _iter_tokens(fp: IO, chunk_size: int) -> Iterator[Tuple[str, Any]]:
+    """Tokenize JSON text incrementally."""
+    chunks = _iter_chunks(fp, chunk_size)
+    buf = ""
+    pos = 0
+    eof = False
+
+    def _read_more(keep_from):
+        nonlocal buf, pos, eof
+        chunk = next(chunks, None)
+        if chunk is None:
+            eof = True
+            chunk = ""
+        buf = buf[keep_from:] + chunk
+        pos = 0
+
+    while True:
+        pos = _WHITESPACE.match(buf, pos).end()
+        if pos == len(buf):
+            if eof:
+                return
+            _read_more(pos)
+            continue
+
+        char = buf[pos]
+        if char in "{}[]:,":
+            pos += 1
+            yield char, None
+        elif char == '"':
+            try:
+                value, end = scanstring(buf, pos + 1)
+            except JSONDecodeError as err:
+                if eof or (
+                    not err.msg.startswith("Unterminated")
+                    and err.pos + _MAX_ESCAPE < len(buf)
+                ):
+                    raise JSONStreamError(err.msg) from err
+                # possibly truncated by chunk boundary
+                _read_more(pos)
+                continue
+            pos = end
+            yield "string", value
+        else:
+            match = _WORD.match(buf, pos)
+            if match.end() == len(buf) and not eof:
+                # possibly truncated by chunk boundary
+                _read_more(pos)
+                continue
+            word = match.group()
+            pos = match.end()
+            if word in _LITERALS:
+                value = _LITERALS[word]
+                yield "null" if value is None else "boolean", value
+                continue
+            number = _NUMBER.fullmatch(word)
+            if number is None:
+                raise JSONStreamError(f"invalid value: '{word}'")
+            if number.group(1) is None and number.group(2) is None:
+                yield "number", int(word)
+            else:
+                yield "number", float(word)
+
+
+def iter_events(
+    fp: IO, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Event]:
+    """Parse a JSON document incrementally into events.
+
+    Events are (event, value) tuples, where event is one of start_map,
+    map_key, end_map, start_array, end_array, string, number, boolean or
+    null.
+
+    Parameters
+    ----------
+    fp
+        File-like object opened in text or binary mode
+    chunk_size
+        Size of reads from the file
+    """
+    containers = []
+    state = _VALUE
+    for token, value in _iter_tokens(fp, chunk_size):
+        if state in (_VALUE, _VALUE_OR_END):
+            if token == "{":
+                containers.append("map")
+                state = _KEY_OR_END
+                yield "start_map", None
+                continue
+            if token == "[":
+                containers.append("array")
+                state = _VALUE_OR_END
+                yield "start_array", None
+                continue
+            if token == "]" and state == _VALUE_OR_END:
+                containers.pop()
+                yield "end_array", None
+            elif token in ("string", "number", "boolean", "null"):
+                yield token, value
+            else:
+                raise JSONStreamError(f"expecting value, got '{token}'")
+        elif state in (_KEY, _KEY_OR_END):
+            if token == "string":
+                state = _COLON
+                yield "map_key", value
+                continue
+            if token == "}" and state == _KEY_OR_END:
+                containers.pop()
+                yield "end_map", None
+            else:
+                raise JSONStreamError(f"expecting key, got '{token}'")
+        elif state == _COLON:
+            if token != ":":
+                raise JSONStreamError(f"expecting ':', got '{token}'")
+            state = _VALUE
+            continue
+        elif state == _COMMA_OR_END:
+            container = containers[-1]
+            if token == ",":
+                state = _KEY if container == "map" else _VALUE
+                continue
+            if token == "}" and container == "map":
+                containers.pop()
+                yield "end_map", None
+            elif token == "]" and container == "array":
+                containers.pop()
+                yield "end_array", None
+            else:
+                raise JSONStreamError(f"unexpected '{token}'")
+        else:
+            raise JSONStreamError("extra data after JSON document")
+
+        # a value was completed
+        state = _COMMA_OR_END if containers else _DONE
+
+    if state == _VALUE and not containers:
+        raise JSONStreamError("empty JSON document")
+    if state != _DONE:
+        raise JSONStreamError("unexpected end of JSON document")
+
+
+def _build_value(events: Iterator[Event], first: Event) -> Any:
+    """Build a value from events, starting at its first event."""
+    event, value = first
+    if event == "start_map":
+        root = {}
+    elif event == "start_array":
+        root = []
+    else:
+        return value
+
+    stack = [root]
+    key = None
+    for event, value in events:
+        container = stack[-1]
+        if event == "map_key":
+            key = value
+            continue
+        if event in ("end_map", "end_array"):
+            stack.pop()
+            if not stack:
+                return root
+            continue
+
+        if event == "start_map":
+            value = {}
+        elif event == "start_array":
+            value = []
+        if isinstance(container, list):
+            container.append(value)
+        else:
+            container[key] = value
+        if event in ("start_map", "start_array"):
+            stack.append(value)
+
+    raise JSONStreamError("unexpected end of JSON document")
+
+
+def _skip_value(events: Iterator[Event], first: Event) -> None:
+    """Skip over a value, starting at its first event."""
+    if first[0] not in ("start_map", "start_array"):
+        return
+    depth = 1
+    for event, _ in events:
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+            if depth == 0:
+                return
+
+
+def _find_path(events: Iterator[Event], path: Sequence[str]) -> None:
+    """Advance events up to the value located at a key path."""
+    for key in path:
+        event, _ = next(events)
+        if event != "start_map":
+            raise JSONStreamError(f"cannot find key '{key}', not an object")
+        for event, value in events:
+            if event == "end_map":
+                raise JSONStreamError(f"key '{key}' not found")
+            if value == key:
+                break
+            _skip_value(events, next(events))
+
+
+def iter_items(
+    fp: IO,
+    path: Sequence[str] = (),
+    validator: Optional[Callable] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """Iterate over the elements of a JSON array incrementally.
+
+    Only one element is kept in memory at a time, regardless of the size of
+    the array.
+
+    Parameters
+    ----------
+    fp
+        File-like object opened in text or binary mode
+    path
+        Keys leading to the array, empty for a top-level array
+    validator
+        A validator used for each element as soon as it is parsed, e.g. a
+        SubDictValidator describing the elements
+    chunk_size
+        Size of reads from the file
+    kwargs
+        Validator metadata
+    """
+    if isinstance(validator, Validator):
+        validator = validator.validate
+    events = iter_events(fp, chunk_size)
+    _find_path(events, path)
+    event, _ = next(events)
+    if event != "start_array":
+        raise JSONStreamError("value is not an array")
+
+    for index, first in enumerate(events):
+        if first[0] == "end_array":
+            return
+        item = _build_value(events, first)
+        if validator is None:
+            yield item
+            continue
+        try:
+            result = validator(item, **kwargs)
+        except ValidationError as err:
+            raise err.with_parent(index) from err.__cause__
+        yield item if result is None else result
+
+
+def load(fp: IO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Any:
+    """Load a JSON document incrementally.
+
+    Unlike json.load, the document text is never held in memory as a whole.
+
+    Parameters
+    ----------
+    fp
+        File-like object opened in text or binary mode
+    chunk_size
+        Size of reads from the file
+    """
+    events = iter_events(fp, chunk_size)
+    value = _build_value(events, next(events))
+    # consume remaining events to detect trailing data
+    for _ in events:
+        pass
+    return value
+
+
+def _stream_validator(fn: Callable, cls: type) -> Optional[Validator]:
+    """Get validator owning fn, if fn is the validate method of cls exactly.
+
+    Subclasses may validate differently, so they are not streamed.
+    """
+    owner = getattr(fn, "__self__", None)
+    if type(owner) is cls and fn.__func__ is cls.validate:
+        return owner
+    return None
+
+
+def _stream_options(
+    schema: CompiledSchema, overrides: Dict[str, Any]
+) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """Split validation options from extra keys.
+
+    Options not given in overrides are taken from the schema. Returns None
+    if an option requires the whole configuration.
+    """
+    defaults = schema.options
+    options = {name: defaults[name] for name in _STREAM_OPTIONS}
+    extra_kwargs = {}
+    for name, value in overrides.items():
+        if name in _STREAM_OPTIONS:
+            options[name] = value
+        elif name in _WHOLE_OPTIONS:
+            if value:
+                return None
+        else:
+            extra_kwargs[name] = value
+    return options, extra_kwargs
+
+
+def _call_validator(
+    fn: Callable,
+    with_context: bool,
+    value: Any,
+    context: ValidationContext,
+    config: Dict[str, Any],
+) -> Any:
+    """Call validation function of a key, given the keys validated so far."""
+    if with_context:
+        new_value = fn(value, _context=context)
+    else:
+        new_value = fn(
+            value,
+            _validator_args=context.validator_args,
+            _parent=context.parent,
+            **config,
+        )
+    _reject_awaitable(new_value)
+    return value if new_value is None else new_value
+
+
+def _stream_value(
+    events: Iterator[Event],
+    first: Event,
+    fn: Callable,
+    context: ValidationContext,
+) -> Any:
+    """Validate an object or array while parsing it, if possible.
+
+    Objects validated by SubDictValidator and arrays validated by
+    SubListValidator are validated as they are parsed, starting at their
+    first event. Returns _NOT_STREAMED, without consuming events, for other
+    values.
+    """
+    if first[0] == "start_map":
+        validator = _stream_validator(fn, SubDictValidator)
+        if validator is not None:
+            split = _stream_options(
+                validator.schema,
+                {**context.validator_args, **validator._validator_options},
+            )
+            if split is not None:
+                return _validate_map(events, validator.schema, context, *split)
+    elif first[0] == "start_array":
+        validator = _stream_validator(fn, SubListValidator)
+        if (
+            validator is not None
+            and not validator._lazy
+            and validator._parallel is None
+        ):
+            return _validate_list(events, validator, context)
+    return _NOT_STREAMED
+
+
+def _validate_list(
+    events: Iterator[Event],
+    validator: SubListValidator,
+    context: ValidationContext,
+) -> List[Any]:
+    """Validate array elements as they are parsed, after start_array."""
+    schema = validator.schema
+    validator_args = {**context.validator_args, **validator._validator_options}
+    split = _stream_options(schema, validator_args)
+    results = []
+    for index, first in enumerate(events):
+        if first[0] == "end_array":
+            return results
+        try:
+            if first[0] == "start_map" and split is not None:
+                results.append(_validate_map(events, schema, context, *split))
+            else:
+                results.append(
+                    schema.validate(
+                        _build_value(events, first),
+                        parent_keys=context,
+                        **validator_args,
+                    )
+                )
+        except ValidationError as err:
+            raise err.with_parent(index) from err.__cause__
+
+    raise JSONStreamError("unexpected end of JSON document")
+
+
+def _validate_map(
+    events: Iterator[Event],
+    schema: CompiledSchema,
+    parent_keys: Optional[Mapping],
+    options: Dict[str, Any],
+    extra_kwargs: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Validate an object as it is parsed, after start_map.
+
+    Keys are validated in document order as soon as their values are
+    parsed. Keys declaring dependencies wait for them to be validated, and
+    keys deferring validation are validated once the object ends, the way
+    validate_config retries them.
+    """
+    verbosity = options["verbosity"]
+    log_fn = options["log_fn"]
+    allow_unknown = options["allow_unknown"]
+    gobble_unknown = options["gobble_unknown"]
+    if options["inherit_options"]:
+        allow_unknown = parent_keys.get("allow_unknown", allow_unknown)
+        gobble_unknown = parent_keys.get("gobble_unknown", gobble_unknown)
+
+    # pass validation config args down
+    vargs = {
+        "verbosity": verbosity,
+        "allow_unknown": allow_unknown,
+        "gobble_unknown": gobble_unknown,
+    }
+    if log_fn is not None:
+        vargs["log_fn"] = log_fn
+
+    validated = extra_kwargs.copy()
+    context = ValidationContext(validated, parent_keys, vargs)
+    # keys waiting for the keys they declare dependencies on
+    waiting: Dict[str, Tuple[Any, Callable, bool, set]] = {}
+    # keys deferring validation, validated once the object ends
+    deferred = {}
+    present = set()
+
+    def _validate_key(key, value, fn, with_context):
+        try:
+            validated[key] = _call_validator(
+                fn, with_context, value, context, validated
+            )
+        except DeferValidation:
+            deferred[key] = value
+        except ValidationError as err:
+            raise err.with_parent(key) from err.__cause__
+
+    for event, key in events:
+        if event == "end_map":
+            break
+        first = next(events)
+        present.add(key)
+        entry = schema._get_entry(key, _UNKNOWN)
+        if entry is _UNKNOWN:
+            # warning, unknown key
+            if _log_enabled(log_fn, "warning", verbosity):
+                _log(log_fn, f"unknown key: '{key}'", "warning", verbosity)
+            if allow_unknown is False:
+                raise UnknownKeyError(f"unknown key: {key}")
+            if gobble_unknown:
+                _skip_value(events, first)
+            else:
+                # passes through without validation
+                validated[key] = _build_value(events, first)
+            continue
+        if entry is None:
+            # no validation
+            validated[key] = _build_value(events, first)
+            continue
+
+        fn, with_context, get_dependencies = entry
+        try:
+            value = _stream_value(events, first, fn, context)
+        except ValidationError as err:
+            raise err.with_parent(key) from err.__cause__
+        if value is not _NOT_STREAMED:
+            validated[key] = value
+        else:
+            value = _build_value(events, first)
+            depends = (
+                set(get_dependencies(value))
+                if get_dependencies is not None
+                else None
+            )
+            if depends and not validated.keys() >= depends:
+                waiting[key] = (value, fn, with_context, depends)
+                continue
+            _validate_key(key, value, fn, with_context)
+
+        # validate keys waiting for the keys validated so far
+        ready = waiting
+        while ready:
+            ready = [
+                name
+                for name, state in waiting.items()
+                if validated.keys() >= state[3]
+            ]
+            for name in ready:
+                _validate_key(name, *waiting.pop(name)[:3])
+    else:
+        raise JSONStreamError("unexpected end of JSON document")
+
+    if not present >= schema.required_keys.keys():
+        raise _missing_keys_error(schema.required_keys, present)
+    if waiting or deferred:
+        # dependencies not found yet, or validated in another order
+        remaining = {key: state[0] for key, state in waiting.items()}
+        remaining.update(deferred)
+        validated = schema._validate(
+            remaining,
+            parent_keys,
+            validated,
+            verbosity=verbosity,
+            log_fn=log_fn,
+            allow_unknown=allow_unknown,
+            gobble_unknown=gobble_unknown,
+            inherit_options=False,
+            pop_extra_kwargs=False,
+        )
+    return validated
+
+
+def load_config(
+    fp: IO,
+    required_keys: Optional[ValidatorConfiguration] = None,
+    optional_keys: Optional[ValidatorConfiguration] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **kwargs: Any,
+):
+    """Load and validate a configuration from a JSON file incrementally.
+
+    Keys are validated as soon as their values are parsed, and objects and
+    arrays validated by SubDictValidator and SubListValidator are validated
+    element by element while they are parsed, so that raw values of nested
+    objects are never held along with their validated values. Keys
+    declaring dependencies or deferring validation are validated once their
+    object ends. The validated configuration is still built in memory; use
+    iter_items to process elements of a huge array one at a time.
+
+    The profiler, summarize_unknown, cache, errors and lazy options need
+    the whole configuration, which is loaded first when they are used.
+
+    Parameters
+    ----------
+    fp
+        File-like object opened in text or binary mode
+    required_keys
+        Mapping of required keys and validators
+    optional_keys
+        Mapping of optional keys and validators
+    chunk_size
+        Size of reads from the file
+    kwargs
+        Other options passed into validate_config
+    """
+    parent_keys = kwargs.pop("parent_keys", None)
+    schema = compile_schema(required_keys, optional_keys)
+    split = _stream_options(schema, kwargs)
+    events = iter_events(fp, chunk_size)
+    first = next(events)
+    if split is None or first[0] != "start_map":
+        return validate_config(
+            _build_value(events, first),
+            required_keys,
+            optional_keys,
+            parent_keys=parent_keys,
+            **kwargs,
+        )
+
+    options, extra_kwargs = split
+    config = _validate_map(events, schema, parent_keys, options, extra_kwargs)
+    # consume remaining events to detect trailing data
+    for _ in events:
+        pass
+    # pop extra kwargs
+    if options["pop_extra_kwargs"]:
+        for kwarg in extra_kwargs:
+            config.pop(kwarg, None)
+    return config
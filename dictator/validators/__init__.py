@@ -1,13 +1,38 @@
 """Validators."""
 
+import inspect
 from functools import wraps
-from typing import Any, Union, Callable
+from typing import Any, Union, Callable, Optional, Tuple
 
 
 class Validator:
-    """Base validator abstract class."""
+    """Base validator abstract class.
+
+    Validators declare their instance attributes in __slots__, keeping
+    instances small in large schemas; subclasses that do not declare
+    __slots__ get a __dict__ as usual.
+    """
+
+    __slots__ = ("_after",)
 
     _DEFAULT_NAME: Union[None, str] = None
+    _USES_CONTEXT = False
+    _IMPURE = False
+
+    # optionally, a method returning the keys that must be validated before
+    # a given value, allowing validation to be scheduled ahead of time
+    get_dependencies: Optional[Callable[[Any], Tuple[str, ...]]] = None
+
+    def __init_subclass__(cls, **kwargs):
+        """Reset the calling convention of classes overriding validate.
+
+        _USES_CONTEXT describes the validate method of the class declaring
+        it, so subclasses overriding validate use keyword arguments unless
+        they declare it as well.
+        """
+        super().__init_subclass__(**kwargs)
+        if "validate" in cls.__dict__ and "_USES_CONTEXT" not in cls.__dict__:
+            cls._USES_CONTEXT = False
 
     def __init__(self, after_fn: bool = True, **kwargs):
         """Initialize.
@@ -25,6 +50,29 @@ class Validator:
         """Get if executed after decorated function."""
         return self._after
 
+    @property
+    def uses_context(self) -> bool:
+        """Get if validate uses the context calling convention."""
+        return self._USES_CONTEXT
+
+    @property
+    def impure(self) -> bool:
+        """Get if validation results must not be cached."""
+        return self._IMPURE
+
+    def check_type(self, _type: type) -> Optional[bool]:
+        """Check if values of a type can pass validation.
+
+        Parameters
+        ----------
+        _type
+            Type of values
+
+        Returns True if all values of the type pass validation, False if
+        none do and None if it depends on the value.
+        """
+        return None
+
     @classmethod
     def get_default_name(cls) -> str:
         """Get default name."""
@@ -45,20 +93,107 @@ class Validator:
         """
         raise NotImplementedError
 
+    def _get_validate_fn(self) -> Callable:
+        """Get function called by decorated functions to validate values."""
+        return self.validate
+
     def __call__(self, fn: Callable) -> Callable:
-        """Validate as decorator."""
-
-        @wraps(fn)
-        def _validate(*args, **kwargs):
-            if not self._after:
-                # FIXME: getting a double self argument???
-                if isinstance(args[0], Validator):
-                    _value = self.validate(*args[1:], **kwargs)
-                    return fn(args[0], _value, **kwargs)
-                _value = self.validate(*args, **kwargs)
-                return fn(_value, **kwargs)
-            else:
-                _value = fn(*args, **kwargs)
-                return self.validate(_value, **kwargs)
+        """Validate as decorator.
+
+        The wrapper is specialized when decorating: validation runs after fn
+        or before it and, before methods (taking self first), validates the
+        argument following self.
+        """
+        validate = self._get_validate_fn()
+        if self._after:
 
+            @wraps(fn)
+            def _validate(*args, **kwargs):
+                return validate(fn(*args, **kwargs), **kwargs)
+
+        elif _takes_self(fn):
+
+            @wraps(fn)
+            def _validate(owner, *args, **kwargs):
+                return fn(owner, validate(*args, **kwargs), **kwargs)
+
+        else:
+
+            @wraps(fn)
+            def _validate(*args, **kwargs):
+                return fn(validate(*args, **kwargs), **kwargs)
+
+        # don't inherit declarations from fn through wraps
+        _validate.uses_context = self.uses_context and _uses_context(fn)
+        _validate.impure = self.impure or _is_impure(fn)
+        _validate.get_dependencies = _merge_dependency_fns(
+            self.get_dependencies, _get_dependency_fn(fn)
+        )
+        # values passing fn may still fail validation
+        _validate.check_type = None
         return _validate
+
+
+def _takes_self(fn: Callable) -> bool:
+    """Get if a function is a method, taking self as first argument."""
+    try:
+        parameters = iter(inspect.signature(fn).parameters.values())
+    except (TypeError, ValueError):
+        return False
+    first = next(parameters, None)
+    return (
+        first is not None
+        and first.name == "self"
+        and first.kind
+        in (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        )
+    )
+
+
+def _uses_context(fn: Callable) -> bool:
+    """Get if a validation function uses the context calling convention."""
+    owner = getattr(fn, "__self__", None)
+    if isinstance(owner, Validator):
+        return owner.uses_context
+    return getattr(fn, "uses_context", False) is True
+
+
+def _is_impure(fn: Callable) -> bool:
+    """Get if a validation function is marked as impure."""
+    owner = getattr(fn, "__self__", None)
+    if isinstance(owner, Validator):
+        return owner.impure
+    return getattr(fn, "impure", False) is True
+
+
+def _get_dependency_fn(fn: Callable) -> Optional[Callable]:
+    """Get dependency declaration function of a validation function."""
+    owner = getattr(fn, "__self__", None)
+    if isinstance(owner, Validator):
+        return owner.get_dependencies
+    return getattr(fn, "get_dependencies", None)
+
+
+def _merge_dependency_fns(
+    first: Optional[Callable], second: Optional[Callable]
+) -> Optional[Callable]:
+    """Merge dependency declaration functions."""
+    if first is None:
+        return second
+    if second is None:
+        return first
+
+    def _get_dependencies(_value):
+        return tuple(first(_value)) + tuple(second(_value))
+
+    return _get_dependencies
+
+
+def _get_type_check_fn(fn: Callable) -> Optional[Callable]:
+    """Get type check function of a validation function."""
+    owner = getattr(fn, "__self__", None)
+    if isinstance(owner, Validator):
+        return owner.check_type
+    return getattr(fn, "check_type", None)
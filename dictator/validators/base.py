@@ -2,12 +2,24 @@
 
 import re
 from dictator.errors import ValidationError
-from dictator.validators import Validator
-from typing import Type, Callable, Any, Tuple, Union
+from dictator.validators import (
+    Validator,
+    _uses_context,
+    _get_dependency_fn,
+    _get_type_check_fn,
+    _is_impure,
+)
+from dictator.context import uses_context
+from typing import Type, Callable, Any, Iterable, List, Tuple, Union, Optional
 
 HEX_REGEX = re.compile(r"^(0x)?([0-9A-Fa-f]+)$")
 BIN_REGEX = re.compile(r"^(0b)?([0-1]+)$")
 
+# interpretation of integer strings without a prefix:
+# legacy is binary if all digits are 0 or 1, hexadecimal otherwise
+BARE_INTEGER_POLICIES = {"legacy": None, "hex": 16, "binary": 2, "decimal": 10}
+_INT_PREFIXES = {16: "0x", 2: "0b"}
+
 
 class ValidateType(Validator):
     """Type validator.
@@ -15,7 +27,10 @@ class ValidateType(Validator):
     Validates if an object is from a certain Python type.
     """
 
+    __slots__ = ("_types",)
+
     _DEFAULT_NAME = "type"
+    _USES_CONTEXT = True
 
     def __init__(self, *_types: Type):
         """Initialize.
@@ -33,6 +48,10 @@ class ValidateType(Validator):
         """Get target type."""
         return self._types
 
+    def check_type(self, _type: type) -> Optional[bool]:
+        """Check if values of a type can pass validation."""
+        return issubclass(_type, self._types)
+
     def validate(self, _value, **kwargs):
         """Perform validation."""
         if not isinstance(_value, self.target_types):
@@ -49,6 +68,14 @@ class ValidatorFactory(Validator):
     Create a validator class from a validation function.
     """
 
+    __slots__ = (
+        "_validatefn",
+        "_with_context",
+        "_impure",
+        "get_dependencies",
+        "_check_type",
+    )
+
     def __init__(self, validate_fn: Union[Callable, Validator], **kwargs):
         """Initialize.
 
@@ -64,12 +91,129 @@ class ValidatorFactory(Validator):
             self._validatefn = validate_fn.validate
         else:
             self._validatefn = validate_fn
+        self._with_context = _uses_context(self._validatefn)
+        self._impure = _is_impure(self._validatefn)
+        self.get_dependencies = _get_dependency_fn(self._validatefn)
+        self._check_type = _get_type_check_fn(self._validatefn)
+
+    @property
+    def uses_context(self) -> bool:
+        """Get if validate uses the context calling convention."""
+        return self._with_context
+
+    @property
+    def impure(self) -> bool:
+        """Get if validation results must not be cached."""
+        return self._impure
+
+    def check_type(self, _type: type) -> Optional[bool]:
+        """Check if values of a type can pass validation."""
+        if self._check_type is None:
+            return None
+        return self._check_type(_type)
+
+    def _get_validate_fn(self) -> Callable:
+        """Get function called by decorated functions to validate values."""
+        return self._validatefn
 
     def validate(self, _value, **kwargs):
         """Perform validation."""
         return self._validatefn(_value, **kwargs)
 
 
+def _parse_integer(
+    _value: str, bare_base: Optional[int], underscores: bool
+) -> int:
+    """Parse integer string, with base of bare strings already resolved."""
+    base = None
+    digits = _value
+    prefix = _value[:2]
+    if prefix == "0x":
+        base = 16
+        digits = _value[2:]
+    elif prefix == "0b":
+        digits = _value[2:]
+        plain = digits.replace("_", "") if underscores else digits
+        if plain and not plain.strip("01"):
+            base = 2
+        else:
+            # not binary, such as 0b12, which is a bare hexadecimal value
+            digits = _value
+
+    plain = digits.replace("_", "") if underscores else digits
+    if not plain or not plain.isascii() or not plain.isalnum():
+        raise ValidationError("cannot validate as integer")
+    if base is None:
+        base = bare_base or (16 if plain.strip("01") else 2)
+    if digits[:2].lower() == _INT_PREFIXES.get(base):
+        # int accepts prefixes in digits, such as 0X
+        raise ValidationError("cannot validate as integer")
+    try:
+        return int(digits, base)
+    except ValueError:
+        raise ValidationError("cannot validate as integer") from None
+
+
+def _get_bare_base(bare: str) -> Optional[int]:
+    """Get base of integer strings without prefix, None for legacy."""
+    if bare not in BARE_INTEGER_POLICIES:
+        raise ValueError(f"unknown bare integer policy: '{bare}'")
+    return BARE_INTEGER_POLICIES[bare]
+
+
+def parse_integer(
+    _value: str, bare: str = "legacy", underscores: bool = False
+) -> int:
+    """Parse integer string in a single pass.
+
+    Strings prefixed with 0x are hexadecimal and strings prefixed with 0b are
+    binary; other strings are interpreted according to the bare policy.
+    Signs and whitespace are not accepted.
+
+    Parameters
+    ----------
+    _value
+        String value
+    bare
+        Interpretation of strings without prefix: legacy (binary if all
+        digits are 0 or 1, hexadecimal otherwise), hex, binary or decimal
+    underscores
+        Allow underscores between digits
+    """
+    return _parse_integer(_value, _get_bare_base(bare), underscores)
+
+
+def parse_integers(
+    _values: Iterable[Any], bare: str = "legacy", underscores: bool = False
+) -> List[int]:
+    """Validate a sequence of integers, parsing strings.
+
+    Equivalent to validating each element as an integer, but without the
+    overhead of calling a validator per element.
+
+    Parameters
+    ----------
+    _values
+        Integer or string values
+    bare
+        Interpretation of strings without prefix, see parse_integer
+    underscores
+        Allow underscores between digits
+    """
+    bare_base = _get_bare_base(bare)
+    parsed = []
+    append = parsed.append
+    for value in _values:
+        if type(value) is int:
+            append(value)
+        elif isinstance(value, str):
+            append(_parse_integer(value, bare_base, underscores))
+        else:
+            append(_validate_integer(value))
+    return parsed
+
+
+@uses_context
 def _validate_integer(_value: Any, **kwargs: Any) -> int:
     """Validate integer value.
 
@@ -81,16 +225,7 @@ def _validate_integer(_value: Any, **kwargs: Any) -> int:
         Other metadata
     """
     if isinstance(_value, str):
-        # try converting
-        h = HEX_REGEX.match(_value)
-        b = BIN_REGEX.match(_value)
-        if h is not None:
-            if h.group(1) is None and b is not None:
-                # is actually binary
-                return int(h.group(2), 2)
-            return int(h.group(2), 16)
-
-        raise ValidationError("cannot validate as integer")
+        return _parse_integer(_value, None, False)
     elif isinstance(_value, bool):
         raise ValidationError("cannot validate as integer, got boolean")
     elif isinstance(_value, int):
@@ -99,6 +234,20 @@ def _validate_integer(_value: Any, **kwargs: Any) -> int:
     raise ValidationError("cannot validate as integer")
 
 
+def _check_integer_type(_type: type) -> Optional[bool]:
+    """Check if values of a type can pass integer validation."""
+    if issubclass(_type, bool):
+        return False
+    if issubclass(_type, int):
+        return True
+    if issubclass(_type, str):
+        # depends on contents
+        return None
+    return False
+
+
+_validate_integer.check_type = _check_integer_type
+
 validate_string = ValidatorFactory(ValidateType(str))
 validate_list = ValidatorFactory(ValidateType(tuple, list))
 validate_dict = ValidatorFactory(ValidateType(dict))
@@ -114,6 +263,7 @@ validate_float_pre = ValidatorFactory(ValidateType(float), after_fn=False)
 validate_integer_pre = ValidatorFactory(_validate_integer, after_fn=False)
 
 
+@uses_context
 def validate_null(_value: Any, **kwargs: Any) -> None:
     """Validate null value.
 
@@ -129,6 +279,9 @@ def validate_null(_value: Any, **kwargs: Any) -> None:
     return _value
 
 
+validate_null.check_type = lambda _type: _type is type(None)
+
+
 DEFAULT_VALIDATOR_BY_TYPE = {
     int: validate_integer,
     str: validate_string,
@@ -1,6 +1,7 @@
 """Utilities."""
 
 from dictator.validators import Validator
+from dictator.context import get_context
 from typing import Tuple, Any
 
 
@@ -27,7 +28,10 @@ class DeferValidation(Exception):
 class KeyDependencyMap(Validator):
     """Check for dependencies."""
 
+    __slots__ = ("_depmap",)
+
     _DEFAULT_NAME = "dependency_map"
+    _USES_CONTEXT = True
 
     def __init__(self, validate_after=False, **dependency_map: str):
         """Initialize.
@@ -50,15 +54,25 @@ class KeyDependencyMap(Validator):
                         )
         self._depmap = dependency_map
 
+    def get_dependencies(self, _value: Any) -> Tuple[str, ...]:
+        """Get dependencies for a value."""
+        try:
+            deps = self._depmap.get(_value, ())
+        except TypeError:
+            # unhashable value
+            return ()
+        return (deps,) if isinstance(deps, str) else tuple(deps)
+
     def validate(self, _value, **kwargs):
         """Perform checks."""
 
+        context = get_context(kwargs)
         missing_deps = []
         deps = self._depmap[_value]
         if isinstance(deps, str):
             deps = (deps,)
         for dep in deps:
-            if dep not in kwargs:
+            if dep not in context:
                 missing_deps.append(dep)
 
         if missing_deps:
@@ -70,7 +84,10 @@ class KeyDependencyMap(Validator):
 class KeyDependency(Validator):
     """Check for dependencies."""
 
+    __slots__ = ("_deps",)
+
     _DEFAULT_NAME = "dependency"
+    _USES_CONTEXT = True
 
     def __init__(
         self, *dependencies: str, validate_after=False, **kwargs: Any
@@ -90,12 +107,17 @@ class KeyDependency(Validator):
                 raise TypeError("dependencies must be strings")
         self._deps = dependencies
 
+    def get_dependencies(self, _value: Any) -> Tuple[str, ...]:
+        """Get dependencies."""
+        return self._deps
+
     def validate(self, _value, **kwargs):
         """Perform checks."""
 
+        context = get_context(kwargs)
         missing_deps = []
         for dep in self._deps:
-            if dep not in kwargs:
+            if dep not in context:
                 missing_deps.append(dep)
 
         if missing_deps:
@@ -1,9 +1,69 @@
 """Composite integer validators."""
 
 from dictator.validators import Validator
-from dictator.validators.base import ValidatorFactory, validate_integer_pre
+from dictator.validators.base import (
+    ValidatorFactory,
+    validate_integer_pre,
+    _check_integer_type,
+    _get_bare_base,
+    _parse_integer,
+    _validate_integer,
+)
 from dictator.errors import ValidationError
-from typing import Any, Union
+from typing import Any, Optional, Union
+
+
+class ValidateInteger(Validator):
+    """Integer validator with configurable string parsing.
+
+    Strings prefixed with 0x and 0b are parsed as hexadecimal and binary
+    values; the interpretation of other strings is configurable.
+    """
+
+    __slots__ = ("_bare", "_bare_base", "_underscores")
+
+    _DEFAULT_NAME = "integer"
+    _USES_CONTEXT = True
+
+    def __init__(
+        self, bare: str = "legacy", underscores: bool = False, **kwargs: Any
+    ):
+        """Initialize.
+
+        Parameters
+        ----------
+        bare
+            Interpretation of strings without prefix: legacy (binary if all
+            digits are 0 or 1, hexadecimal otherwise), hex, binary or decimal
+        underscores
+            Allow underscores between digits
+        kwargs
+            Any other metadata
+        """
+        super().__init__()
+        self._bare = bare
+        self._bare_base = _get_bare_base(bare)
+        self._underscores = underscores
+
+    @property
+    def bare(self) -> str:
+        """Get interpretation of strings without prefix."""
+        return self._bare
+
+    @property
+    def underscores(self) -> bool:
+        """Get if underscores are allowed between digits."""
+        return self._underscores
+
+    def check_type(self, _type: type) -> Optional[bool]:
+        """Check if values of a type can pass validation."""
+        return _check_integer_type(_type)
+
+    def validate(self, _value, **kwargs):
+        """Perform validation."""
+        if isinstance(_value, str):
+            return _parse_integer(_value, self._bare_base, self._underscores)
+        return _validate_integer(_value)
 
 
 class ValidateIntRange(Validator):
@@ -12,7 +72,10 @@ class ValidateIntRange(Validator):
     Validate that an integer value is within a range.
     """
 
+    __slots__ = ("_start", "_end")
+
     _DEFAULT_NAME = "int_range"
+    _USES_CONTEXT = True
 
     def __init__(
         self, start: Union[int, None], end: Union[int, None], **kwargs: Any
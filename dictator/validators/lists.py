@@ -1,20 +1,49 @@
 """List-based validators."""
 
-from typing import Union, Any, Dict, Optional, Type, Callable
-from dictator.validators import Validator
+import array
+import bisect
+import enum
+import itertools
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from functools import partial
+from typing import Union, Any, Dict, Optional, Type, Callable, Iterator, List
+from typing import Sequence, Tuple
+from dictator.validators import Validator, _is_impure
 from dictator.validators.base import ValidateType
-from dictator.errors import ValidationError
-import dictator.config
+from dictator.validators.replace import _find_parent_references
+from dictator.errors import (
+    ConfigurationError,
+    ErrorCollector,
+    ValidationError,
+    ValidationErrors,
+)
+from dictator.context import UnknownKeys, get_context
+import dictator.schema
 
+from dictator.validators.integer import ValidateInteger, ValidateIntRange
 from dictator.validators.base import (
+    ValidatorFactory,
     validate_integer,
     validate_string,
     validate_list,
+    validate_list_pre,
     validate_dict,
     validate_float,
     validate_boolean,
+    parse_integers,
 )
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class ValidateChoice(Validator):
     """Validate choice from list.
@@ -22,29 +51,190 @@ class ValidateChoice(Validator):
     Valid choices are declared in a list and value is validated against that.
     """
 
+    __slots__ = (
+        "_enum",
+        "_choices",
+        "_case_sensitive",
+        "_prefix",
+        "_index",
+        "_unhashable",
+        "_choice_set",
+        "_strings",
+        "_sorted",
+    )
+
     _DEFAULT_NAME = "choice"
+    _USES_CONTEXT = True
 
-    def __init__(self, *choices: Any, **kwargs: Any):
+    def __init__(
+        self,
+        *choices: Any,
+        case_sensitive: bool = True,
+        prefix: bool = False,
+        **kwargs: Any,
+    ):
         """Initialize.
 
         Parameters
         ----------
         choices
-            List of choices
+            List of choices, or a single Enum class; values are converted to
+            members of the enumeration, by value or by name
+        case_sensitive
+            Whether string values must match the case of a choice
+        prefix
+            Accept unambiguous prefixes of string choices
         kwargs
             Any other metadata
         """
         super().__init__()
+        self._enum = None
+        if (
+            len(choices) == 1
+            and isinstance(choices[0], type)
+            and issubclass(choices[0], enum.Enum)
+        ):
+            self._enum = choices[0]
+            choices = tuple(self._enum)
         self._choices = choices
+        self._case_sensitive = case_sensitive
+        self._prefix = prefix
+
+        # value -> choice, for hashable choices
+        self._index: Dict[Any, Any] = {}
+        self._unhashable = []
+        for choice in choices:
+            try:
+                self._index.setdefault(choice, choice)
+            except TypeError:
+                self._unhashable.append(choice)
+        if self._enum is not None:
+            for member in choices:
+                self._index.setdefault(member.value, member)
+            for name, member in self._enum.__members__.items():
+                self._index.setdefault(name, member)
+        self._choice_set = frozenset(self._index)
+
+        # normalized string -> choices, for the string matching modes
+        self._strings: Dict[str, List[Any]] = {}
+        for key, choice in self._index.items():
+            if isinstance(key, str):
+                normalized = key if case_sensitive else key.casefold()
+                matches = self._strings.setdefault(normalized, [])
+                if choice not in matches:
+                    matches.append(choice)
+        self._sorted = sorted(self._strings) if prefix else None
+
+    @property
+    def choices(self) -> Tuple[Any, ...]:
+        """Get valid choices."""
+        return self._choices
+
+    @property
+    def exact(self) -> bool:
+        """Get if values are only accepted if equal to a choice."""
+        return (
+            self._case_sensitive and not self._prefix and self._enum is None
+        )
+
+    def _match_string(self, value: str) -> List[Any]:
+        """Get choices matched by a string value."""
+        normalized = value if self._case_sensitive else value.casefold()
+        matches = self._strings.get(normalized)
+        if matches is not None or not self._prefix:
+            return matches or []
+
+        matches = []
+        index = bisect.bisect_left(self._sorted, normalized)
+        for key in itertools.islice(self._sorted, index, None):
+            if not key.startswith(normalized):
+                break
+            for choice in self._strings[key]:
+                if choice not in matches:
+                    matches.append(choice)
+        return matches
 
     def validate(self, _value, **kwargs):
         """Perform validation."""
-        if _value not in self._choices:
-            choices = ", ".join(self._choices)
-            raise ValidationError(
-                f"value '{_value}' is not a valid choice, choose from [{choices}]"
+        try:
+            if _value in self._choice_set:
+                return _value if self.exact else self._index[_value]
+        except TypeError:
+            # unhashable value
+            for choice in self._unhashable:
+                if _value == choice:
+                    return choice
+
+        if isinstance(_value, str) and not self.exact:
+            matches = self._match_string(_value)
+            if len(matches) == 1:
+                return matches[0]
+            if len(matches) > 1:
+                candidates = ", ".join(str(choice) for choice in matches)
+                raise ValidationError(
+                    f"value '{_value}' is ambiguous, matches [{candidates}]"
+                )
+
+        choices = ", ".join(str(choice) for choice in self._choices)
+        raise ValidationError(
+            f"value '{_value}' is not a valid choice, choose from [{choices}]"
+        )
+
+
+def _validate_chunk(
+    validate_fn: Callable,
+    offset: int,
+    entries: Sequence[Any],
+    parent: Optional[Mapping],
+    validator_args: Dict[str, Any],
+) -> List[Any]:
+    """Validate a chunk of list elements."""
+    results = []
+    for index, entry in enumerate(entries, offset):
+        try:
+            results.append(
+                validate_fn(entry, parent_keys=parent, **validator_args)
             )
-        return _value
+        except ValidationError as err:
+            raise err.with_parent(index) from err.__cause__
+
+    return results
+
+
+# maximum number of element schemas kept by each worker process
+WORKER_SCHEMA_CACHE_SIZE = 32
+# element schemas compiled in worker processes, by validator token, least
+# recently used first
+_WORKER_SCHEMAS: "OrderedDict[int, dictator.schema.CompiledSchema]" = (
+    OrderedDict()
+)
+_TOKENS = itertools.count()
+
+
+def _validate_chunk_in_worker(
+    token: int,
+    declarations: tuple,
+    offset: int,
+    entries: Sequence[Any],
+    parent: Optional[Mapping],
+    validator_args: Dict[str, Any],
+) -> List[Any]:
+    """Validate a chunk of list elements in a worker process."""
+    schema = _WORKER_SCHEMAS.get(token)
+    if schema is None:
+        schema = dictator.schema.compile_schema(*declarations)
+        _WORKER_SCHEMAS[token] = schema
+        if len(_WORKER_SCHEMAS) > WORKER_SCHEMA_CACHE_SIZE:
+            _WORKER_SCHEMAS.popitem(last=False)
+    else:
+        _WORKER_SCHEMAS.move_to_end(token)
+    return _validate_chunk(
+        schema.validate,
+        offset,
+        entries,
+        parent,
+        validator_args,
+    )
 
 
 class SubListValidator(Validator):
@@ -54,13 +244,32 @@ class SubListValidator(Validator):
     be assigned a validator individually.
     """
 
+    __slots__ = (
+        "_validator_options",
+        "_required",
+        "_optional",
+        "_lazy",
+        "_parallel",
+        "_max_workers",
+        "_chunk_size",
+        "_shared_keys",
+        "_token",
+        "_schema",
+    )
+
     _DEFAULT_NAME = "sub_list"
+    _USES_CONTEXT = True
 
     def __init__(
         self,
         required_keys: Optional[Dict[str, Any]] = None,
         optional_keys: Optional[Dict[str, Any]] = None,
         validator_options: Optional[Dict[str, bool]] = None,
+        lazy: bool = False,
+        parallel: Union[str, Executor, None] = None,
+        max_workers: Optional[int] = None,
+        chunk_size: int = 256,
+        shared_keys: Optional[Sequence[str]] = None,
         **kwargs: Any,
     ):
         """Initialize.
@@ -73,6 +282,19 @@ class SubListValidator(Validator):
             Mapping of optional keys and validators
         validator_options
             Other options passed into main validator function
+        lazy
+            Validate into a generator which validates elements as they are
+            consumed, accepting any iterable instead of only lists
+        parallel
+            Validate chunks of elements concurrently, either "thread" or
+            "process" for a pool created for each validation, or an executor
+        max_workers
+            Number of workers for pools created for each validation
+        chunk_size
+            Number of elements validated by a worker at a time
+        shared_keys
+            Parent keys sent to worker processes; by default, keys
+            referenced by fragments in the elements are sent
         kwargs
             Any other metadata
         """
@@ -91,22 +313,221 @@ class SubListValidator(Validator):
             self._validator_options = validator_options
         self._required = required_keys
         self._optional = optional_keys
+        if parallel is not None:
+            if lazy:
+                raise ValueError("parallel validation is not lazy")
+            if not isinstance(parallel, Executor) and parallel not in (
+                "thread",
+                "process",
+            ):
+                raise ValueError(
+                    "parallel must be 'thread', 'process' or an executor"
+                )
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        self._lazy = lazy
+        self._parallel = parallel
+        self._max_workers = max_workers
+        self._chunk_size = chunk_size
+        self._shared_keys = shared_keys
+        self._token = next(_TOKENS)
+        self._schema = None
+
+    @property
+    def schema(self) -> "dictator.schema.CompiledSchema":
+        """Get compiled element schema."""
+        if self._schema is None:
+            self._schema = dictator.schema.compile_schema(
+                self._required, self._optional
+            )
+        return self._schema
+
+    @property
+    def impure(self) -> bool:
+        """Get if validation results must not be cached."""
+        # lazily validated values can only be consumed once
+        return self._lazy or self.schema.impure
 
-    @ValidateType(tuple, list)
     def validate(self, _value, **kwargs):
         """Perform sub-validation."""
-        validator_args = kwargs.pop("_validator_args", {})
-        validator_args.update(self._validator_options)
-        return [
-            dictator.config.validate_config(
-                entry,
-                self._required,
-                self._optional,
-                parent_keys=kwargs,
-                **validator_args,
+        if self._lazy:
+            return self.iter_validate(_value, **kwargs)
+        return self._validate_list(_value, **kwargs)
+
+    @ValidateType(tuple, list)
+    def _validate_list(self, _value, **kwargs):
+        """Validate all elements."""
+        if self._parallel is not None and isinstance(_value, (tuple, list)):
+            return self._validate_parallel(_value, kwargs)
+        return list(self._validate_elements(_value, kwargs))
+
+    def _share_parent(self, context: Mapping, entries: Sequence[Any]):
+        """Get a copy of the parent keys referenced by elements."""
+        if self._shared_keys is not None:
+            keys = set(self._shared_keys)
+        else:
+            keys = set()
+            _find_parent_references(entries, keys)
+
+        shared = {key: context[key] for key in keys if key in context}
+        if context.parent is None:
+            shared["_parent"] = None
+            return shared
+
+        # keep the top-level configuration available too
+        root = context.root
+        shared["_parent"] = {key: root[key] for key in keys if key in root}
+        shared["_parent"]["_parent"] = None
+        return shared
+
+    def _validate_parallel(
+        self, entries: Sequence[Any], kwargs: Dict[str, Any]
+    ) -> List[Any]:
+        """Validate elements concurrently."""
+        context = get_context(kwargs)
+        validator_args = {**context.validator_args, **self._validator_options}
+        # profiling and error collection are not thread-safe
+        validator_args.pop("profiler", None)
+        validator_args.pop("errors", None)
+        if validator_args.get("summarize_unknown"):
+            # unknown keys are summarized by element
+            validator_args["summarize_unknown"] = True
+        offsets = range(0, len(entries), self._chunk_size)
+        chunks = [entries[off : off + self._chunk_size] for off in offsets]
+
+        if isinstance(self._parallel, Executor):
+            executor = self._parallel
+        elif self._parallel == "thread":
+            executor = ThreadPoolExecutor(self._max_workers)
+        else:
+            executor = ProcessPoolExecutor(self._max_workers)
+
+        if isinstance(executor, ProcessPoolExecutor):
+            task = partial(
+                _validate_chunk_in_worker,
+                self._token,
+                (self._required, self._optional),
             )
-            for entry in _value
-        ]
+            parent = self._share_parent(context, entries)
+            # caches are local to each process, and unknown keys found by
+            # workers are not known here
+            cache = validator_args.pop("cache", None)
+            if cache is not None:
+                cache.mark_uncacheable()
+        else:
+            task = partial(_validate_chunk, self.schema.validate)
+            parent = context
+
+        results = []
+        try:
+            for chunk_results in executor.map(
+                task,
+                offsets,
+                chunks,
+                itertools.repeat(parent),
+                itertools.repeat(validator_args),
+            ):
+                results.extend(chunk_results)
+        finally:
+            if executor is not self._parallel:
+                executor.shutdown(cancel_futures=True)
+
+        return results
+
+    def iter_validate(self, entries: Iterable[Any], **kwargs: Any) -> Iterator:
+        """Validate elements one at a time.
+
+        Parameters
+        ----------
+        entries
+            Any iterable of elements, e.g. a generator decoding the lines of
+            a file, so that elements don't need to be held in memory
+        kwargs
+            Validator metadata
+        """
+        if isinstance(entries, (str, bytes, dict)) or not isinstance(
+            entries, Iterable
+        ):
+            raise ValidationError(
+                f"value has unexpected type: {type(entries).__name__}"
+            )
+        return self._validate_elements(entries, kwargs, profile=False)
+
+    def _validate_elements(
+        self,
+        entries: Iterable[Any],
+        kwargs: Dict[str, Any],
+        profile: bool = True,
+    ) -> Iterator:
+        """Validate elements, generating validated values."""
+        context = get_context(kwargs)
+        validator_args = {**context.validator_args, **self._validator_options}
+        if not profile:
+            # elements are validated outside of the validation of the list
+            validator_args.pop("profiler", None)
+            validator_args.pop("errors", None)
+            if validator_args.get("summarize_unknown"):
+                validator_args["summarize_unknown"] = True
+        validate_fn = self.schema.validate
+        errors = validator_args.get("errors")
+        unknown = validator_args.get("summarize_unknown")
+        if not isinstance(unknown, UnknownKeys):
+            unknown = None
+        if errors is not None or unknown is not None:
+            yield from self._collect_elements(
+                entries, context, validator_args, errors, unknown
+            )
+            return
+        for index, entry in enumerate(entries):
+            try:
+                yield validate_fn(entry, parent_keys=context, **validator_args)
+            except ValidationError as err:
+                raise err.with_parent(index) from err.__cause__
+
+    def _collect_elements(
+        self,
+        entries: Iterable[Any],
+        context: Mapping,
+        validator_args: Dict[str, Any],
+        errors: Optional[ErrorCollector],
+        unknown: Optional[UnknownKeys] = None,
+    ) -> Iterator:
+        """Validate elements, collecting errors or unknown keys.
+
+        Errors are collected instead of raised if errors is not None, and
+        unknown keys found in elements are given their index if unknown is
+        not None.
+        """
+        validate_fn = self.schema.validate
+        for index, entry in enumerate(entries):
+            if errors is not None:
+                count = len(errors)
+                errors.enter(index)
+            if unknown is not None:
+                start = len(unknown.paths)
+            try:
+                value = validate_fn(
+                    entry, parent_keys=context, **validator_args
+                )
+            except ValidationErrors:
+                raise
+            except ValidationError as err:
+                if errors is None:
+                    raise err.with_parent(index) from err.__cause__
+                errors.add(err, type(self).__name__, entry)
+                continue
+            except ConfigurationError as err:
+                if errors is None:
+                    raise
+                errors.add(err, type(self).__name__, entry)
+                continue
+            finally:
+                if errors is not None:
+                    errors.leave()
+                if unknown is not None:
+                    unknown.add_parent(start, index)
+            if errors is None or len(errors) == count:
+                yield value
 
 
 class HomogeneousValidator(Validator):
@@ -114,9 +535,17 @@ class HomogeneousValidator(Validator):
 
     All elements in a list are verified to be of the same type. If not,
     validation fails.
+
+    Lists of primitive types (int, float, bool and str), optionally with an
+    integer range, are checked in bulk; validation falls back to checking
+    each element when some element is not exactly of the expected type, so
+    that conversions and error messages are unchanged.
     """
 
+    __slots__ = ("_validator", "_container", "_fast_type", "_bounds", "_parse")
+
     _DEFAULT_NAME = "list_type"
+    _USES_CONTEXT = True
 
     DEFAULT_VALIDATOR_BY_TYPE = {
         int: validate_integer,
@@ -127,13 +556,26 @@ class HomogeneousValidator(Validator):
         float: validate_float,
     }
 
-    def __init__(self, validator: Union[Type, Callable], **kwargs: Any):
+    # array.array type codes, by element type
+    ARRAY_TYPECODES = {int: "q", float: "d"}
+    CONTAINERS = ("list", "array", "numpy")
+
+    def __init__(
+        self,
+        validator: Union[Type, Callable],
+        container: str = "list",
+        **kwargs: Any,
+    ):
         """Initialize.
 
         Parameters
         ----------
         validator
             A validator object
+        container
+            Type of validated value: list, array (array.array, for int and
+            float elements) or numpy (NumPy array, for int, float, bool and
+            str elements)
         kwargs
             Any other metadata
         """
@@ -141,11 +583,98 @@ class HomogeneousValidator(Validator):
             raise TypeError(
                 "validator must either be a callable or a python type"
             )
+        if container not in self.CONTAINERS:
+            raise ValueError(
+                f"unknown container '{container}', choose from "
+                + ", ".join(self.CONTAINERS)
+            )
         super().__init__()
         self._validator = validator
+        self._container = container
 
-    @ValidateType(tuple, list)
+        # element type and bounds checked in bulk, and bulk parsing function
+        self._fast_type = None
+        self._bounds = (None, None)
+        self._parse = None
+        if validator in (int, float, bool, str):
+            self._fast_type = validator
+            if validator is int:
+                self._parse = parse_integers
+        elif type(validator) is ValidateInteger:
+            self._fast_type = int
+            self._parse = partial(
+                parse_integers,
+                bare=validator.bare,
+                underscores=validator.underscores,
+            )
+        else:
+            owner = validator
+            while isinstance(owner, ValidatorFactory):
+                owner = getattr(owner._validatefn, "__self__", None)
+            if type(owner) is ValidateIntRange:
+                self._fast_type = int
+                self._bounds = (owner._start, owner._end)
+
+        if container == "array" and (
+            self._fast_type not in self.ARRAY_TYPECODES
+        ):
+            raise ValueError("array container requires int or float elements")
+        if container == "numpy":
+            if self._fast_type is None:
+                raise ValueError(
+                    "numpy container requires int, float, bool or str "
+                    "elements"
+                )
+            if numpy is None:
+                raise ImportError("numpy container requires NumPy")
+
+    @property
+    def impure(self) -> bool:
+        """Get if validation results must not be cached."""
+        return not isinstance(self._validator, type) and _is_impure(
+            self._validator.validate
+            if isinstance(self._validator, Validator)
+            else self._validator
+        )
+
+    def _in_range(self, values: Any) -> bool:
+        """Check bounds of all values at once."""
+        start, end = self._bounds
+        if not len(values) or (start is None and end is None):
+            return True
+        if self._container == "numpy":
+            low, high = values.min(), values.max()
+        else:
+            low, high = min(values), max(values)
+        return (start is None or low >= start) and (end is None or high <= end)
+
+    def _convert(self, values: List[Any]) -> Any:
+        """Convert validated elements into the selected container."""
+        try:
+            if self._container == "array":
+                return array.array(
+                    self.ARRAY_TYPECODES[self._fast_type], values
+                )
+            if self._container == "numpy":
+                return numpy.array(values, dtype=self._fast_type)
+        except OverflowError as err:
+            raise ValidationError(
+                f"values do not fit in {self._container}: {err}"
+            ) from err
+        return values
+
+    @validate_list_pre
     def validate(self, _value, **kwargs):
+        if self._fast_type is not None and set(map(type, _value)) <= {
+            self._fast_type
+        }:
+            modified_value = self._convert(list(_value))
+            if self._in_range(modified_value):
+                return modified_value
+
+        if self._parse is not None:
+            return self._convert(self._parse(_value))
+
         validate_fn = (
             self.DEFAULT_VALIDATOR_BY_TYPE[self._validator]
             if isinstance(self._validator, type)
@@ -154,4 +683,4 @@ class HomogeneousValidator(Validator):
         if isinstance(validate_fn, Validator):
             validate_fn = validate_fn.validate
         modified_value = [validate_fn(item) for item in _value]
-        return modified_value
+        return self._convert(modified_value)
@@ -2,7 +2,8 @@
 
 from dictator.validators import Validator
 from dictator.validators.base import ValidateType
-import dictator.config
+from dictator.context import get_context
+import dictator.schema
 from typing import Dict, Any, Optional
 
 
@@ -13,7 +14,10 @@ class SubDictValidator(Validator):
     associated with it.
     """
 
+    __slots__ = ("_validator_options", "_optional", "_required", "_schema")
+
     _DEFAULT_NAME = "sub_dict"
+    _USES_CONTEXT = True
 
     def __init__(
         self,
@@ -50,16 +54,27 @@ class SubDictValidator(Validator):
             self._validator_options = validator_options
         self._optional = optional_keys
         self._required = required_keys
+        self._schema = None
+
+    @property
+    def schema(self) -> "dictator.schema.CompiledSchema":
+        """Get compiled schema."""
+        if self._schema is None:
+            self._schema = dictator.schema.compile_schema(
+                self._required, self._optional
+            )
+        return self._schema
+
+    @property
+    def impure(self) -> bool:
+        """Get if validation results must not be cached."""
+        return self.schema.impure
 
     @ValidateType(dict)
     def validate(self, _value, **kwargs):
         """Perform sub-validation."""
-        validator_args = kwargs.pop("_validator_args", {})
-        validator_args.update(self._validator_options)
-        return dictator.config.validate_config(
-            _value,
-            self._required,
-            self._optional,
-            parent_keys=kwargs,
-            **validator_args
+        context = get_context(kwargs)
+        validator_args = {**context.validator_args, **self._validator_options}
+        return self.schema.validate(
+            _value, parent_keys=context, **validator_args
         )
@@ -1,10 +1,13 @@
 """Replace string fragments with validated values."""
 
 import re
-from typing import Dict, Any
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Dict, Any, NamedTuple, Set, Tuple, Union
 from dictator.validators import Validator
 from dictator.validators.base import validate_string
 from dictator.validators.dependency import KeyDependency
+from dictator.context import ValidationContext, get_context
 from dictator.errors import ValidationError
 
 
@@ -15,6 +18,10 @@ class FragmentError(ValidationError):
 class FragmentReplace(Validator):
     """Replace string fragments."""
 
+    __slots__ = ("_patterns",)
+
+    _USES_CONTEXT = True
+
     def __init__(self, patterns: Dict[str, str], **kwargs: Dict[str, Any]):
         """Initialize.
 
@@ -41,23 +48,65 @@ class FragmentReplace(Validator):
         """Get patterns."""
         return [pattern for pattern, _ in self._patterns]
 
+    def get_dependencies(self, _value: Any) -> Tuple[str, ...]:
+        """Get dependencies."""
+        return tuple(self.required_keys)
+
     @validate_string
     def validate(self, _value, **kwargs):
         """Perform validation."""
 
         @KeyDependency(*self.required_keys)
         def _validate(_value, **kwargs):
+            context = get_context(kwargs)
             for pattern, key in self._patterns:
-                return re.sub(pattern, kwargs[key], _value)
+                return re.sub(pattern, context[key], _value)
 
         return _validate(_value, **kwargs)
 
 
+class _Reference(NamedTuple):
+    """Key reference in a template."""
+
+    kind: str
+    path: Tuple[str, ...]
+    text: str
+
+
+TEMPLATE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _parse_template(template: str) -> Tuple[Union[str, _Reference], ...]:
+    """Parse template into literal and key reference segments."""
+    segments = []
+    pos = 0
+    for match in AutoFragmentReplace.REPLACE_PATTERN.finditer(template):
+        if match.start() > pos:
+            segments.append(template[pos : match.start()])
+        rel, key = match.groups()
+        segments.append(
+            _Reference(
+                AutoFragmentReplace.get_key_type(rel or ""),
+                tuple(key.split("::")),
+                key,
+            )
+        )
+        pos = match.end()
+    if pos < len(template):
+        segments.append(template[pos:])
+
+    return tuple(segments)
+
+
 class AutoFragmentReplace(Validator):
     """Automatic fragment replacer."""
 
+    __slots__ = ()
+
     REPLACE_PATTERN = re.compile(r"\$\{((?:\.\.)|:)?([\w:]+)\}")
     KEY_REF_TYPES = ("parent", "top", "normal")
+    _USES_CONTEXT = True
 
     @staticmethod
     def get_key_type(leading_str):
@@ -71,95 +120,98 @@ class AutoFragmentReplace(Validator):
 
         raise ValueError("invalid leading characters")
 
-    def validate(self, _value, **kwargs):
-        """Perform validation."""
-        if not isinstance(_value, str):
-            # ignore if not string
-            return _value
-        req_keys = re.findall(self.REPLACE_PATTERN, _value)
-        req_keys = [(key, self.get_key_type(rel)) for rel, key in req_keys]
-
-        true_depends = []
-        soft_depends = {}
-        for req_key, ktype in req_keys:
-            key_accessor = req_key.split("::")
-            if ktype == "parent":
-                if "_parent" not in kwargs or kwargs["_parent"] is None:
+    def get_dependencies(self, _value: Any) -> Tuple[str, ...]:
+        """Get keys referenced from the same configuration level."""
+        if not isinstance(_value, str) or "${" not in _value:
+            return ()
+        return tuple(
+            segment.path[0]
+            for segment in _parse_template(_value)
+            if isinstance(segment, _Reference) and segment.kind == "normal"
+        )
+
+    @staticmethod
+    def _resolve(reference: _Reference, context: ValidationContext) -> Any:
+        """Get value of a key reference."""
+        key = reference.path[0]
+        if reference.kind == "normal":
+            if key not in context:
+                raise FragmentError(f"key {key} is not available")
+            value = context[key]
+            if len(reference.path) > 1 and not isinstance(value, Mapping):
+                raise FragmentError(
+                    "sub-key requested from key which is not dictionary"
+                )
+        else:
+            if reference.kind == "parent":
+                if context.parent is None:
                     raise ValidationError(
                         "key requires a parent configuration which is not available"
                     )
-                key_src = kwargs["_parent"]
-            elif ktype == "normal":
-                true_depends.append(key_accessor[0])
-                continue
+                key_src = context.parent
             else:
-                # top-level
-                parent = kwargs["_parent"]
-                if parent is None:
-                    # already at top-level
-                    key_src = kwargs
-                else:
-                    key_src = None
-                    while parent is not None:
-                        key_src = parent
-                        parent = parent["_parent"]
-
-            if key_accessor[0] not in key_src:
+                key_src = context.root
+            if key not in key_src:
                 raise ValidationError(
-                    f"couldn't find key {req_key} in referred configuration level"
+                    f"couldn't find key {reference.text} in referred configuration level"
                 )
-            if len(key_accessor) > 1:
-                for accessor in key_accessor:
-                    if not isinstance(key_src, dict):
-                        raise ValidationError(
-                            "key is not dictionary, cannot access member"
-                        )
-                    if accessor not in key_src:
-                        raise FragmentError(f"member {accessor} not found")
-                    key_src = key_src[accessor]
-
-                soft_depends[req_key] = key_src
-            else:
-                soft_depends[req_key] = key_src[req_key]
+            value = key_src[key]
 
-        @KeyDependency(*true_depends, validate_after=True)
-        def _validate(_value, **kwargs):
-            for req_key, ktype in req_keys:
-                value_src = soft_depends if ktype != "normal" else kwargs
-                key_accessor = req_key.split("::")
-                if len(key_accessor) > 1 and ktype == "normal":
-                    if key_accessor[0] not in value_src:
-                        raise FragmentError(
-                            f"key {key_accessor[0]} is not available"
-                        )
-                    if not isinstance(value_src[key_accessor[0]], dict):
-                        raise FragmentError(
-                            "sub-key requested from key which is not dictionary"
-                        )
-                    for accessor in key_accessor:
-                        value_src = value_src[accessor]
-                elif req_key not in value_src:
-                    raise FragmentError(f"key {req_key} is not available")
-                else:
-                    value_src = value_src[req_key]
-
-                _value = re.sub(
-                    r"\$\{((?:\.\.)|:)?" + req_key + r"\}",
-                    str(value_src),
-                    _value,
+        for accessor in reference.path[1:]:
+            if not isinstance(value, Mapping):
+                raise ValidationError(
+                    "key is not dictionary, cannot access member"
                 )
-                # convert value back if numeric (and if possible)
-                if isinstance(value_src, int):
-                    try:
-                        return int(_value)
-                    except ValueError:
-                        pass
-                elif isinstance(value_src, float):
-                    try:
-                        return float(_value)
-                    except ValueError:
-                        pass
+            if accessor not in value:
+                raise FragmentError(f"member {accessor} not found")
+            value = value[accessor]
+
+        return value
 
+    def validate(self, _value, **kwargs):
+        """Perform validation."""
+        if not isinstance(_value, str) or "${" not in _value:
+            # ignore if not string
             return _value
 
-        return _validate(_value, **kwargs)
+        context = get_context(kwargs)
+        parts = []
+        value = None
+        for segment in _parse_template(_value):
+            if segment.__class__ is str:
+                parts.append(segment)
+                continue
+            value = self._resolve(segment, context)
+            parts.append(str(value))
+
+        result = "".join(parts)
+        # convert value back if numeric (and if possible)
+        if isinstance(value, int):
+            try:
+                return int(result)
+            except ValueError:
+                pass
+        elif isinstance(value, float):
+            try:
+                return float(result)
+            except ValueError:
+                pass
+
+        return result
+
+
+def _find_parent_references(value: Any, found: Set[str]) -> None:
+    """Find keys referenced from parent levels by fragments in a value."""
+    if isinstance(value, str):
+        if "${" in value:
+            for rel, key in AutoFragmentReplace.REPLACE_PATTERN.findall(
+                value
+            ):
+                if rel:
+                    found.add(key.split("::")[0])
+    elif isinstance(value, dict):
+        for item in value.values():
+            _find_parent_references(item, found)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _find_parent_references(item, found)
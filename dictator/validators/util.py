@@ -1,15 +1,63 @@
 """Utilities."""
 
-from typing import Callable, Union, Type, Any, Optional
-
-from dictator.errors import ValidationError
-from dictator.validators import Validator
+from typing import Callable, Union, Type, Any, Optional, Dict, Tuple
+
+from dictator.errors import ErrorCollector, ValidationError
+from dictator.validators import (
+    Validator,
+    _uses_context,
+    _get_type_check_fn,
+    _is_impure,
+)
 from dictator.validators.base import DEFAULT_VALIDATOR_BY_TYPE
 
 
+def _validate_none(_value: Any, **kwargs: Any) -> None:
+    """Pass null values."""
+    return _value
+
+
+def _get_error_collector(kwargs: Dict[str, Any]) -> Optional[ErrorCollector]:
+    """Get collector of errors from validator keyword arguments, if any."""
+    context = kwargs.get("_context")
+    validator_args = (
+        kwargs.get("_validator_args")
+        if context is None
+        else context.validator_args
+    )
+    if not validator_args:
+        return None
+    return validator_args.get("errors")
+
+
+def _condition_uses_context(condition: Union[Callable, Type, None]) -> bool:
+    """Get if a condition can be called with the context convention."""
+    if condition is None:
+        return True
+    if isinstance(condition, type):
+        return (
+            condition in DEFAULT_VALIDATOR_BY_TYPE
+            and DEFAULT_VALIDATOR_BY_TYPE[condition].uses_context
+        )
+    if isinstance(condition, Validator):
+        return condition.uses_context
+    return _uses_context(condition)
+
+
+def _condition_is_impure(condition: Union[Callable, Type, None]) -> bool:
+    """Get if a condition is marked as impure."""
+    if condition is None or isinstance(condition, type):
+        return False
+    if isinstance(condition, Validator):
+        return condition.impure
+    return _is_impure(condition)
+
+
 class InvertValidation(Validator):
     """Invert validation condition."""
 
+    __slots__ = ("_condition", "_with_context", "_impure")
+
     def __init__(self, condition: Optional[Union[Callable, Type]] = None):
         """Initialize.
 
@@ -28,9 +76,26 @@ class InvertValidation(Validator):
                 "condition must either be: None, a type or a callable"
             )
         self._condition = condition
+        self._with_context = _condition_uses_context(condition)
+        self._impure = _condition_is_impure(condition)
+
+    @property
+    def uses_context(self) -> bool:
+        """Get if validate uses the context calling convention."""
+        return self._with_context
+
+    @property
+    def impure(self) -> bool:
+        """Get if validation results must not be cached."""
+        return self._impure
 
     def validate(self, _value, **kwargs):
         """Perform validation."""
+        errors = _get_error_collector(kwargs)
+        if errors is not None and errors.active:
+            # failures are expected, don't collect them
+            with errors.suspend():
+                return self.validate(_value, **kwargs)
         if self._condition is not None:
             try:
                 _ = (
@@ -69,6 +134,8 @@ class ValidateUnion(Validator):
     Validation succeeds if one of the conditions succeeds.
     """
 
+    __slots__ = ("_conditions", "_with_context", "_impure", "_dispatch")
+
     def __init__(self, *conditions: Union[Callable, Type], **kwargs: Any):
         """Initialize.
 
@@ -88,25 +155,70 @@ class ValidateUnion(Validator):
             ):
                 raise TypeError("condition must be a callable, type or None")
 
-            self._conditions = conditions
+        self._conditions = conditions
+        self._with_context = all(
+            _condition_uses_context(condition) for condition in conditions
+        )
+        self._impure = any(
+            _condition_is_impure(condition) for condition in conditions
+        )
+        # candidate validation functions by value type
+        self._dispatch: Dict[type, Tuple[Callable, ...]] = {}
+
+    @property
+    def uses_context(self) -> bool:
+        """Get if validate uses the context calling convention."""
+        return self._with_context
+
+    @property
+    def impure(self) -> bool:
+        """Get if validation results must not be cached."""
+        return self._impure
+
+    def _get_candidates(self, value_type: type) -> Tuple[Callable, ...]:
+        """Get validation functions that may pass values of a type."""
+        candidates = []
+        for condition in self._conditions:
+            if condition is None:
+                if value_type is type(None):
+                    candidates.append(_validate_none)
+                    break
+                continue
+            if isinstance(condition, type):
+                condition = DEFAULT_VALIDATOR_BY_TYPE[condition]
+            if isinstance(condition, Validator):
+                fn = condition.validate
+            else:
+                fn = condition
+            check_type = _get_type_check_fn(fn)
+            passes = None if check_type is None else check_type(value_type)
+            if passes is False:
+                continue
+            candidates.append(fn)
+            if passes is True:
+                # later conditions are never reached
+                break
+
+        return tuple(candidates)
 
     def validate(self, _value, **kwargs):
         """Perform validation."""
-        for condition in self._conditions:
+        errors = _get_error_collector(kwargs)
+        if errors is not None and errors.active:
+            # failing conditions are expected, don't collect their errors
+            with errors.suspend():
+                return self.validate(_value, **kwargs)
+
+        value_type = type(_value)
+        try:
+            candidates = self._dispatch[value_type]
+        except KeyError:
+            candidates = self._get_candidates(value_type)
+            self._dispatch[value_type] = candidates
+
+        for fn in candidates:
             try:
-                if isinstance(condition, type):
-                    ret = DEFAULT_VALIDATOR_BY_TYPE[condition].validate(
-                        _value, **kwargs
-                    )
-                elif isinstance(condition, Validator):
-                    ret = condition.validate(_value, **kwargs)
-                elif condition is None:
-                    if _value is not None:
-                        continue
-                    ret = _value
-                else:
-                    ret = condition(_value, **kwargs)
-                return ret
+                return fn(_value, **kwargs)
             except ValidationError:
                 continue
 
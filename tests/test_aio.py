@@ -0,0 +1,165 @@
+"""Test asynchronous validation."""
+
+import asyncio
+import pytest
+from dictator.aio import async_validate_config
+from dictator.config import validate_config
+from dictator.errors import (
+    ConfigurationError,
+    MissingDependencyError,
+    MissingRequiredKeyError,
+    ValidationError,
+)
+from dictator.validators import Validator
+from dictator.validators.dependency import DeferValidation, KeyDependency
+from dictator.validators.maps import SubDictValidator
+
+
+class ValidateHost(Validator):
+    """Asynchronous validator, looking up hosts."""
+
+    _DEFAULT_NAME = "host"
+
+    def __init__(self, hosts):
+        """Initialize."""
+        super().__init__()
+        self._hosts = hosts
+
+    async def validate(self, _value, **kwargs):
+        """Perform validation."""
+        await asyncio.sleep(0)
+        if _value not in self._hosts:
+            raise ConfigurationError(f"unknown host: {_value}")
+        return self._hosts[_value]
+
+
+def test_async_validate():
+    """Test validation with coroutine validators."""
+
+    async def double(_value, **kwargs):
+        await asyncio.sleep(0)
+        return _value * 2
+
+    TEST_CONFIG = {
+        "server": "localhost",
+        "port": "0x10",
+        "scale": 21,
+        "extra": None,
+    }
+    TEST_CONFIG_ERR = {"server": "remote", "port": 1, "scale": 1}
+    TEST_CONFIG_REQ = {"server": ValidateHost({"localhost": "127.0.0.1"})}
+    TEST_CONFIG_OPT = {"port": int, "scale": double}
+
+    validated = asyncio.run(
+        async_validate_config(TEST_CONFIG, TEST_CONFIG_REQ, TEST_CONFIG_OPT)
+    )
+    assert validated == {"server": "127.0.0.1", "port": 16, "scale": 42}
+    assert list(validated) == ["server", "port", "scale"]
+
+    with pytest.raises(ConfigurationError, match="unknown host"):
+        asyncio.run(
+            async_validate_config(
+                TEST_CONFIG_ERR, TEST_CONFIG_REQ, TEST_CONFIG_OPT
+            )
+        )
+    with pytest.raises(MissingRequiredKeyError):
+        asyncio.run(async_validate_config({}, TEST_CONFIG_REQ))
+
+    # synchronous validators give the same results
+    TEST_CONFIG_SYNC = {"port": int, "scale": int}
+    assert asyncio.run(
+        async_validate_config(TEST_CONFIG, None, TEST_CONFIG_SYNC)
+    ) == validate_config(TEST_CONFIG, None, TEST_CONFIG_SYNC)
+
+
+def test_async_concurrency():
+    """Test concurrency limit."""
+    active = []
+    peak = []
+
+    async def track(_value, **kwargs):
+        active.append(_value)
+        peak.append(len(active))
+        await asyncio.sleep(0.01)
+        active.remove(_value)
+
+    TEST_CONFIG = {f"key{index}": index for index in range(8)}
+    TEST_CONFIG_REQ = {key: track for key in TEST_CONFIG}
+
+    validated = asyncio.run(
+        async_validate_config(TEST_CONFIG, TEST_CONFIG_REQ)
+    )
+    assert validated == TEST_CONFIG
+    assert max(peak) == 8
+
+    peak.clear()
+    asyncio.run(
+        async_validate_config(TEST_CONFIG, TEST_CONFIG_REQ, max_concurrency=3)
+    )
+    assert max(peak) == 3
+
+    with pytest.raises(ValueError):
+        asyncio.run(
+            async_validate_config(
+                TEST_CONFIG, TEST_CONFIG_REQ, max_concurrency=0
+            )
+        )
+
+
+def test_async_dependencies():
+    """Test dependency ordering."""
+    order = []
+
+    async def record(_value, **kwargs):
+        await asyncio.sleep(0.01 * _value)
+        order.append(_value)
+
+    @KeyDependency("first")
+    async def dependent(_value, **kwargs):
+        order.append(_value)
+        return kwargs["first"] + _value
+
+    def deferred(_value, **kwargs):
+        if "dependent" not in kwargs:
+            raise DeferValidation("dependent")
+        return kwargs["dependent"] + _value
+
+    TEST_CONFIG = {"deferred": 100, "dependent": 10, "first": 2, "other": 1}
+    TEST_CONFIG_REQ = {
+        "deferred": deferred,
+        "dependent": dependent,
+        "first": record,
+        "other": record,
+    }
+
+    validated = asyncio.run(
+        async_validate_config(TEST_CONFIG, TEST_CONFIG_REQ)
+    )
+    assert validated == {
+        "deferred": 112,
+        "first": 2,
+        "dependent": 12,
+        "other": 1,
+    }
+    assert order == [1, 2, 10]
+
+    with pytest.raises(MissingDependencyError):
+        asyncio.run(
+            async_validate_config({"deferred": 1}, {"deferred": deferred})
+        )
+
+
+def test_async_nested():
+    """Test coroutine validators in sub-validators."""
+    TEST_CONFIG = {"host": "localhost", "sub": {"host": "remote"}}
+    TEST_CONFIG_REQ = {
+        "host": ValidateHost({"localhost": "127.0.0.1"}),
+        "sub": SubDictValidator({"host": ValidateHost({})}),
+    }
+
+    # nested coroutines are not awaited, so they are rejected
+    with pytest.raises(ValidationError, match="awaitable") as excinfo:
+        asyncio.run(async_validate_config(TEST_CONFIG, TEST_CONFIG_REQ))
+    assert excinfo.value.path == ("sub", "host")
+    with pytest.raises(ValidationError, match="awaitable"):
+        validate_config(TEST_CONFIG, TEST_CONFIG_REQ)
@@ -0,0 +1,154 @@
+"""Test validation result caching."""
+
+import array
+import logging
+
+import pytest
+from dictator.cache import ValidationCache, impure
+from dictator.config import validate_config
+from dictator.errors import ValidationError
+from dictator.schema import compile_schema
+from dictator.validators.lists import SubListValidator
+from dictator.validators.maps import SubDictValidator
+from dictator.validators.replace import AutoFragmentReplace
+
+
+def test_cache():
+    """Test caching configurations and sub-configurations."""
+    calls = []
+
+    def _count(_value, **kwargs):
+        calls.append(_value)
+        return _value
+
+    TEST_REQ = {"name": str, "sub": SubDictValidator({"port": _count})}
+    cache = ValidationCache()
+
+    first = validate_config(
+        {"name": "a", "sub": {"port": 1}}, TEST_REQ, cache=cache
+    )
+    second = validate_config(
+        {"name": "a", "sub": {"port": 1}}, TEST_REQ, cache=cache
+    )
+    assert first == second
+    assert first is not second
+    assert first["sub"] is not second["sub"]
+    assert calls == [1]
+    assert cache.info().hits == 1
+
+    # same sub-configuration in another configuration
+    validate_config({"name": "b", "sub": {"port": 1}}, TEST_REQ, cache=cache)
+    assert calls == [1]
+    assert cache.hits == 2
+
+    # equal values of other types are not mixed
+    validate_config(
+        {"name": "b", "sub": {"port": True}}, TEST_REQ, cache=cache
+    )
+    assert calls == [1, True]
+
+    # returned values can be modified
+    first["sub"]["port"] = 2
+    third = validate_config(
+        {"name": "a", "sub": {"port": 1}}, TEST_REQ, cache=cache
+    )
+    assert third["sub"]["port"] == 1
+
+    # errors are not cached
+    with pytest.raises(ValidationError):
+        validate_config({"name": 1, "sub": {"port": 1}}, TEST_REQ, cache=cache)
+    with pytest.raises(ValidationError):
+        validate_config({"name": 1, "sub": {"port": 1}}, TEST_REQ, cache=cache)
+
+
+def test_cache_optional_only():
+    """Test caching with optional keys only."""
+    TEST_OPT = {"name": str}
+    cache = ValidationCache()
+
+    for _ in range(5):
+        validate_config({"name": "a"}, None, TEST_OPT, cache=cache)
+    info = cache.info()
+    assert (info.hits, info.misses, info.currsize) == (4, 1, 1)
+
+
+def test_cache_parent_references():
+    """Test caching configurations referencing parent keys."""
+    TEST_REQ = {
+        "base": str,
+        "entries": SubListValidator({"name": AutoFragmentReplace()}),
+    }
+    schema = compile_schema(TEST_REQ, cache=ValidationCache())
+    TEST_CONFIG = {"base": "a", "entries": [{"name": "${..base}_x"}]}
+
+    assert schema.validate(TEST_CONFIG)["entries"][0]["name"] == "a_x"
+    TEST_CONFIG["base"] = "b"
+    assert schema.validate(TEST_CONFIG)["entries"][0]["name"] == "b_x"
+
+
+def test_cache_impure():
+    """Test bypassing cache for impure validators."""
+    calls = []
+
+    @impure
+    def _count(_value, **kwargs):
+        calls.append(_value)
+        return _value
+
+    cache = ValidationCache(maxsize=1)
+    TEST_REQ = {"sub": SubDictValidator({"port": _count})}
+    for _ in range(2):
+        validate_config({"sub": {"port": 1}}, TEST_REQ, cache=cache)
+    assert calls == [1, 1]
+    # impure configurations are not even looked up
+    assert cache.info() == (0, 0, 1, 0)
+
+    # LRU bound
+    cache.clear()
+    schema = compile_schema({"port": int}, cache=cache)
+    for port in (1, 2, 1):
+        schema.validate({"port": port})
+    assert cache.info() == (0, 3, 1, 1)
+
+    cache.clear()
+    assert cache.info() == (0, 0, 1, 0)
+
+    with pytest.raises(ValueError):
+        ValidationCache(maxsize=0)
+
+
+def test_cache_unknown(caplog):
+    """Test reporting unknown keys on every validation."""
+    TEST_REQ = {"sub": SubDictValidator({"port": int})}
+    TEST_CONFIG = {"sub": {"port": 1, "extra": 2}}
+    cache = ValidationCache()
+
+    with caplog.at_level(logging.WARNING, logger="dictator"):
+        for _ in range(2):
+            validate_config(
+                TEST_CONFIG, TEST_REQ, verbosity="warning", cache=cache
+            )
+            validate_config(
+                {"top": 1, "sub": {"port": 1}},
+                TEST_REQ,
+                verbosity="warning",
+                cache=cache,
+            )
+    assert caplog.messages == [
+        "unknown key: 'extra'",
+        "unknown key: 'top'",
+    ] * 2
+    # only the sub-configuration without unknown keys is cached
+    assert cache.info().currsize == 1
+
+
+def test_cache_copies():
+    """Test copying mutable validated values."""
+    TEST_REQ = {"values": lambda _value, **kwargs: array.array("i", _value)}
+    cache = ValidationCache()
+
+    first = validate_config({"values": (1, 2)}, TEST_REQ, cache=cache)
+    first["values"].append(3)
+    second = validate_config({"values": (1, 2)}, TEST_REQ, cache=cache)
+    assert second["values"] == array.array("i", (1, 2))
+    assert cache.hits == 1
@@ -0,0 +1,113 @@
+"""Test generated validation functions."""
+
+import gc
+import weakref
+import pytest
+from dictator.codegen import generate_validator
+from dictator.errors import (
+    ConfigurationError,
+    MissingRequiredKeyError,
+    UnknownKeyError,
+)
+from dictator.schema import compile_schema
+from dictator.validators.dependency import DeferValidation, KeyDependency
+from dictator.validators.integer import ValidateIntRange
+from dictator.validators.lists import ValidateChoice
+from dictator.validators.maps import SubDictValidator
+
+TEST_REQ = {
+    "name": str,
+    "count": int,
+    "mode": ValidateChoice("fast", "slow", 1),
+    "level": ValidateIntRange(0, 10),
+    "sub": SubDictValidator({"enabled": bool}),
+}
+TEST_OPT = {"anything": None, "union": [int, str]}
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"name": "a", "count": 1, "mode": "fast", "level": 3, "sub": {}},
+        {"name": "a", "count": "0x10", "mode": 1, "level": "0b1", "sub": {}},
+        {
+            "anything": [1],
+            "name": "a",
+            "count": 1,
+            "extra": 1,
+            "mode": "slow",
+            "level": 10,
+            "sub": {"enabled": True},
+            "union": "x",
+        },
+        {"name": 1, "count": 1, "mode": "fast", "level": 3, "sub": {}},
+        {"name": "a", "count": True, "mode": "fast", "level": 3, "sub": {}},
+        {"name": "a", "count": 1, "mode": "other", "level": 3, "sub": {}},
+        {"name": "a", "count": 1, "mode": [1], "level": 3, "sub": {}},
+        {"name": "a", "count": 1, "mode": "fast", "level": 11, "sub": {}},
+        {"name": "a", "count": 1, "mode": "fast", "level": 3, "sub": []},
+        {"name": "a", "count": 1, "mode": "fast", "level": 3},
+        {"name": "a", "count": 1, "mode": "fast", "level": 3, 1: 1},
+    ],
+)
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"allow_unknown": False}, {"gobble_unknown": False}],
+)
+def test_generated(config, options):
+    """Test generated functions against the generic path."""
+    schema = compile_schema(TEST_REQ, TEST_OPT, **options)
+    validate_fn = generate_validator(schema)
+    assert validate_fn is not schema.validate
+    assert generate_validator(schema) is validate_fn
+
+    try:
+        expected = schema.validate(config)
+    except (ConfigurationError, TypeError) as err:
+        with pytest.raises(type(err)) as result:
+            validate_fn(config)
+        assert str(result.value) == str(err)
+    else:
+        result = validate_fn(config)
+        assert result == expected
+        assert list(result) == list(expected)
+
+
+def test_generated_fallback():
+    """Test schemas that use the generic path."""
+    schema = compile_schema({"a": KeyDependency("b")}, {"b": int})
+    assert generate_validator(schema) == schema.validate
+
+    def _defer(_value, **kwargs):
+        if "b" not in kwargs:
+            raise DeferValidation("b")
+        return _value
+
+    schema = compile_schema({"a": _defer, "b": int})
+    validate_fn = generate_validator(schema)
+    assert validate_fn is not schema.validate
+    assert validate_fn({"a": 1, "b": 2}) == {"b": 2, "a": 1}
+
+    with pytest.raises(MissingRequiredKeyError):
+        validate_fn({"a": 1})
+
+    schema = compile_schema({"a": int}, allow_unknown=False)
+    with pytest.raises(UnknownKeyError):
+        generate_validator(schema)({"a": 1, "b": 2})
+
+
+def test_generated_freed():
+    """Test that generated functions do not keep schemas alive."""
+    schemas = [
+        compile_schema({"a": int}),
+        compile_schema({"a": KeyDependency("b")}, {"b": int}),
+    ]
+    refs = []
+    for schema in schemas:
+        validate_fn = generate_validator(schema)
+        assert generate_validator(schema) is validate_fn
+        refs.append(weakref.ref(schema))
+    del schema, schemas, validate_fn
+    gc.collect()
+
+    assert all(ref() is None for ref in refs)
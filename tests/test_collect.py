@@ -0,0 +1,154 @@
+"""Test error collection."""
+
+import pytest
+from dictator.config import validate_config
+from dictator.errors import (
+    ConfigurationError,
+    ErrorCollector,
+    ValidationErrors,
+)
+from dictator.schema import compile_schema
+from dictator.validators.dependency import KeyDependency
+from dictator.validators.integer import ValidateIntRange
+from dictator.validators.lists import SubListValidator
+from dictator.validators.maps import SubDictValidator
+from dictator.validators.util import ValidateUnion
+
+
+def test_collect_errors():
+    """Test collecting errors."""
+    TEST_CONFIG = {
+        "name": 1,
+        "port": 200,
+        "server": {"host": "localhost", "port": "x"},
+        "items": [{"id": 1}, {"id": "z"}, 5, {}],
+        "extra": 42,
+    }
+    TEST_CONFIG_REQ = {
+        "name": str,
+        "port": ValidateIntRange(0, 100),
+        "server": SubDictValidator({"host": str, "port": int}),
+        "items": SubListValidator({"id": int}),
+        "missing": int,
+    }
+
+    with pytest.raises(ValidationErrors) as excinfo:
+        validate_config(TEST_CONFIG, TEST_CONFIG_REQ, errors=ErrorCollector())
+
+    errors = excinfo.value.errors
+    assert [error.path for error in errors] == [
+        ("missing",),
+        ("name",),
+        ("port",),
+        ("server", "port"),
+        ("items", 1, "id"),
+        ("items", 2),
+        ("items", 3, "id"),
+    ]
+    assert errors[2].validator == "ValidateIntRange"
+    assert errors[2].value == "200"
+    assert str(errors[4]) == "items[1].id: cannot validate as integer"
+    assert not excinfo.value.truncated
+    assert isinstance(excinfo.value, ConfigurationError)
+
+    # the same collector is reset for each validation
+    collector = ErrorCollector()
+    TEST_CONFIG_VALID = {"name": "x", "server": {"host": "y"}}
+    TEST_CONFIG_OPT = {"server": SubDictValidator({"host": str})}
+    validated = validate_config(
+        TEST_CONFIG_VALID, {"name": str}, TEST_CONFIG_OPT, errors=collector
+    )
+    assert validated == TEST_CONFIG_VALID
+    assert len(collector) == 0
+
+    with pytest.raises(ValueError):
+        ErrorCollector(max_errors=0)
+
+
+def test_collect_errors_max():
+    """Test maximum number of collected errors."""
+    TEST_CONFIG = {f"key{index}": "value" for index in range(10)}
+    TEST_CONFIG_REQ = {key: int for key in TEST_CONFIG}
+    schema = compile_schema(TEST_CONFIG_REQ, errors=ErrorCollector(3))
+
+    with pytest.raises(ValidationErrors) as excinfo:
+        schema.validate(TEST_CONFIG)
+
+    assert excinfo.value.truncated
+    assert [error.path for error in excinfo.value.errors] == [
+        ("key0",),
+        ("key1",),
+        ("key2",),
+    ]
+
+    with pytest.raises(ValidationErrors) as excinfo:
+        schema.validate(TEST_CONFIG, errors=ErrorCollector(None))
+    assert len(excinfo.value.errors) == 10
+
+    # exactly as many errors as the maximum
+    with pytest.raises(ValidationErrors) as excinfo:
+        schema.validate(TEST_CONFIG, errors=ErrorCollector(10))
+    assert len(excinfo.value.errors) == 10
+    assert not excinfo.value.truncated
+
+
+def test_collect_errors_types():
+    """Test collecting configuration type errors only."""
+    TEST_CONFIG_REQ = {"items": SubListValidator({"id": int})}
+
+    with pytest.raises(ValidationErrors) as excinfo:
+        validate_config(
+            {"items": [{"id": 1}, 2, {"id": 2, 3: 4}]},
+            TEST_CONFIG_REQ,
+            errors=ErrorCollector(),
+        )
+    assert [str(error) for error in excinfo.value.errors] == [
+        "items[1]: configuration must be a dictionary, got: <class 'int'>",
+        "items[2]: keys must be string values",
+    ]
+
+    # errors of validators are raised
+    def _broken(_value, **kwargs):
+        return _value + 1
+
+    with pytest.raises(TypeError):
+        validate_config(
+            {"id": "x"}, {"id": _broken}, errors=ErrorCollector()
+        )
+
+
+def test_collect_errors_skip():
+    """Test skipping keys depending on failed keys."""
+    TEST_CONFIG = {"port": "x", "host": 1, "address": 1, "option": {"a": 1}}
+    TEST_CONFIG_REQ = {
+        "port": int,
+        "host": str,
+        "address": KeyDependency("host"),
+        "option": ValidateUnion(int, SubDictValidator({"a": str}), dict),
+    }
+
+    with pytest.raises(ValidationErrors) as excinfo:
+        validate_config(TEST_CONFIG, TEST_CONFIG_REQ, errors=ErrorCollector())
+
+    # failing union alternatives are not collected
+    assert [error.path for error in excinfo.value.errors] == [
+        ("port",),
+        ("host",),
+    ]
+
+
+def test_collect_revalidate():
+    """Test collecting errors when revalidating."""
+    schema = compile_schema({"a": int, "b": int}, errors=ErrorCollector())
+    OLD_CONFIG = {"a": 1, "b": 2}
+    previous = schema.validate(OLD_CONFIG)
+
+    NEW_CONFIG = {"a": 1, "b": 3}
+    assert schema.revalidate(previous, OLD_CONFIG, NEW_CONFIG) == NEW_CONFIG
+
+    with pytest.raises(ValidationErrors) as excinfo:
+        schema.revalidate(previous, OLD_CONFIG, {"b": "x"})
+    assert [error.path for error in excinfo.value.errors] == [
+        ("a",),
+        ("b",),
+    ]
@@ -4,7 +4,8 @@ import pytest
 from dictator.validators.util import ValidateUnion, InvertValidation
 from dictator.errors import ValidationError
 from dictator.config import validate_config
-from dictator.validators.base import validate_string
+from dictator.validators.base import validate_string, _validate_integer
+from dictator.validators.integer import ValidateIntRange
 
 
 def test_union():
@@ -39,3 +40,36 @@ def test_negate():
         return _value
 
     validate_config(TEST_CONFIG_1, {"myKey": _validator})
+
+
+def test_union_dispatch():
+    """Test union type dispatch."""
+    calls = []
+
+    def _validate_opaque(_value, **kwargs):
+        calls.append(_value)
+        return _value
+
+    TEST_CONFIG_REQ = {"myKey": [int, str, None, _validate_opaque]}
+
+    assert validate_config({"myKey": "0x10"}, TEST_CONFIG_REQ)["myKey"] == 16
+    assert validate_config({"myKey": "bla"}, TEST_CONFIG_REQ)["myKey"] == "bla"
+    assert validate_config({"myKey": None}, TEST_CONFIG_REQ)["myKey"] is None
+    assert calls == []
+
+    assert validate_config({"myKey": 1.5}, TEST_CONFIG_REQ)["myKey"] == 1.5
+    assert calls == [1.5]
+
+    with pytest.raises(ValidationError):
+        validate_config({"myKey": True}, {"myKey": ValidateUnion(int, str)})
+
+
+def test_union_decorated():
+    """Test union of decorated validation functions."""
+    validate_small = ValidateIntRange(0, 10)(_validate_integer)
+    validator = ValidateUnion(validate_small, ValidateIntRange(100, 200))
+
+    assert validator.validate(5) == 5
+    assert validator.validate(150) == 150
+    with pytest.raises(ValidationError):
+        validator.validate(50)
@@ -0,0 +1,99 @@
+"""Test validator calling conventions."""
+
+from dictator.config import validate_config
+from dictator.context import ValidationContext, uses_context
+from dictator.validators.maps import SubDictValidator
+from dictator.validators.dependency import KeyDependency
+from dictator.validators.integer import ValidateIntRange
+
+
+def test_context_convention():
+    """Test validators using the context calling convention."""
+
+    @uses_context
+    def _validate_sum(_value, _context):
+        assert isinstance(_context, ValidationContext)
+        return _value + _context["first"]
+
+    TEST_CONFIG = {"first": 1, "second": 2}
+    TEST_REQ = {"first": int, "second": _validate_sum}
+
+    assert validate_config(TEST_CONFIG, TEST_REQ)["second"] == 3
+
+
+def test_legacy_convention():
+    """Test validators using keyword arguments."""
+
+    def _validate_sum(_value, **kwargs):
+        assert "_context" not in kwargs
+        return _value + kwargs["first"] + kwargs["_parent"]["top"]
+
+    TEST_CONFIG = {"top": 10, "sub": {"first": 1, "second": 2}}
+    TEST_REQ = {
+        "top": int,
+        "sub": SubDictValidator(
+            {"first": int, "second": KeyDependency("first")(_validate_sum)}
+        ),
+    }
+
+    assert validate_config(TEST_CONFIG, TEST_REQ)["sub"]["second"] == 13
+
+
+def test_context_parent():
+    """Test parent access through the context."""
+
+    @uses_context
+    def _validate_parent(_value, _context):
+        return _context.parent["top"] + _value
+
+    TEST_CONFIG = {"top": 10, "sub": {"value": 1}}
+    TEST_REQ = {
+        "top": int,
+        "sub": SubDictValidator({"value": _validate_parent}),
+    }
+
+    assert validate_config(TEST_CONFIG, TEST_REQ)["sub"]["value"] == 11
+
+
+def test_decorated_convention():
+    """Test decorated validators keep a consistent calling convention."""
+
+    @KeyDependency("first")
+    @uses_context
+    def _validate_sum(_value, _context):
+        return _value + _context["first"]
+
+    @SubDictValidator({"value": int})
+    def _validate_legacy(_value, **kwargs):
+        return _value
+
+    TEST_CONFIG = {"first": 1, "second": 2}
+    TEST_REQ = {"first": int, "second": _validate_sum}
+
+    assert validate_config(TEST_CONFIG, TEST_REQ)["second"] == 3
+    assert not getattr(_validate_legacy, "uses_context")
+
+
+def test_subclass_convention():
+    """Test subclasses overriding validate use their own convention."""
+
+    class ValidatePort(ValidateIntRange):
+        """Custom validator, using keyword arguments."""
+
+        def validate(self, _value, **kwargs):
+            """Perform validation."""
+            return super().validate(_value, **kwargs) + kwargs["base"]
+
+    class ValidateOffset(ValidateIntRange):
+        """Custom validator, keeping the convention."""
+
+    TEST_CONFIG = {"base": 8000, "port": 80, "offset": 1}
+    TEST_REQ = {
+        "base": int,
+        "port": ValidatePort(0, 1000),
+        "offset": ValidateOffset(0, 10),
+    }
+
+    assert not ValidatePort(0, 1).uses_context
+    assert ValidateOffset(0, 1).uses_context
+    assert validate_config(TEST_CONFIG, TEST_REQ)["port"] == 8080
@@ -2,7 +2,14 @@
 
 import pytest
 
-from dictator.validators.base import validate_null
+from dictator.validators import Validator
+from dictator.validators.base import (
+    validate_integer,
+    validate_integer_pre,
+    validate_null,
+)
+from dictator.validators.integer import ValidateIntRange
+from dictator.validators.lists import SubListValidator
 from dictator.config import validate_config
 from dictator.errors import ConfigurationError, ValidationError
 
@@ -108,3 +115,40 @@ def test_validate_null():
 
     with pytest.raises(ConfigurationError):
         validate_config(TEST_CONFIG_ERR, TEST_CONFIG_REQ)
+
+
+def test_validator_decorators():
+    """Test validators used as decorators."""
+
+    @validate_integer_pre
+    def double(_value, **kwargs):
+        return _value * 2
+
+    @validate_integer
+    def parse(_value, **kwargs):
+        return _value.strip()
+
+    class ValidateDouble(Validator):
+        @validate_integer_pre
+        def validate(self, _value, **kwargs):
+            return _value * 2
+
+    TEST_CONFIG = {"a": "0x10", "b": " 0b11 ", "c": "0x2"}
+    TEST_CONFIG_REQ = {"a": double, "b": parse, "c": ValidateDouble()}
+
+    validated = validate_config(TEST_CONFIG, TEST_CONFIG_REQ)
+    assert validated == {"a": 32, "b": 3, "c": 4}
+    assert double.__name__ == "double"
+
+    with pytest.raises(ValidationError):
+        double("z")
+
+
+def test_validator_slots():
+    """Test that built-in validators have no instance dictionary."""
+    for validator in (
+        validate_integer,
+        ValidateIntRange(0, 10),
+        SubListValidator({"a": int}),
+    ):
+        assert not hasattr(validator, "__dict__")
@@ -2,8 +2,13 @@
 
 import pytest
 from dictator.config import validate_config
-from dictator.errors import ConfigurationError
-from dictator.validators.dependency import KeyDependency, KeyDependencyMap
+from dictator.errors import ConfigurationError, CircularDependencyError
+from dictator.validators.dependency import (
+    KeyDependency,
+    KeyDependencyMap,
+    DeferValidation,
+)
+from dictator.validators.replace import AutoFragmentReplace
 
 
 def test_dependency():
@@ -74,3 +79,53 @@ def test_dependency_decl_error():
         @KeyDependencyMap(someKey=("a", 42))
         def _validate_decl_err_2(_value, **kwargs):
             return _value
+
+
+def test_dependency_chain():
+    """Test chained dependencies declared out of order."""
+    TEST_CONFIG = {
+        "third": "${second}_3",
+        "second": "${first}_2",
+        "first": "1",
+    }
+    TEST_CONFIG_REQ = {
+        "first": str,
+        "second": AutoFragmentReplace(),
+        "third": AutoFragmentReplace(),
+    }
+
+    result = validate_config(TEST_CONFIG, TEST_CONFIG_REQ)
+    assert result["third"] == "1_2_3"
+
+
+def test_dependency_cycle():
+    """Test circular dependency detection."""
+    TEST_CONFIG = {"myKey": 1, "otherKey": 2}
+    TEST_CONFIG_REQ = {
+        "myKey": KeyDependency("otherKey"),
+        "otherKey": KeyDependency("myKey"),
+    }
+
+    with pytest.raises(CircularDependencyError):
+        validate_config(TEST_CONFIG, TEST_CONFIG_REQ)
+
+
+def test_dynamic_dependency_chain():
+    """Test chained dependencies that are only known while validating."""
+
+    def _depends_on(dep):
+        def _validate(_value, **kwargs):
+            if dep not in kwargs:
+                raise DeferValidation(dep)
+            return _value
+
+        return _validate
+
+    TEST_CONFIG = {"third": 3, "second": 2, "first": 1}
+    TEST_CONFIG_REQ = {
+        "first": int,
+        "second": _depends_on("first"),
+        "third": _depends_on("second"),
+    }
+
+    validate_config(TEST_CONFIG, TEST_CONFIG_REQ)
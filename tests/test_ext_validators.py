@@ -1,15 +1,19 @@
 """Test extended default validators."""
 
+import array
+import enum
 import pytest
 
 from dictator.validators.integer import (
     validate_positive_integer,
     validate_percent_integer,
+    ValidateInteger,
     ValidateIntRange,
 )
 from dictator.validators.lists import ValidateChoice, HomogeneousValidator
+from dictator.validators.base import parse_integer, parse_integers
 from dictator.config import validate_config
-from dictator.errors import ConfigurationError
+from dictator.errors import ConfigurationError, ValidationError
 
 
 def test_validate_pos_int():
@@ -37,6 +41,56 @@ def test_validate_choice():
         validate_config(TEST_CONFIG_ERR, TEST_CONFIG_REQ)
 
 
+def test_validate_choice_modes():
+    """Validate choices with string matching modes."""
+    TEST_CONFIG_OPT = {
+        "exact": ValidateChoice("bla", [1, 2], 3),
+        "case": ValidateChoice("Fast", "Slow", case_sensitive=False),
+        "prefix": ValidateChoice("fast", "faster", "slow", prefix=True),
+    }
+    TEST_CONFIG = {"exact": [1, 2], "case": "FAST", "prefix": "sl"}
+
+    result = validate_config(TEST_CONFIG, None, TEST_CONFIG_OPT)
+    assert result == {"exact": [1, 2], "case": "Fast", "prefix": "slow"}
+    assert validate_config({"prefix": "fast"}, None, TEST_CONFIG_OPT) == {
+        "prefix": "fast"
+    }
+
+    for key, value in (
+        ("exact", "BLA"),
+        ("exact", [3]),
+        ("case", "fas"),
+        ("prefix", "fa"),
+        ("prefix", "Slow"),
+    ):
+        with pytest.raises(ConfigurationError):
+            validate_config({key: value}, None, TEST_CONFIG_OPT)
+
+
+def test_validate_choice_enum():
+    """Validate choices from an enumeration."""
+
+    class Mode(enum.Enum):
+        FAST = "fast"
+        SLOW = 2
+
+    TEST_CONFIG_OPT = {
+        "mode": ValidateChoice(Mode),
+        "other": ValidateChoice(Mode, case_sensitive=False),
+    }
+    TEST_CONFIG = {"mode": "fast", "other": "slow"}
+
+    result = validate_config(TEST_CONFIG, None, TEST_CONFIG_OPT)
+    assert result == {"mode": Mode.FAST, "other": Mode.SLOW}
+    for value in (2, "SLOW", Mode.SLOW):
+        assert validate_config({"mode": value}, None, TEST_CONFIG_OPT) == {
+            "mode": Mode.SLOW
+        }
+
+    with pytest.raises(ConfigurationError):
+        validate_config({"mode": "medium"}, None, TEST_CONFIG_OPT)
+
+
 def test_validate_intrange():
     """Validate integer within a range."""
     TEST_CONFIG = {"myList": 42}
@@ -61,6 +115,48 @@ def test_validate_intpercent():
         validate_config(TEST_CONFIG_ERR, TEST_CONFIG_REQ)
 
 
+def test_parse_integer():
+    """Parse integer strings."""
+    assert parse_integer("0x10") == 16
+    assert parse_integer("0b10") == 2
+    assert parse_integer("10") == 2
+    assert parse_integer("12") == 18
+    assert parse_integer("0b12") == 0xB12
+    assert parse_integer("10", bare="decimal") == 10
+    assert parse_integer("10", bare="hex") == 16
+    assert parse_integer("0x10", bare="decimal") == 16
+    assert parse_integer("1_000", bare="decimal", underscores=True) == 1000
+    assert parse_integers([1, "0x10", "11"]) == [1, 16, 3]
+
+    for value in ("", "0x", "-1", " 1", "0X10", "1_0", "1g", "٣"):
+        with pytest.raises(ValidationError):
+            parse_integer(value)
+    with pytest.raises(ValidationError) as excinfo:
+        parse_integer("ff", bare="decimal")
+    # parsing errors are not chained
+    assert excinfo.value.__suppress_context__
+    with pytest.raises(ValidationError):
+        parse_integers([1, True])
+    with pytest.raises(ValueError):
+        parse_integer("10", bare="octal")
+
+
+def test_validate_integer_policy():
+    """Validate integers with a bare string policy."""
+    TEST_CONFIG = {"myValue": "1_000", "myList": ["10", "0x10", 10]}
+    TEST_CONFIG_REQ = {
+        "myValue": ValidateInteger(bare="decimal", underscores=True),
+        "myList": HomogeneousValidator(ValidateInteger(bare="decimal")),
+    }
+
+    validated = validate_config(TEST_CONFIG, TEST_CONFIG_REQ)
+    assert validated == {"myValue": 1000, "myList": [10, 16, 10]}
+
+    TEST_CONFIG_REQ["myValue"] = ValidateInteger(bare="decimal")
+    with pytest.raises(ConfigurationError):
+        validate_config(TEST_CONFIG, TEST_CONFIG_REQ)
+
+
 def test_validate_homogeneous():
     """Validate homogeneous list."""
     TEST_CONFIG = {"myList": [1, 2, 3, 4]}
@@ -71,3 +167,72 @@ def test_validate_homogeneous():
 
     with pytest.raises(ConfigurationError):
         validate_config(TEST_CONFIG_ERR, TEST_CONFIG_REQ)
+
+
+def test_validate_homogeneous_bulk():
+    """Validate homogeneous lists in bulk."""
+    TEST_CONFIG = {"myList": [1, 2, "0x10", 4]}
+    TEST_CONFIG_ERR = {"myList": [0, 50, 101]}
+    TEST_CONFIG_REQ = {"myList": HomogeneousValidator(int)}
+    TEST_CONFIG_RANGE = {
+        "myList": HomogeneousValidator(ValidateIntRange(0, 100))
+    }
+    TEST_CONFIG_PERCENT = {
+        "myList": HomogeneousValidator(validate_percent_integer)
+    }
+
+    # elements that are not ints are still converted
+    validated = validate_config(TEST_CONFIG, TEST_CONFIG_REQ)
+    assert validated["myList"] == [1, 2, 16, 4]
+    validated = validate_config({"myList": []}, TEST_CONFIG_RANGE)
+    assert validated["myList"] == []
+    validated = validate_config({"myList": (0, 100)}, TEST_CONFIG_PERCENT)
+    assert validated["myList"] == [0, 100]
+
+    with pytest.raises(ConfigurationError, match=r"out of \[0, 100\]"):
+        validate_config(TEST_CONFIG_ERR, TEST_CONFIG_RANGE)
+    with pytest.raises(ConfigurationError):
+        validate_config(TEST_CONFIG_ERR, TEST_CONFIG_PERCENT)
+    with pytest.raises(ConfigurationError):
+        validate_config(
+            {"myList": [1.0, 2]}, {"myList": HomogeneousValidator(float)}
+        )
+    with pytest.raises(ConfigurationError):
+        validate_config(
+            {"myList": "abc"}, {"myList": HomogeneousValidator(str)}
+        )
+
+
+def test_validate_homogeneous_container():
+    """Validate homogeneous lists into arrays."""
+    TEST_CONFIG = {"myList": [1, 2, 3]}
+    TEST_CONFIG_REQ = {"myList": HomogeneousValidator(int, container="array")}
+
+    validated = validate_config(TEST_CONFIG, TEST_CONFIG_REQ)
+    assert validated["myList"] == array.array("q", [1, 2, 3])
+    validated = validate_config({"myList": ["0x10"]}, TEST_CONFIG_REQ)
+    assert validated["myList"] == array.array("q", [16])
+
+    with pytest.raises(ConfigurationError):
+        validate_config({"myList": [2**64]}, TEST_CONFIG_REQ)
+    with pytest.raises(ValueError):
+        HomogeneousValidator(str, container="array")
+    with pytest.raises(ValueError):
+        HomogeneousValidator(int, container="tuple")
+
+
+def test_validate_homogeneous_numpy():
+    """Validate homogeneous lists into NumPy arrays."""
+    numpy = pytest.importorskip("numpy")
+    TEST_CONFIG_REQ = {
+        "myList": HomogeneousValidator(
+            ValidateIntRange(0, 10), container="numpy"
+        )
+    }
+
+    validated = validate_config({"myList": [1, 2, 3]}, TEST_CONFIG_REQ)
+    assert isinstance(validated["myList"], numpy.ndarray)
+    assert validated["myList"].tolist() == [1, 2, 3]
+
+    with pytest.raises(ConfigurationError):
+        validate_config({"myList": [1, 20]}, TEST_CONFIG_REQ)
@@ -7,6 +7,7 @@ from dictator.validators.replace import (
     FragmentError,
 )
 from dictator.validators.lists import SubListValidator
+from dictator.validators.maps import SubDictValidator
 from dictator.config import validate_config
 
 
@@ -98,6 +99,36 @@ def test_fragment_key():
     return validate_config(TEST_CONFIG_2, TEST_REQ)
 
 
+def test_fragment_template():
+    """Test templates with several references."""
+    TEST_CONFIG = {
+        "number": 4,
+        "name": "top",
+        "sub": {
+            "name": "x",
+            "number": 2,
+            "first": "${name}-${..name}-${:name}",
+            "second": "${..number}${number}",
+        },
+    }
+    TEST_REQ = {
+        "number": int,
+        "name": str,
+        "sub": SubDictValidator(
+            {
+                "name": str,
+                "number": int,
+                "first": AutoFragmentReplace(),
+                "second": AutoFragmentReplace(),
+            }
+        ),
+    }
+
+    result = validate_config(TEST_CONFIG, TEST_REQ)["sub"]
+    assert result["first"] == "x-top-top"
+    assert result["second"] == 42
+
+
 if __name__ == "__main__":
     print(test_fragment_replace())
     print(test_auto_fragment_replace())
@@ -105,3 +136,4 @@ if __name__ == "__main__":
     print(test_fragment_replace_fail())
     print(test_toplevel_fragment_replace())
     print(test_fragment_key())
+    print(test_fragment_template())
@@ -0,0 +1,156 @@
+"""Test JSON Schema conversion."""
+
+import pytest
+from dictator.config import validate_config
+from dictator.errors import (
+    ConfigurationError,
+    KeyDeclarationError,
+    MissingRequiredKeyError,
+    UnknownKeyError,
+)
+from dictator.jsonschema import (
+    compile_json_schema,
+    convert_json_schema,
+    from_json_schema,
+)
+
+TEST_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "description": "device name"},
+        "model": {"enum": ["a100", "b200"]},
+        "port": {"type": "integer", "minimum": 1, "maximum": 65535},
+        "gain": {"type": "number", "minimum": 0.5},
+        "label": {"type": ["string", "null"]},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "channels": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"id": {"type": "integer"}},
+                "required": ["id"],
+                "additionalProperties": False,
+            },
+        },
+        "extra": {
+            "type": "object",
+            "properties": {"enabled": {"type": "boolean"}},
+        },
+    },
+    "required": ["name", "port"],
+    "additionalProperties": False,
+}
+
+
+def test_json_schema():
+    """Test validation with a converted JSON Schema."""
+    TEST_CONFIG = {
+        "name": "dev",
+        "model": "a100",
+        "port": 80,
+        "gain": 1,
+        "label": None,
+        "tags": ["x", "y"],
+        "channels": [{"id": 0}, {"id": 1}],
+        "extra": {"enabled": True, "other": 1},
+    }
+    required_keys, optional_keys, options = from_json_schema(TEST_SCHEMA)
+    assert (
+        validate_config(TEST_CONFIG, required_keys, optional_keys, **options)
+        == TEST_CONFIG
+    )
+    assert compile_json_schema(TEST_SCHEMA).validate(TEST_CONFIG) == TEST_CONFIG
+
+
+@pytest.mark.parametrize(
+    "key, value",
+    [
+        ("port", 0),
+        ("port", True),
+        ("port", "0x10"),
+        ("gain", 0.1),
+        ("model", "c300"),
+        ("label", 1),
+        ("tags", "xy"),
+        ("tags", [1]),
+        ("channels", [{"id": 0, "other": 1}]),
+        ("channels", [1]),
+        ("extra", {"enabled": 1}),
+    ],
+)
+def test_json_schema_invalid(key, value):
+    """Test invalid values."""
+    TEST_CONFIG = {"name": "dev", "port": 80, key: value}
+    schema = compile_json_schema(TEST_SCHEMA)
+
+    with pytest.raises(ConfigurationError):
+        schema.validate(TEST_CONFIG)
+
+
+def test_json_schema_keyword_types():
+    """Test keywords constraining values of some types only."""
+    validator = convert_json_schema(
+        {"type": ["string", "integer"], "minimum": 0}
+    )
+    assert validator.validate("abc") == "abc"
+    assert validator.validate(3) == 3
+    with pytest.raises(ConfigurationError):
+        validator.validate(-1)
+
+    validator = convert_json_schema({"minimum": 0, "maximum": 1})
+    for value in ("abc", None, True, [5]):
+        assert validator.validate(value) == value
+    with pytest.raises(ConfigurationError):
+        validator.validate(1.5)
+
+    validator = convert_json_schema({"enum": [1, 2.5, [0], {"a": False}]})
+    for value in (1, 1.0, 2.5, [0], {"a": False}):
+        assert validator.validate(value) == value
+    for value in (True, [False], {"a": 0}, "1"):
+        with pytest.raises(ConfigurationError):
+            validator.validate(value)
+
+    validator = convert_json_schema(
+        {"type": ["object", "null"], "properties": {"a": {"type": "string"}}}
+    )
+    assert validator.validate(None) is None
+    assert validator.validate({"a": "x"}) == {"a": "x"}
+    with pytest.raises(ConfigurationError):
+        validator.validate({"a": 1})
+
+    validator = convert_json_schema(
+        {"type": ["array", "null"], "items": {"type": "integer"}}
+    )
+    assert validator.validate(None) is None
+    assert validator.validate([1, 2.0]) == [1, 2.0]
+    with pytest.raises(ConfigurationError):
+        validator.validate([1.5])
+
+    validator = convert_json_schema(
+        {"properties": {"a": {"type": "string"}}, "items": {"minimum": 0}}
+    )
+    for value in ("abc", 1, None, ["x", 2]):
+        assert validator.validate(value) == value
+    with pytest.raises(ConfigurationError):
+        validator.validate([-1])
+
+
+def test_json_schema_keys():
+    """Test required and additional properties."""
+    schema = compile_json_schema(TEST_SCHEMA)
+
+    with pytest.raises(MissingRequiredKeyError):
+        schema.validate({"name": "dev"})
+
+    with pytest.raises(UnknownKeyError):
+        schema.validate({"name": "dev", "port": 1, "unknown": 1})
+
+
+def test_json_schema_unsupported():
+    """Test unsupported schemas."""
+    with pytest.raises(KeyDeclarationError):
+        from_json_schema({"type": "array"})
+
+    with pytest.raises(KeyDeclarationError):
+        from_json_schema({"properties": {"x": {"pattern": "^a"}}})
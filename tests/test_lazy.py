@@ -0,0 +1,109 @@
+"""Test lazily validated configurations."""
+
+import pytest
+from dictator.config import validate_config
+from dictator.errors import (
+    CircularDependencyError,
+    MissingDependencyError,
+    MissingRequiredKeyError,
+    UnknownKeyError,
+    ValidationError,
+)
+from dictator.lazy import LazyConfig
+from dictator.validators.dependency import DeferValidation, KeyDependency
+from dictator.validators.maps import SubDictValidator
+
+
+def test_lazy_validate():
+    """Test validating keys on first access."""
+    validated = []
+
+    def record(_value, **kwargs):
+        validated.append(_value)
+        return _value * 2
+
+    TEST_CONFIG = {"a": 1, "b": 2, "c": "x", "extra": None}
+    TEST_CONFIG_REQ = {"a": record, "b": record}
+    TEST_CONFIG_OPT = {"c": None, "d": int}
+
+    config = validate_config(
+        TEST_CONFIG, TEST_CONFIG_REQ, TEST_CONFIG_OPT, lazy=True
+    )
+    assert isinstance(config, LazyConfig)
+    assert validated == []
+    assert list(config) == ["c", "a", "b"]
+    assert "a" in config and "extra" not in config
+    assert validated == []
+
+    assert config["b"] == 4
+    assert config["b"] == 4
+    assert validated == [2]
+    assert config.pending == ("a",)
+    assert config.get("d") is None
+
+    assert config.validate_all() == {"c": "x", "a": 2, "b": 4}
+    assert validated == [2, 1]
+    assert config.pending == ()
+
+    # required and unknown keys are checked right away
+    with pytest.raises(MissingRequiredKeyError):
+        validate_config({"a": 1}, TEST_CONFIG_REQ, lazy=True)
+    with pytest.raises(UnknownKeyError):
+        validate_config(
+            TEST_CONFIG, TEST_CONFIG_REQ, allow_unknown=False, lazy=True
+        )
+
+
+def test_lazy_dependencies():
+    """Test validating dependencies first."""
+
+    @KeyDependency("port")
+    def address(_value, **kwargs):
+        return f"{_value}:{kwargs['port']}"
+
+    def host(_value, **kwargs):
+        if "address" not in kwargs:
+            raise DeferValidation("address")
+        return kwargs["address"]
+
+    TEST_CONFIG = {"host": None, "address": "localhost", "port": "0x10"}
+    TEST_CONFIG_REQ = {"host": host, "address": address, "port": int}
+
+    config = validate_config(TEST_CONFIG, TEST_CONFIG_REQ, lazy=True)
+    assert config["host"] == "localhost:16"
+    assert config.pending == ()
+
+    config = validate_config(
+        {"a": 1, "b": 1},
+        {"a": KeyDependency("b"), "b": KeyDependency("a")},
+        lazy=True,
+    )
+    with pytest.raises(CircularDependencyError):
+        config["a"]
+
+    config = validate_config({"host": 1}, {"host": host}, lazy=True)
+    with pytest.raises(MissingDependencyError):
+        config.validate_all()
+
+
+def test_lazy_errors():
+    """Test errors when accessing keys."""
+    TEST_CONFIG = {"port": "x", "server": {"port": "y"}}
+    TEST_CONFIG_REQ = {
+        "port": int,
+        "server": SubDictValidator({"port": int}),
+    }
+
+    config = validate_config(TEST_CONFIG, TEST_CONFIG_REQ, lazy=True)
+    with pytest.raises(ValidationError) as excinfo:
+        config["server"]
+    assert excinfo.value.path == ("server", "port")
+
+    # failed keys are validated again
+    with pytest.raises(ValidationError):
+        config["server"]
+    with pytest.raises(KeyError):
+        config["missing"]
+
+    with pytest.raises(ValueError):
+        validate_config(TEST_CONFIG, TEST_CONFIG_REQ, lazy=True, cache=True)
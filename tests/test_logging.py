@@ -0,0 +1,92 @@
+"""Test logging."""
+
+import logging
+from dictator.config import validate_config
+from dictator.validators.lists import SubListValidator
+from dictator.validators.maps import SubDictValidator
+
+
+def test_unknown_key_logging(caplog):
+    """Test unknown key warnings."""
+    TEST_CONFIG = {"a": 1, "b": 2, "c": 3}
+    TEST_REQ = {"a": int}
+
+    caplog.set_level(logging.WARNING, logger="dictator")
+    validate_config(TEST_CONFIG, TEST_REQ)
+    assert not caplog.records
+
+    validate_config(TEST_CONFIG, TEST_REQ, verbosity="warning")
+    assert [record.getMessage() for record in caplog.records] == [
+        "unknown key: 'b'",
+        "unknown key: 'c'",
+    ]
+    assert caplog.records[0].levelno == logging.WARNING
+    assert caplog.records[0].name == "dictator"
+
+    # filtered by logging configuration
+    caplog.clear()
+    caplog.set_level(logging.ERROR, logger="dictator")
+    validate_config(TEST_CONFIG, TEST_REQ, verbosity="warning")
+    assert not caplog.records
+
+
+def test_unknown_key_summary(caplog):
+    """Test aggregated unknown key warnings."""
+    TEST_CONFIG = {"a": 1, "sub": {f"key{idx}": idx for idx in range(12)}}
+    TEST_REQ = {"sub": SubDictValidator({"key0": int})}
+
+    caplog.set_level(logging.WARNING, logger="dictator")
+    validate_config(
+        TEST_CONFIG, TEST_REQ, verbosity="warning", summarize_unknown=True
+    )
+    assert [record.getMessage() for record in caplog.records] == [
+        "unknown keys (12): 'a', 'sub.key1', 'sub.key2', 'sub.key3', "
+        "'sub.key4', 'sub.key5', 'sub.key6', 'sub.key7', 'sub.key8', "
+        "'sub.key9' and 2 more",
+    ]
+
+    # a single summary for all levels
+    caplog.clear()
+    TEST_CONFIG = {
+        "sub": {"x": {"y": 1}},
+        "items": [{"id": idx, "q": 1} for idx in range(1000)],
+    }
+    TEST_REQ = {
+        "items": SubListValidator({"id": int}),
+        "sub": SubDictValidator({}, {"x": SubDictValidator()}),
+    }
+    validate_config(
+        TEST_CONFIG, TEST_REQ, verbosity="warning", summarize_unknown=True
+    )
+    assert [record.getMessage() for record in caplog.records] == [
+        "unknown keys (1001): 'sub.x.y', 'items[0].q', 'items[1].q', "
+        "'items[2].q', 'items[3].q', 'items[4].q', 'items[5].q', "
+        "'items[6].q', 'items[7].q', 'items[8].q' and 991 more",
+    ]
+
+
+def test_log_sinks(caplog):
+    """Test custom logging functions and loggers."""
+    TEST_CONFIG = {"a": 1, "sub": {"b": 2}}
+    TEST_REQ = {"sub": SubDictValidator()}
+
+    messages = []
+    validate_config(
+        TEST_CONFIG,
+        TEST_REQ,
+        log_fn=lambda msg, severity, verbosity: messages.append(
+            (msg, severity, verbosity)
+        ),
+    )
+    assert messages == [
+        ("unknown key: 'a'", "warning", "error"),
+        ("unknown key: 'b'", "warning", "error"),
+    ]
+
+    logger = logging.getLogger("test_log_sinks")
+    caplog.set_level(logging.WARNING, logger="test_log_sinks")
+    validate_config(TEST_CONFIG, TEST_REQ, log_fn=logger, verbosity="warning")
+    assert [record.name for record in caplog.records] == [
+        "test_log_sinks",
+        "test_log_sinks",
+    ]
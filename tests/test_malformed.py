@@ -1,8 +1,11 @@
 """Test malformed configurations."""
 
 import pytest
-from dictator.config import validate_config
-from dictator.errors import KeyDeclarationError
+import dictator.config
+from dictator.codegen import generate_validator
+from dictator.config import _check_declaration, validate_config
+from dictator.errors import KeyDeclarationError, MissingRequiredKeyError
+from dictator.schema import compile_schema
 
 
 def test_invalid_key():
@@ -44,3 +47,58 @@ def test_invalid_config():
 
     with pytest.raises(TypeError):
         validate_config(TEST_CONFIG_1, TEST_REQ, TEST_OPT_1)
+
+
+def test_missing_keys():
+    """Test reporting all missing required keys."""
+    TEST_CONFIG = {"b": 1, "extra": 2}
+    TEST_REQ = {"c": int, "a": int, "b": int}
+    TEST_OPT = {"d": int}
+
+    with pytest.raises(MissingRequiredKeyError) as excinfo:
+        validate_config(TEST_CONFIG, TEST_REQ, TEST_OPT)
+    assert excinfo.value.keys == ("c", "a")
+    assert str(excinfo.value) == (
+        "invalid configuration, missing required keys 'c', 'a'"
+    )
+
+    schema = compile_schema(TEST_REQ, TEST_OPT)
+    for validate_fn in (schema.validate, generate_validator(schema)):
+        with pytest.raises(MissingRequiredKeyError) as excinfo:
+            validate_fn({"a": 1})
+        assert excinfo.value.keys == ("c", "b")
+
+    with pytest.raises(MissingRequiredKeyError, match="key 'a'$"):
+        validate_config({"b": 1, "c": 1}, TEST_REQ)
+
+
+def test_declaration_checks(monkeypatch):
+    """Test checking declarations once until they are modified."""
+    checked = []
+
+    def check_declaration(keys, name):
+        checked.append(name)
+        _check_declaration(keys, name)
+
+    monkeypatch.setattr(
+        dictator.config, "_check_declaration", check_declaration
+    )
+    TEST_REQ = {"a": int}
+    TEST_OPT = {"b": int}
+
+    for _ in range(3):
+        assert validate_config({"a": 1, "b": "0x2"}, TEST_REQ, TEST_OPT) == {
+            "a": 1,
+            "b": 2,
+        }
+    assert checked == ["required_keys", "optional_keys"]
+
+    # modified declarations are checked again
+    TEST_OPT["b"] = None
+    assert validate_config({"a": 1, "b": "0x2"}, TEST_REQ, TEST_OPT) == {
+        "a": 1,
+        "b": "0x2",
+    }
+    TEST_OPT[1] = int
+    with pytest.raises(KeyDeclarationError):
+        validate_config({"a": 1}, TEST_REQ, TEST_OPT)
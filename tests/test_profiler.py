@@ -0,0 +1,78 @@
+"""Test validation profiling."""
+
+import io
+import pytest
+from dictator.config import validate_config
+from dictator.errors import ValidationError
+from dictator.profiler import ValidationProfiler
+from dictator.schema import compile_schema
+from dictator.validators.dependency import DeferValidation
+from dictator.validators.lists import SubListValidator
+from dictator.validators.maps import SubDictValidator
+
+
+def test_profiler():
+    """Test profiling nested keys."""
+    TEST_CONFIG = {
+        "name": "dev",
+        "sub": {"port": 80, "entries": [{"id": 0}, {"id": 1}, {"id": 2}]},
+    }
+    TEST_REQ = {
+        "name": str,
+        "sub": SubDictValidator(
+            {"port": int, "entries": SubListValidator({"id": int})}
+        ),
+    }
+
+    profiler = ValidationProfiler()
+    validate_config(TEST_CONFIG, TEST_REQ, profiler=profiler)
+    stats = profiler.stats
+    assert set(stats) == {
+        ("name",),
+        ("sub",),
+        ("sub", "port"),
+        ("sub", "entries"),
+        ("sub", "entries", "id"),
+    }
+    assert stats[("sub",)].validator == "SubDictValidator"
+    assert stats[("sub", "entries", "id")].calls == 3
+    assert stats[("sub",)].cumulative >= stats[("sub", "entries")].cumulative
+    assert stats[("sub",)].self_time <= stats[("sub",)].cumulative
+
+    report = profiler.report(sort_by="calls").splitlines()
+    assert report[1].startswith("sub.entries.id ")
+
+    collapsed = io.StringIO()
+    profiler.dump_collapsed(collapsed)
+    for line in collapsed.getvalue().splitlines():
+        stack, samples = line.rsplit(" ", 1)
+        assert tuple(stack.split(";")) in stats
+        assert int(samples) > 0
+
+    with pytest.raises(ValueError):
+        profiler.report(sort_by="name")
+
+
+def test_profiler_retries():
+    """Test counting deferrals and errors."""
+
+    def _validate_after_a(_value, **kwargs):
+        if "a" not in kwargs:
+            raise DeferValidation("a")
+        return _value
+
+    def _fail(_value, **kwargs):
+        raise ValidationError("invalid")
+
+    profiler = ValidationProfiler()
+    schema = compile_schema({"b": _validate_after_a, "a": int})
+    schema.validate({"b": 1, "a": 2}, profiler=profiler)
+    assert profiler.stats[("b",)].deferrals == 1
+    assert profiler.stats[("b",)].calls == 2
+
+    with pytest.raises(ValidationError):
+        validate_config({"c": 1}, {"c": _fail}, profiler=profiler)
+    assert profiler.stats[("c",)].errors == 1
+
+    profiler.reset()
+    assert not profiler.stats
@@ -0,0 +1,138 @@
+"""Test compiled schemas."""
+
+import pytest
+from dictator.schema import compile_schema, validate_many
+from dictator.config import validate_config
+from dictator.errors import (
+    ConfigurationError,
+    KeyDeclarationError,
+    MissingRequiredKeyError,
+    UnknownKeyError,
+)
+from dictator.validators.integer import validate_positive_integer
+from dictator.validators.dependency import KeyDependency
+from dictator.validators.maps import SubDictValidator
+from dictator.validators.replace import AutoFragmentReplace
+
+
+def test_compiled_validate():
+    """Test validation through a compiled schema."""
+    TEST_CONFIG = {"myValue": "0x10", "myUnion": "bla", "extra": 1}
+    TEST_CONFIG_ERR = {"myValue": -1, "myUnion": "bla"}
+    TEST_REQ = {"myValue": validate_positive_integer, "myUnion": [int, str]}
+    TEST_OPT = {"other": None}
+
+    schema = compile_schema(TEST_REQ, TEST_OPT)
+    assert schema.validate(TEST_CONFIG) == validate_config(
+        TEST_CONFIG, TEST_REQ, TEST_OPT
+    )
+    assert schema.validate(TEST_CONFIG)["myValue"] == 16
+
+    with pytest.raises(ConfigurationError):
+        schema.validate(TEST_CONFIG_ERR)
+
+    with pytest.raises(MissingRequiredKeyError):
+        schema.validate({"myValue": 1})
+
+
+def test_compiled_options():
+    """Test schema options and per-call overrides."""
+    TEST_CONFIG = {"myKey": "someValue", "myDependency": 42, "extra": 1}
+    TEST_REQ = {"myKey": KeyDependency("myDependency")}
+    TEST_OPT = {"myDependency": int}
+
+    schema = compile_schema(TEST_REQ, TEST_OPT, allow_unknown=False)
+    with pytest.raises(UnknownKeyError):
+        schema.validate(TEST_CONFIG)
+
+    assert schema.validate(
+        TEST_CONFIG, allow_unknown=True, gobble_unknown=False
+    ) == TEST_CONFIG
+
+
+def test_compiled_declaration():
+    """Test declaration errors are raised at compile time."""
+    with pytest.raises(KeyDeclarationError):
+        compile_schema({0: str})
+
+    with pytest.raises(TypeError):
+        compile_schema([])
+
+    schema = compile_schema({"myKey": int})
+    with pytest.raises(AttributeError):
+        schema._required = {}
+
+
+def test_validate_many():
+    """Test batch validation."""
+    TEST_CONFIGS = [{"myValue": 1}, {"myValue": -1}, {"other": 1}, [1]]
+    TEST_REQ = {"myValue": validate_positive_integer}
+
+    with pytest.raises(ConfigurationError):
+        validate_many(TEST_CONFIGS, TEST_REQ)
+
+    results = validate_many(TEST_CONFIGS, TEST_REQ, collect_errors=True)
+    assert results[0] == {"myValue": 1}
+    assert isinstance(results[1], ConfigurationError)
+    assert isinstance(results[2], MissingRequiredKeyError)
+    assert isinstance(results[3], TypeError)
+
+    schema = compile_schema(TEST_REQ)
+    assert validate_many(TEST_CONFIGS[:1] * 3, schema, extra=1) == [
+        {"myValue": 1, "extra": 1}
+    ] * 3
+
+
+def test_revalidate():
+    """Test incremental validation of modified configurations."""
+    calls = []
+
+    def _count(_value, **kwargs):
+        calls.append(_value)
+        return _value
+
+    TEST_REQ = {
+        "name": str,
+        "port": _count,
+        "url": AutoFragmentReplace(),
+        "check": KeyDependency("port"),
+        "sub": SubDictValidator({"label": AutoFragmentReplace()}),
+        "other": _count,
+    }
+    OLD_CONFIG = {
+        "name": "dev",
+        "port": 80,
+        "url": "http://${name}:${port}",
+        "check": True,
+        "sub": {"label": "${..name}"},
+        "other": "x",
+    }
+    schema = compile_schema(TEST_REQ, {"extra": _count})
+    previous = schema.validate(OLD_CONFIG)
+    calls.clear()
+
+    NEW_CONFIG = dict(OLD_CONFIG, name="prod")
+    result = schema.revalidate(previous, OLD_CONFIG, NEW_CONFIG)
+    assert not calls
+    assert result == schema.validate(NEW_CONFIG)
+    assert list(result) == list(NEW_CONFIG)
+    assert result["url"] == "http://prod:80"
+    assert result["sub"] == {"label": "prod"}
+
+    # only changed and dependent keys are validated again
+    calls.clear()
+    NEW_CONFIG = dict(OLD_CONFIG, port=81, extra=1)
+    result = schema.revalidate(previous, OLD_CONFIG, NEW_CONFIG)
+    assert result["url"] == "http://dev:81"
+    assert result["extra"] == 1
+    assert calls == [81, 1]
+
+    # removed keys
+    NEW_CONFIG = dict(OLD_CONFIG)
+    del NEW_CONFIG["port"]
+    with pytest.raises(MissingRequiredKeyError):
+        schema.revalidate(previous, OLD_CONFIG, NEW_CONFIG)
+
+    # errors in changed keys
+    with pytest.raises(ConfigurationError):
+        schema.revalidate(previous, OLD_CONFIG, dict(OLD_CONFIG, name=1))
@@ -0,0 +1,146 @@
+"""Test incremental JSON loading."""
+
+import io
+import json
+
+import pytest
+from dictator.stream import (
+    iter_events,
+    iter_items,
+    load,
+    load_config,
+    JSONStreamError,
+)
+from dictator.validators.maps import SubDictValidator
+from dictator.validators.lists import SubListValidator
+from dictator.validators.integer import validate_positive_integer
+from dictator.validators.dependency import DeferValidation, KeyDependency
+from dictator.validators.replace import AutoFragmentReplace
+from dictator.config import validate_config
+from dictator.errors import ValidationError
+
+TEST_DOCUMENT = json.dumps(
+    {
+        "name": "café \"quoted\"",
+        "values": [1, -2.5, 3e2, True, False, None],
+        "nested": {"empty": {}, "list": [[], [{}]]},
+        "entries": [{"value": 1}, {"value": 2}],
+    }
+)
+
+
+def test_load():
+    """Test loading documents split across many reads."""
+    for chunk_size in (1, 3, 64):
+        assert load(io.StringIO(TEST_DOCUMENT), chunk_size) == json.loads(
+            TEST_DOCUMENT
+        )
+        assert load(
+            io.BytesIO(TEST_DOCUMENT.encode()), chunk_size
+        ) == json.loads(TEST_DOCUMENT)
+
+
+def test_events():
+    """Test parser events."""
+    events = list(iter_events(io.StringIO('{"a": [1, "b"]}')))
+    assert events == [
+        ("start_map", None),
+        ("map_key", "a"),
+        ("start_array", None),
+        ("number", 1),
+        ("string", "b"),
+        ("end_array", None),
+        ("end_map", None),
+    ]
+
+
+def test_malformed():
+    """Test malformed documents."""
+    for document in ('{"a" 1}', "[1,]", "[1] 2", "[", '{"a": tru}'):
+        with pytest.raises(JSONStreamError):
+            load(io.StringIO(document), 2)
+    with pytest.raises(JSONStreamError, match="empty"):
+        load(io.StringIO(" "), 2)
+
+    # invalid escapes fail right away, not at the end of the document
+    fp = io.StringIO('["\\q"' + ", 1" * 1000 + "]")
+    with pytest.raises(JSONStreamError, match="escape"):
+        load(fp, 64)
+    assert fp.tell() == 64
+
+
+def test_iter_items():
+    """Test validating array elements as they are parsed."""
+    validator = SubDictValidator({"value": validate_positive_integer})
+    items = iter_items(
+        io.StringIO(TEST_DOCUMENT), ("entries",), validator, chunk_size=4
+    )
+    assert list(items) == [{"value": 1}, {"value": 2}]
+
+    TEST_ARRAY = '[{"value": 1}, {"value": -1}]'
+    items = iter_items(io.StringIO(TEST_ARRAY), (), validator)
+    assert next(items) == {"value": 1}
+    with pytest.raises(ValidationError, match="element 1"):
+        next(items)
+
+
+def test_load_config():
+    """Test loading and validating a configuration."""
+    TEST_REQ = {
+        "name": str,
+        "entries": SubListValidator({"value": validate_positive_integer}),
+    }
+    config = load_config(io.StringIO(TEST_DOCUMENT), TEST_REQ)
+    assert config["entries"] == [{"value": 1}, {"value": 2}]
+
+
+def test_load_config_streaming():
+    """Test validating objects while they are parsed."""
+    positions = []
+
+    def record(_value, **kwargs):
+        positions.append(fp.tell())
+
+    @KeyDependency("port")
+    def address(_value, **kwargs):
+        return f"{_value}:{kwargs['port']}"
+
+    def host(_value, **kwargs):
+        if "address" not in kwargs:
+            raise DeferValidation("address")
+        return kwargs["address"]
+
+    TEST_CONFIG = {
+        "host": None,
+        "address": "localhost",
+        "port": "0x10",
+        "server": {"name": "${..address}", "id": "0x1"},
+        "entries": [{"value": index} for index in range(100)],
+        "unknown": [1, 2],
+    }
+    TEST_REQ = {
+        "host": host,
+        "address": address,
+        "port": int,
+        "server": SubDictValidator(
+            {"name": AutoFragmentReplace(), "id": int}
+        ),
+        "entries": SubListValidator({"value": record}),
+    }
+    document = json.dumps(TEST_CONFIG)
+    for options in ({}, {"gobble_unknown": False}, {"extra": 1}):
+        fp = io.StringIO(document)
+        config = load_config(fp, TEST_REQ, chunk_size=16, **options)
+        assert config == validate_config(TEST_CONFIG, TEST_REQ, **options)
+        assert config["server"] == {"name": "localhost:16", "id": 1}
+        # elements are validated as they are parsed
+        assert positions[0] < len(document) // 2
+        positions.clear()
+
+    fp = io.StringIO(json.dumps({"entries": [{"value": 1}, {"value": -1}]}))
+    TEST_REQ_ERR = {
+        "entries": SubListValidator({"value": validate_positive_integer})
+    }
+    with pytest.raises(ValidationError) as excinfo:
+        load_config(fp, TEST_REQ_ERR)
+    assert excinfo.value.path == ("entries", 1, "value")
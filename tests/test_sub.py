@@ -1,11 +1,20 @@
 """Test sub-configurations."""
 
+import io
+import json
+from collections import OrderedDict
+
 import pytest
+import dictator.validators.lists
 from dictator.config import validate_config
 from dictator.validators.integer import validate_positive_integer
-from dictator.validators.lists import SubListValidator
+from dictator.validators.lists import (
+    SubListValidator,
+    _validate_chunk_in_worker,
+)
 from dictator.validators.maps import SubDictValidator
-from dictator.errors import ConfigurationError
+from dictator.validators.replace import AutoFragmentReplace
+from dictator.errors import ConfigurationError, ValidationError, format_path
 
 
 def test_sub_list():
@@ -32,3 +41,122 @@ def test_sub_dict():
 
     with pytest.raises(ConfigurationError):
         validate_config(TEST_CONFIG_ERR, TEST_CONFIG_REQ)
+
+
+def test_sub_error_path():
+    """Test key path of errors in sub-configurations."""
+
+    class ValueTooLarge(ValidationError):
+        """Custom error."""
+
+    def validate_small(_value, **kwargs):
+        if _value > 10:
+            raise ValueTooLarge("value too large")
+
+    SUB_REQ = {"values": SubListValidator({"value": validate_small})}
+    TEST_CONFIG = {"outer": {"values": [{"value": 1}, {"value": 42}]}}
+    TEST_CONFIG_REQ = {"outer": SubDictValidator(SUB_REQ)}
+
+    with pytest.raises(ValueTooLarge) as excinfo:
+        validate_config(TEST_CONFIG, TEST_CONFIG_REQ)
+
+    assert excinfo.value.path == ("outer", "values", 1, "value")
+    assert excinfo.value.message == "value too large"
+    assert format_path(excinfo.value.path) == "outer.values[1].value"
+    assert str(excinfo.value) == (
+        "while validating key outer: while validating key values: "
+        "while validating element 1: while validating key value: "
+        "value too large"
+    )
+
+
+def test_sub_error_shared():
+    """Test key path of error instances raised more than once."""
+    TOO_LARGE = ValidationError("value too large")
+
+    def validate_small(_value, **kwargs):
+        if _value > 10:
+            raise TOO_LARGE
+
+    TEST_CONFIG = {"outer": {"value": 42}}
+    TEST_CONFIG_REQ = {"outer": SubDictValidator({"value": validate_small})}
+
+    for _ in range(2):
+        with pytest.raises(ValidationError) as excinfo:
+            validate_config(TEST_CONFIG, TEST_CONFIG_REQ)
+        assert excinfo.value.path == ("outer", "value")
+        assert excinfo.value.__traceback__ is not None
+    assert TOO_LARGE.path == ()
+
+
+def test_sub_list_lazy():
+    """Test lazy sub-configuration list validation."""
+    TEST_CONFIG = {"myStuff": [{"value": 42}, {"value": -50}]}
+    SUB_REQ = {"value": validate_positive_integer}
+    TEST_CONFIG_REQ = {"myStuff": SubListValidator(SUB_REQ, lazy=True)}
+
+    elements = validate_config(TEST_CONFIG, TEST_CONFIG_REQ)["myStuff"]
+    assert next(elements) == {"value": 42}
+    with pytest.raises(ValidationError, match="element 1"):
+        next(elements)
+
+
+def test_sub_list_iter():
+    """Test validating elements from an iterator."""
+    SUB_REQ = {"value": validate_positive_integer}
+    validator = SubListValidator(SUB_REQ)
+    lines = io.StringIO('{"value": 1}\n{"value": 2}\n')
+
+    entries = validator.iter_validate(json.loads(line) for line in lines)
+    assert [entry["value"] for entry in entries] == [1, 2]
+
+    with pytest.raises(ValidationError):
+        validator.iter_validate(42)
+
+
+@pytest.mark.parametrize("parallel", ["thread", "process"])
+def test_sub_list_parallel(parallel):
+    """Test parallel sub-configuration list validation."""
+    TEST_CONFIG = {
+        "prefix": "item",
+        "myStuff": [
+            {"value": value, "name": "${..prefix}_" + str(value)}
+            for value in range(100)
+        ],
+    }
+    SUB_REQ = {
+        "value": validate_positive_integer,
+        "name": AutoFragmentReplace(),
+    }
+    TEST_CONFIG_REQ = {
+        "prefix": str,
+        "myStuff": SubListValidator(
+            SUB_REQ, parallel=parallel, max_workers=2, chunk_size=16
+        ),
+    }
+
+    result = validate_config(TEST_CONFIG, TEST_CONFIG_REQ)["myStuff"]
+    assert [entry["name"] for entry in result] == [
+        f"item_{value}" for value in range(100)
+    ]
+
+    TEST_CONFIG["myStuff"][42]["value"] = -1
+    with pytest.raises(ValidationError, match="element 42"):
+        validate_config(TEST_CONFIG, TEST_CONFIG_REQ)
+
+
+def test_sub_list_worker_schemas(monkeypatch):
+    """Test bounding element schemas kept by worker processes."""
+    schemas = OrderedDict()
+    monkeypatch.setattr(dictator.validators.lists, "_WORKER_SCHEMAS", schemas)
+    monkeypatch.setattr(
+        dictator.validators.lists, "WORKER_SCHEMA_CACHE_SIZE", 2
+    )
+
+    for token in (0, 1, 0, 2):
+        result = _validate_chunk_in_worker(
+            token, ({"value": int}, None), 0, [{"value": 1}], None, {}
+        )
+        assert result == [{"value": 1}]
+    # least recently used schema is discarded
+    assert list(schemas) == [0, 2]